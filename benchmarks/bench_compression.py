@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""Benchmark response compression: CPU cost versus bytes saved.
+
+Builds tool results shaped like ``list_tickets`` output (pretty-printed JSON)
+and measures each available encoding for buffered and SSE responses.
+
+Usage:
+    python benchmarks/bench_compression.py [--repeat N]
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add the project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.utils import compression  # noqa: E402
+
+
+def build_tickets_result(count: int) -> str:
+    """Build a ``list_tickets``-style result with ``count`` tickets."""
+    tickets = []
+    for i in range(count):
+        tickets.append({
+            "id": 100000 + i,
+            "uri": f"/api/tickets/{100000 + i}",
+            "external_id": None,
+            "language": "en",
+            "status": "open" if i % 3 else "closed",
+            "priority": "normal",
+            "channel": "email",
+            "via": "email",
+            "subject": f"Question about order #{5000 + i}",
+            "customer": {
+                "id": 2000 + i,
+                "email": f"customer{i}@example.com",
+                "name": f"Customer {i}",
+                "firstname": "Customer",
+                "lastname": str(i),
+            },
+            "assignee_user": {"id": 7, "email": "agent@example.com", "name": "Support Agent"},
+            "tags": [{"id": 1, "name": "shipping"}, {"id": 2, "name": "vip"}],
+            "messages_count": 3 + i % 5,
+            "created_datetime": "2024-05-01T10:00:00.000000+00:00",
+            "updated_datetime": "2024-05-02T12:30:00.000000+00:00",
+            "last_message_datetime": "2024-05-02T12:30:00.000000+00:00",
+        })
+    data = {"data": tickets, "meta": {"next_cursor": None, "prev_cursor": None}}
+    return f"Found {count} tickets:\n{json.dumps(data, indent=2, default=str)}"
+
+
+def build_response_body(result: str) -> bytes:
+    """Wrap a tool result in the JSON-RPC envelope used by ``/mcp``."""
+    response = {
+        "jsonrpc": "2.0",
+        "id": 1,
+        "result": {"content": [{"type": "text", "text": result}]}
+    }
+    return json.dumps(response).encode()
+
+
+def build_sse_events(result: str, chunk_size: int = 500) -> list:
+    """Build the SSE events ``stream_tool_call`` emits for a result."""
+    events = []
+    accumulated = ""
+    for i in range(0, len(result), chunk_size):
+        accumulated += result[i:i + chunk_size]
+        message = {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "result": {"content": [{"type": "text", "text": accumulated}]}
+        }
+        events.append(f"data: {json.dumps(message)}\n\n".encode())
+    return events
+
+
+def time_call(fn, repeat: int) -> float:
+    """Return the median wall time of ``fn`` in milliseconds."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def bench_buffered(body: bytes, repeat: int):
+    """Benchmark whole-body compression for each encoding."""
+    for encoding in compression.available_encodings():
+        compressed = compression.compress(body, encoding)
+        elapsed = time_call(lambda: compression.compress(body, encoding), repeat)
+        throughput = len(body) / 1024 / 1024 / (elapsed / 1000) if elapsed else 0.0
+        print(
+            f"  {encoding:5s} {len(body):>10,d} -> {len(compressed):>9,d} bytes "
+            f"({len(compressed) / len(body):6.1%})  {elapsed:8.2f} ms  {throughput:7.1f} MB/s"
+        )
+
+
+def bench_sse(events: list, repeat: int):
+    """Benchmark per-event flushed compression for each encoding."""
+    raw_size = sum(len(event) for event in events)
+
+    for encoding in compression.available_encodings():
+        def run():
+            compressor = compression.StreamCompressor(encoding)
+            size = sum(len(compressor.compress(event)) for event in events)
+            return size + len(compressor.finish())
+
+        compressed_size = run()
+        elapsed = time_call(run, repeat)
+        print(
+            f"  {encoding:5s} {raw_size:>10,d} -> {compressed_size:>9,d} bytes "
+            f"({compressed_size / raw_size:6.1%})  {elapsed:8.2f} ms  {len(events)} events"
+        )
+
+
+def main():
+    """Run the compression benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per case")
+    args = parser.parse_args()
+
+    print(f"Available encodings: {', '.join(compression.available_encodings())}")
+    print(f"Compression threshold: {compression.get_min_size()} bytes")
+
+    for count in (5, 50, 250, 1000):
+        result = build_tickets_result(count)
+        print(f"\nBuffered response, {count} tickets")
+        bench_buffered(build_response_body(result), args.repeat)
+
+    for count in (5, 50):
+        result = build_tickets_result(count)
+        print(f"\nSSE stream, {count} tickets")
+        bench_sse(build_sse_events(result), args.repeat)
+
+
+if __name__ == "__main__":
+    main()
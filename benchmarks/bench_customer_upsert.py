@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""Benchmark ``create_customer`` round trips against a mock Gorgias backend.
+
+The mock backend keeps customers in memory and adds a fixed latency to every
+request, standing in for the network round trip to Gorgias. For each upsert
+scenario the benchmark reports the upstream requests made and the wall time
+per call, then imports a CSV through ``bulk_upsert_customers`` at several
+concurrency levels (with the bulk rate limit disabled) and reports rows/s.
+
+Usage:
+    python benchmarks/bench_customer_upsert.py [--latency-ms MS] [--iterations N] [--bulk-rows N]
+"""
+
+import argparse
+import asyncio
+import copy
+import itertools
+import json
+import os
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+# Add the project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.tools.customers import CustomerTools  # noqa: E402
+
+
+class MockGorgiasBackend:
+    """In-memory stand-in for GorgiasAPIClient with simulated latency."""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.customers: Dict[int, Dict[str, Any]] = {}
+        self.calls: Counter = Counter()
+        self._ids = itertools.count(1)
+
+    async def _round_trip(self, method: str):
+        self.calls[method] += 1
+        await asyncio.sleep(self.latency)
+
+    async def get(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        await self._round_trip("GET")
+        if endpoint == "customers":
+            email = (params or {}).get("email")
+            matches = [c for c in self.customers.values() if email and c.get("email") == email]
+            return {"data": copy.deepcopy(matches[:1])}
+        customer_id = int(endpoint.strip("/").split("/")[1])
+        return copy.deepcopy(self.customers[customer_id])
+
+    async def post(self, endpoint: str, data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        await self._round_trip("POST")
+        customer = dict(data or {})
+        customer["id"] = next(self._ids)
+        customer.setdefault("channels", [])
+        if customer.get("email") and not any(c["type"] == "email" for c in customer["channels"]):
+            customer["channels"].append({"type": "email", "address": customer["email"], "preferred": True})
+        self.customers[customer["id"]] = customer
+        return copy.deepcopy(customer)
+
+    async def put(self, endpoint: str, data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        await self._round_trip("PUT")
+        customer_id = int(endpoint.strip("/").split("/")[1])
+        self.customers[customer_id].update(data or {})
+        return copy.deepcopy(self.customers[customer_id])
+
+
+async def _scenario(name: str, latency: float, iterations: int, prepare, arguments):
+    backend = MockGorgiasBackend(latency)
+    tools = CustomerTools(backend)
+    for i in range(iterations):
+        await prepare(tools, i)
+    backend.calls.clear()
+
+    start = time.perf_counter()
+    for i in range(iterations):
+        result = await tools.create_customer(**arguments(i))
+        if result.startswith("Error"):
+            raise RuntimeError(result)
+    elapsed = (time.perf_counter() - start) / iterations
+
+    per_call = {method: count / iterations for method, count in sorted(backend.calls.items())}
+    trips = sum(per_call.values())
+    detail = ", ".join(f"{method} {count:g}" for method, count in per_call.items())
+    print(f"  {name:38s} {trips:4.1f} round trips ({detail:20s}) {elapsed * 1000:7.1f} ms/call")
+
+
+async def _nothing(tools, i):
+    pass
+
+
+async def _existing(tools, i):
+    await tools.api_client.post("customers", data={"email": f"user{i}@example.com", "name": "Old Name"})
+
+
+async def _existing_complete(tools, i):
+    await tools.create_customer(email=f"user{i}@example.com", phone=f"+1555000{i:04d}", name="Jane Doe")
+
+
+async def _bulk(latency: float, rows: int, concurrency: int):
+    backend = MockGorgiasBackend(latency)
+    tools = CustomerTools(backend)
+    data = "email,first_name,last_name,phone\n" + "".join(
+        f"user{i}@example.com,Jane,Doe,+1555000{i:04d}\n" for i in range(rows)
+    )
+    result = await tools.bulk_upsert_customers(data=data, concurrency=concurrency, report="failures")
+    summary = json.loads(result.split(":\n", 1)[1])["summary"]
+    print(
+        f"  concurrency {concurrency:3d}   {summary['rows_per_s']:8.1f} rows/s  "
+        f"{summary['elapsed_s']:7.2f} s for {rows} rows"
+    )
+
+
+async def run(latency: float, iterations: int, bulk_rows: int):
+    """Run every upsert scenario."""
+    full = lambda i: {"email": f"user{i}@example.com", "phone": f"+1555000{i:04d}", "name": "Jane Doe"}  # noqa: E731
+    await _scenario("new customer (email, phone, name)", latency, iterations, _nothing, full)
+    await _scenario("new customer (phone only)", latency, iterations, _nothing,
+                    lambda i: {"phone": f"+1555000{i:04d}", "name": "Jane Doe"})
+    await _scenario("existing customer, new details", latency, iterations, _existing, full)
+    await _scenario("existing customer, nothing to change", latency, iterations, _existing_complete, full)
+
+    print(f"bulk_upsert_customers, {bulk_rows} new customers")
+    os.environ["MCP_BULK_RATE"] = "0"
+    for concurrency in (1, 4, 16):
+        await _bulk(latency, bulk_rows, concurrency)
+
+
+def main():
+    """Run the upsert benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--latency-ms", type=float, default=50.0, help="Simulated round-trip latency")
+    parser.add_argument("--iterations", type=int, default=20, help="Calls per scenario")
+    parser.add_argument("--bulk-rows", type=int, default=200, help="Rows in the bulk import")
+    args = parser.parse_args()
+
+    print(f"create_customer against a mock backend, {args.latency_ms:g} ms per round trip")
+    asyncio.run(run(args.latency_ms / 1000, args.iterations, args.bulk_rows))
+
+
+if __name__ == "__main__":
+    main()
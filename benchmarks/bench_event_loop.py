@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""Benchmark request throughput and latency: default asyncio loop vs. uvloop.
+
+Starts ``cloud_run_mcp`` in a subprocess for each runtime mode with the tool
+layer stubbed out (no Gorgias calls), then drives ``tools/call`` requests at
+a fixed concurrency and reports requests/s, p50 and p99 latency.
+
+Usage:
+    python benchmarks/bench_event_loop.py [--requests N] [--concurrency C]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import aiohttp
+
+# Add the project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+RESULT_SIZE = 20_000
+
+
+class _StubServer:
+    """Stand-in for GorgiasMCPServer that returns a fixed-size result."""
+
+    def __init__(self):
+        self.result = "Found 1 tickets:\n" + json.dumps({"data": ["x" * RESULT_SIZE]}, indent=2)
+
+    def get_all_tools(self):
+        return []
+
+    async def handle_tool_call(self, name, arguments):
+        return self.result
+
+
+async def _serve():
+    import cloud_run_mcp
+    from src.utils import runtime
+
+    cloud_run_mcp.mcp_server = _StubServer()
+    runner = await cloud_run_mcp.start_http_server()
+    print(f"READY {runtime.loop_name()}", flush=True)
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await runner.cleanup()
+
+
+def serve():
+    """Run the stubbed HTTP server in this process."""
+    from src.utils import runtime
+    runtime.run(_serve)
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def _drive(port: int, total: int, concurrency: int):
+    url = f"http://127.0.0.1:{port}/mcp"
+    body = {
+        "jsonrpc": "2.0",
+        "id": 1,
+        "method": "tools/call",
+        "params": {"name": "list_tickets", "arguments": {}}
+    }
+    latencies = []
+    remaining = total
+
+    async with aiohttp.ClientSession() as session:
+        async def call():
+            async with session.post(url, json=body) as response:
+                await response.read()
+
+        async def worker():
+            nonlocal remaining
+            while remaining > 0:
+                remaining -= 1
+                start = time.perf_counter()
+                await call()
+                latencies.append(time.perf_counter() - start)
+
+        # Warm up connections before timing
+        await asyncio.gather(*(call() for _ in range(concurrency)))
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        "rps": total / elapsed,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p99_ms": latencies[int(0.99 * (len(latencies) - 1))] * 1000,
+    }
+
+
+def bench(performance_mode: bool, total: int, concurrency: int):
+    """Benchmark one runtime mode in a fresh server process."""
+    port = _free_port()
+    env = {
+        **os.environ,
+        "PORT": str(port),
+        "MCP_PERFORMANCE_MODE": "true" if performance_mode else "false",
+        "MCP_COMPRESSION": "false",
+        "GORGIAS_API_KEY": os.environ.get("GORGIAS_API_KEY", "bench_key_12345"),
+        "GORGIAS_USERNAME": os.environ.get("GORGIAS_USERNAME", "bench@example.com"),
+        "GORGIAS_BASE_URL": os.environ.get("GORGIAS_BASE_URL", "https://bench.gorgias.com/api/"),
+    }
+    process = subprocess.Popen(
+        [sys.executable, __file__, "--serve"],
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True
+    )
+    try:
+        line = process.stdout.readline().strip()
+        if not line.startswith("READY"):
+            raise RuntimeError("benchmark server failed to start")
+        loop = line.split(" ", 1)[1]
+        result = asyncio.run(_drive(port, total, concurrency))
+        print(
+            f"  {loop:46s} {result['rps']:9.1f} req/s  "
+            f"p50 {result['p50_ms']:7.2f} ms  p99 {result['p99_ms']:7.2f} ms"
+        )
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def main():
+    """Run the event loop benchmark."""
+    if "--serve" in sys.argv:
+        serve()
+        return
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=5000, help="Requests per mode")
+    parser.add_argument("--concurrency", type=int, default=32, help="Concurrent clients")
+    args = parser.parse_args()
+
+    print(f"{args.requests} tools/call requests, concurrency {args.concurrency}, "
+          f"{RESULT_SIZE:,d}-byte results")
+    bench(False, args.requests, args.concurrency)
+    bench(True, args.requests, args.concurrency)
+
+
+if __name__ == "__main__":
+    main()
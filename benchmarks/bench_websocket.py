@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""Benchmark tools/call round-trip latency: HTTP POST vs. the WebSocket transport.
+
+Starts ``cloud_run_mcp`` in a subprocess with the tool layer stubbed out (no
+Gorgias calls) and measures round trips for small, voice-agent sized results
+over three transports:
+
+* HTTP POST opening a new connection per call,
+* HTTP POST on a keep-alive connection pool,
+* JSON-RPC over one multiplexed ``/mcp/ws`` connection.
+
+Usage:
+    python benchmarks/bench_websocket.py [--requests N] [--concurrency C]
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import aiohttp
+
+# Add the project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+RESULT_SIZE = 1_000
+
+
+class _StubServer:
+    """Stand-in for GorgiasMCPServer that returns a fixed-size result."""
+
+    def __init__(self):
+        self.result = "Found 1 customers:\n" + json.dumps({"data": ["x" * RESULT_SIZE]}, indent=2)
+
+    def get_all_tools(self):
+        return []
+
+    async def handle_tool_call(self, name, arguments):
+        return self.result
+
+
+async def _serve():
+    import cloud_run_mcp
+
+    cloud_run_mcp.mcp_server = _StubServer()
+    runner = await cloud_run_mcp.start_http_server()
+    print("READY", flush=True)
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await runner.cleanup()
+
+
+def serve():
+    """Run the stubbed HTTP server in this process."""
+    asyncio.run(_serve())
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _request(request_id: int):
+    return {
+        "jsonrpc": "2.0",
+        "id": request_id,
+        "method": "tools/call",
+        "params": {"name": "get_customer", "arguments": {"customer_id": 1}}
+    }
+
+
+async def _measure(call, total: int, concurrency: int):
+    latencies = []
+    remaining = total
+
+    async def worker():
+        nonlocal remaining
+        while remaining > 0:
+            remaining -= 1
+            start = time.perf_counter()
+            await call()
+            latencies.append(time.perf_counter() - start)
+
+    # Warm up before timing
+    await asyncio.gather(*(call() for _ in range(concurrency)))
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        "rps": total / elapsed,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p99_ms": latencies[int(0.99 * (len(latencies) - 1))] * 1000,
+    }
+
+
+async def _http(port: int, total: int, concurrency: int, keep_alive: bool):
+    url = f"http://127.0.0.1:{port}/mcp"
+    connector = aiohttp.TCPConnector(force_close=not keep_alive)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        async def call():
+            async with session.post(url, json=_request(1)) as response:
+                await response.read()
+
+        return await _measure(call, total, concurrency)
+
+
+async def _websocket(port: int, total: int, concurrency: int):
+    ids = itertools.count(1)
+    pending = {}
+
+    async with aiohttp.ClientSession() as session:
+        async with session.ws_connect(f"http://127.0.0.1:{port}/mcp/ws") as ws:
+            async def reader():
+                async for message in ws:
+                    data = json.loads(message.data)
+                    future = pending.pop(data.get("id"), None)
+                    if future is not None:
+                        future.set_result(data)
+
+            reader_task = asyncio.create_task(reader())
+
+            async def call():
+                request_id = next(ids)
+                future = pending[request_id] = asyncio.get_running_loop().create_future()
+                await ws.send_str(json.dumps(_request(request_id)))
+                await future
+
+            try:
+                return await _measure(call, total, concurrency)
+            finally:
+                reader_task.cancel()
+
+
+def _report(label: str, result):
+    print(
+        f"  {label:28s} {result['rps']:9.1f} req/s  "
+        f"p50 {result['p50_ms']:7.2f} ms  p99 {result['p99_ms']:7.2f} ms"
+    )
+
+
+async def _run_all(port: int, total: int, concurrency: int):
+    for level in sorted({1, concurrency}):
+        print(f"concurrency {level}:")
+        _report("HTTP POST, new connection", await _http(port, total, level, keep_alive=False))
+        _report("HTTP POST, keep-alive", await _http(port, total, level, keep_alive=True))
+        _report("WebSocket, multiplexed", await _websocket(port, total, level))
+
+
+def main():
+    """Run the transport benchmark."""
+    if "--serve" in sys.argv:
+        serve()
+        return
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=3000, help="Requests per transport")
+    parser.add_argument("--concurrency", type=int, default=16, help="Concurrent callers")
+    args = parser.parse_args()
+
+    port = _free_port()
+    env = {
+        **os.environ,
+        "PORT": str(port),
+        "MCP_COMPRESSION": "false",
+        "MCP_CALLER_RATE": "0",
+        "MCP_MAX_IN_FLIGHT": "0",
+        "GORGIAS_API_KEY": os.environ.get("GORGIAS_API_KEY", "bench_key_12345"),
+        "GORGIAS_USERNAME": os.environ.get("GORGIAS_USERNAME", "bench@example.com"),
+        "GORGIAS_BASE_URL": os.environ.get("GORGIAS_BASE_URL", "https://bench.gorgias.com/api/"),
+    }
+    process = subprocess.Popen(
+        [sys.executable, __file__, "--serve"],
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True
+    )
+    try:
+        if process.stdout.readline().strip() != "READY":
+            raise RuntimeError("benchmark server failed to start")
+        print(f"{args.requests} tools/call requests per transport, {RESULT_SIZE:,d}-byte results")
+        asyncio.run(_run_all(port, args.requests, args.concurrency))
+    finally:
+        process.terminate()
+        process.wait()
+
+
+if __name__ == "__main__":
+    main()
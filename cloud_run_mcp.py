@@ -1,30 +1,102 @@
 #!/usr/bin/env python3
 """HTTP-based MCP server for Google Cloud Run with streaming support."""
 
-import os
-import sys
-import asyncio
-import logging
-import json
-from pathlib import Path
-from aiohttp import web
+import time
+
+# Taken before the heavy imports so the startup report includes them
+_BOOT_START = time.perf_counter()
+
+import os  # noqa: E402
+import sys  # noqa: E402
+import asyncio  # noqa: E402
+import logging  # noqa: E402
+import json  # noqa: E402
+import math  # noqa: E402
+from functools import partial  # noqa: E402
+from pathlib import Path  # noqa: E402
+from aiohttp import WSCloseCode, WSMsgType, web  # noqa: E402
 
 # Add the project root to Python path
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
-from src.server import GorgiasMCPServer  # noqa: E402
+from src.server import GorgiasMCPServer, is_error_result  # noqa: E402
+from src.utils import compression, metrics, runtime, tracing  # noqa: E402
+from src.utils.admission import AdmissionController, AdmissionRejected, normalize_priority  # noqa: E402
+from src.utils.fairness import CallerLimiter, caller_key  # noqa: E402
+from src.utils.health import ReadinessProbe  # noqa: E402
+from src.utils.jobs import JobLimitExceeded, JobManager  # noqa: E402
+from src.utils.mirror import MirrorSync  # noqa: E402
+from src.utils.shutdown import GracefulShutdown  # noqa: E402
+from src.utils.startup import StartupTimer, fast_boot_enabled  # noqa: E402
+from src.utils.structured_logging import (  # noqa: E402
+    LazyPayload, configure_logging, get_sample_rate, shutdown_logging
+)
+from src.utils.workers import SharedStats, WorkerSupervisor, reuse_port_supported  # noqa: E402
 
 # Configure logging for Cloud Run
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+configure_logging()
 logger = logging.getLogger(__name__)
 
+# Fraction of per-request INFO log lines that are emitted
+REQUEST_LOG_SAMPLE_RATE = get_sample_rate('MCP_LOG_REQUEST_SAMPLE_RATE', 1.0)
+
 # Global MCP server instance
 mcp_server = None
 
+# Shared-memory request counters (only set in multi-worker mode with stats enabled)
+worker_stats = None
+
+# Event-loop lag monitor (only set in performance mode)
+loop_monitor = None
+
+# Background upstream probe backing the readiness endpoint
+readiness_probe = None
+
+# Tool names, computed once (at startup, or on the first health check in
+# fast-boot mode) so health checks stay cheap
+tool_names = None
+
+# Serializes MCP server initialization
+_init_lock = None
+
+# Bounds concurrent tool calls (None when MCP_MAX_IN_FLIGHT=0)
+admission = None
+
+# Per-caller token buckets (None unless MCP_CALLER_RATE is set)
+caller_limiter = None
+
+# Runs tools/call requests submitted with "background": true (set in main)
+job_manager = None
+
+# Seconds between SSE keep-alive comments on idle job event streams
+JOB_EVENTS_KEEPALIVE = 15.0
+
+# Background sync of the customer tools' local indexes (set in main)
+customer_sync = None
+
+# Incremental SQLite mirror of customers and tickets (set in main when enabled)
+mirror_sync = None
+
+# Open /mcp/ws connections, closed after the shutdown drain
+open_websockets = set()
+
+# Concurrent requests handled per WebSocket connection
+WS_MAX_CONCURRENT = int(os.environ.get('MCP_WS_MAX_CONCURRENT', 16))
+
+# Seconds between WebSocket pings, which also keep idle connections open
+WS_HEARTBEAT = 30.0
+
+# Coordinates SIGTERM draining (set in main)
+shutdown = None
+
+# Liveness never changes while the process can answer, so serialize it once
+LIVENESS_BODY = json.dumps({"status": "alive"}).encode()
+
+# Bodies larger than this are compressed in a worker thread so the event loop
+# is not blocked while a multi-hundred-KB tool result is being encoded
+COMPRESSION_EXECUTOR_SIZE = 256 * 1024
+
 
 def check_environment():
     """Check if required environment variables are set."""
@@ -43,56 +115,233 @@ def check_environment():
     logger.info("✅ All required environment variables are set")
     return True
 
+@web.middleware
+async def compression_middleware(request, handler):
+    """Compress large JSON responses according to the client's Accept-Encoding."""
+    response = await handler(request)
+
+    if not compression.is_enabled() or type(response) is not web.Response:
+        return response
+
+    body = response.body
+    if not isinstance(body, (bytes, bytearray)) or len(body) < compression.get_min_size():
+        return response
+    if response.headers.get('Content-Encoding'):
+        return response
+
+    encoding = compression.negotiate_encoding(request.headers.get('Accept-Encoding'))
+    if encoding is None:
+        return response
+
+    if len(body) >= COMPRESSION_EXECUTOR_SIZE:
+        loop = asyncio.get_running_loop()
+        compressed = await loop.run_in_executor(None, compression.compress, bytes(body), encoding)
+    else:
+        compressed = compression.compress(bytes(body), encoding)
+
+    response.body = compressed
+    response.headers['Content-Encoding'] = encoding
+    response.headers['Vary'] = 'Accept-Encoding'
+    return response
+
+def retryable_error(request_id, message, retry_after):
+    """Build a JSON-RPC error message telling the client to retry after a delay."""
+    return {
+        "jsonrpc": "2.0",
+        "id": request_id,
+        "error": {
+            "code": -32000,
+            "message": message,
+            "data": {"retryable": True, "retry_after": retry_after}
+        }
+    }
+
+def retryable_error_response(request_id, message, retry_after, status=503):
+    """Build an HTTP response carrying a retryable JSON-RPC error."""
+    return web.Response(
+        text=json.dumps(retryable_error(request_id, message, retry_after)),
+        status=status,
+        headers={'Retry-After': str(max(1, math.ceil(retry_after)))},
+        content_type='application/json'
+    )
+
+async def _peek_request_id(request):
+    """Return the JSON-RPC id of a request without failing on bad bodies."""
+    try:
+        data = await request.json()
+        return data.get("id") if isinstance(data, dict) else None
+    except Exception:
+        return None
+
+@web.middleware
+async def drain_middleware(request, handler):
+    """Reject new MCP work while draining and track requests that must finish."""
+    if shutdown is None or request.path != '/mcp' or request.method != 'POST':
+        return await handler(request)
+    
+    if shutdown.draining:
+        return retryable_error_response(
+            await _peek_request_id(request), "Server is shutting down", retry_after=1
+        )
+    
+    shutdown.begin()
+    try:
+        return await handler(request)
+    finally:
+        shutdown.end()
+
+@web.middleware
+async def metrics_middleware(request, handler):
+    """Track in-flight HTTP requests and count responses by route and status."""
+    resource = request.match_info.route.resource
+    route = resource.canonical if resource is not None else "unmatched"
+    status = "500"
+    metrics.http_requests_in_flight.inc()
+    try:
+        response = await handler(request)
+        status = str(response.status)
+        return response
+    except web.HTTPException as e:
+        status = str(e.status)
+        raise
+    finally:
+        metrics.http_requests_in_flight.dec()
+        metrics.http_requests.inc(route, status)
+
+async def metrics_handler(request):
+    """Expose metrics in the Prometheus text format."""
+    return web.Response(
+        body=metrics.registry.render().encode(),
+        headers={'Content-Type': 'text/plain; version=0.0.4; charset=utf-8'}
+    )
+
+@web.middleware
+async def stats_middleware(request, handler):
+    """Record request counts and latency in the shared worker stats."""
+    start = time.perf_counter()
+    try:
+        response = await handler(request)
+    except Exception:
+        worker_stats.record_request(time.perf_counter() - start, error=True)
+        raise
+    worker_stats.record_request(time.perf_counter() - start, error=response.status >= 500)
+    return response
+
+async def worker_stats_handler(request):
+    """Return request counters aggregated across all worker processes."""
+    if worker_stats is None:
+        return web.Response(
+            text=json.dumps({"status": "error", "message": "Worker stats are not enabled"}),
+            status=404,
+            content_type='application/json'
+        )
+    
+    snapshot = worker_stats.snapshot()
+    snapshot["worker"] = worker_stats.worker_id
+    return web.Response(
+        text=json.dumps(snapshot),
+        content_type='application/json'
+    )
+
+async def runtime_handler(request):
+    """Report the event loop implementation and measured loop lag."""
+    return web.Response(
+        text=json.dumps({
+            "performance_mode": runtime.is_enabled(),
+            "event_loop": runtime.loop_name(),
+            "loop_lag": loop_monitor.snapshot() if loop_monitor is not None else None,
+            "admission": admission.snapshot() if admission is not None else None,
+            "caller_limits": caller_limiter.snapshot() if caller_limiter is not None else None,
+            "customer_sync": customer_sync.snapshot() if customer_sync is not None else None,
+            "mirror": await mirror_sync.snapshot() if mirror_sync is not None else None
+        }),
+        content_type='application/json'
+    )
+
 async def healthcheck_handler(request):
     """Handle Cloud Run healthcheck requests."""
-    try:
-        if mcp_server is None:
-            return web.Response(
-                text=json.dumps({"status": "error", "message": "MCP server not initialized"}),
-                status=503,
-                content_type='application/json'
-            )
-        
-        tools = mcp_server.get_all_tools()
+    if mcp_server is None:
         return web.Response(
-            text=json.dumps({
-                "status": "healthy",
-                "message": "Gorgias MCP Server is running",
-                "environment": "google-cloud-run",
-                "tools_count": len(tools),
-                "tools": [tool.name for tool in tools],
-                "streaming": True
-            }),
+            text=json.dumps({"status": "error", "message": "MCP server not initialized"}),
+            status=503,
             content_type='application/json'
         )
-    except Exception as e:
-        logger.error(f"Healthcheck error: {e}")
+    
+    return web.Response(
+        text=json.dumps({
+            "status": "healthy",
+            "message": "Gorgias MCP Server is running",
+            "environment": "google-cloud-run",
+            "tools_count": len(get_tool_names()),
+            "tools": get_tool_names(),
+            "streaming": True
+        }),
+        content_type='application/json'
+    )
+
+async def liveness_handler(request):
+    """Handle liveness probes: the process is up and the event loop responds."""
+    return web.Response(body=LIVENESS_BODY, content_type='application/json')
+
+async def readiness_handler(request):
+    """Handle readiness probes from the cached background upstream probe."""
+    if mcp_server is None or readiness_probe is None:
         return web.Response(
-            text=json.dumps({"status": "error", "message": str(e)}),
+            text=json.dumps({"status": "not_ready", "message": "MCP server not initialized"}),
             status=503,
             content_type='application/json'
         )
+    
+    draining = shutdown is not None and shutdown.draining
+    ready = readiness_probe.ready and not draining
+    return web.Response(
+        text=json.dumps({
+            "status": "draining" if draining else "ready" if ready else "not_ready",
+            **readiness_probe.snapshot()
+        }),
+        status=200 if ready else 503,
+        content_type='application/json'
+    )
+
+def initialize_result():
+    """Return the result of an MCP initialize request."""
+    return {
+        "protocolVersion": "2024-11-05",
+        "capabilities": {
+            "tools": {},
+            "streaming": True  # Indicate streaming support
+        },
+        "serverInfo": {
+            "name": "gorgias-mcp-server",
+            "version": "1.0.0"
+        }
+    }
+
+def tools_list_result():
+    """Return the result of an MCP tools/list request."""
+    tools_data = []
+    for tool in mcp_server.get_all_tools():
+        tools_data.append({
+            "name": tool.name,
+            "description": tool.description,
+            "inputSchema": tool.inputSchema
+        })
+    return {"tools": tools_data}
 
 async def mcp_initialize_handler(request):
     """Handle MCP initialize requests."""
     try:
         data = await request.json()
-        logger.info(f"MCP Initialize request: {data}")
+        logger.info(
+            "MCP initialize request id=%s", data.get("id"),
+            extra={"sample_rate": REQUEST_LOG_SAMPLE_RATE}
+        )
+        logger.debug("MCP initialize payload: %s", LazyPayload(data))
         
         response = {
             "jsonrpc": "2.0",
             "id": data.get("id"),
-            "result": {
-                "protocolVersion": "2024-11-05",
-                "capabilities": {
-                    "tools": {},
-                    "streaming": True  # Indicate streaming support
-                },
-                "serverInfo": {
-                    "name": "gorgias-mcp-server",
-                    "version": "1.0.0"
-                }
-            }
+            "result": initialize_result()
         }
         
         return web.Response(
@@ -100,7 +349,7 @@ async def mcp_initialize_handler(request):
             content_type='application/json'
         )
     except Exception as e:
-        logger.error(f"MCP Initialize error: {e}")
+        logger.error("MCP Initialize error: %s", e)
         return web.Response(
             text=json.dumps({
                 "jsonrpc": "2.0",
@@ -115,7 +364,10 @@ async def mcp_tools_list_handler(request):
     """Handle MCP tools/list requests."""
     try:
         data = await request.json()
-        logger.info(f"MCP Tools List request: {data}")
+        logger.info(
+            "MCP tools/list request id=%s", data.get("id"),
+            extra={"sample_rate": REQUEST_LOG_SAMPLE_RATE}
+        )
         
         if mcp_server is None:
             return web.Response(
@@ -128,22 +380,10 @@ async def mcp_tools_list_handler(request):
                 content_type='application/json'
             )
         
-        tools = mcp_server.get_all_tools()
-        tools_data = []
-        
-        for tool in tools:
-            tools_data.append({
-                "name": tool.name,
-                "description": tool.description,
-                "inputSchema": tool.inputSchema
-            })
-        
         response = {
             "jsonrpc": "2.0",
             "id": data.get("id"),
-            "result": {
-                "tools": tools_data
-            }
+            "result": tools_list_result()
         }
         
         return web.Response(
@@ -151,7 +391,7 @@ async def mcp_tools_list_handler(request):
             content_type='application/json'
         )
     except Exception as e:
-        logger.error(f"MCP Tools List error: {e}")
+        logger.error("MCP Tools List error: %s", e)
         return web.Response(
             text=json.dumps({
                 "jsonrpc": "2.0",
@@ -166,12 +406,17 @@ async def mcp_tools_call_handler(request):
     """Handle MCP tools/call requests with streaming support."""
     try:
         data = await request.json()
-        logger.info(f"MCP Tools Call request: {data}")
-        
         # Check if client wants streaming
         params = data.get("params", {})
         stream = params.get("stream", False)
         
+        logger.info(
+            "MCP tools/call request id=%s tool=%s stream=%s",
+            data.get("id"), params.get("name"), bool(stream),
+            extra={"sample_rate": REQUEST_LOG_SAMPLE_RATE}
+        )
+        logger.debug("MCP tools/call arguments: %s", LazyPayload(params.get("arguments")))
+        
         if mcp_server is None:
             return web.Response(
                 text=json.dumps({
@@ -197,16 +442,62 @@ async def mcp_tools_call_handler(request):
                 content_type='application/json'
             )
         
-        # If streaming requested, use SSE
-        if stream:
-            return await stream_tool_call(request, tool_name, arguments, data.get("id"))
+        # Throttle callers that exceed their own share before they can queue
+        if caller_limiter is not None:
+            caller = caller_key(request.headers, request.remote)
+            wait = caller_limiter.try_acquire(caller)
+            if wait:
+                logger.info(
+                    "Throttling tools/call %s for caller %s", tool_name, caller,
+                    extra={"sample_rate": REQUEST_LOG_SAMPLE_RATE}
+                )
+                return retryable_error_response(
+                    data.get("id"), "Rate limit exceeded for this caller", wait, status=429
+                )
         
-        # Otherwise, return standard response
-        result = await mcp_server.handle_tool_call(tool_name, arguments)
+        # Background jobs run in the job pool, which has its own bound
+        if params.get("background"):
+            return await start_background_job(tool_name, arguments, data.get("id"))
+        
+        if admission is None:
+            return await run_tool_call(request, tool_name, arguments, data.get("id"), stream)
         
+        # Shed load before any work starts; streams hold their slot until done
+        priority = normalize_priority(request.headers.get('X-MCP-Priority'))
+        try:
+            async with admission.slot(priority):
+                return await run_tool_call(request, tool_name, arguments, data.get("id"), stream)
+        except AdmissionRejected as e:
+            logger.info(
+                "Shedding tools/call %s (%s priority): %s", tool_name, priority, e,
+                extra={"sample_rate": REQUEST_LOG_SAMPLE_RATE}
+            )
+            return retryable_error_response(data.get("id"), str(e), e.retry_after)
+    except Exception as e:
+        logger.error("MCP Tools Call error: %s", e)
+        return web.Response(
+            text=json.dumps({
+                "jsonrpc": "2.0",
+                "id": data.get("id") if 'data' in locals() else None,
+                "error": {"code": -32603, "message": str(e)}
+            }),
+            status=500,
+            content_type='application/json'
+        )
+
+async def run_tool_call(request, tool_name, arguments, request_id, stream):
+    """Execute a validated tool call as a JSON or SSE response."""
+    # If streaming requested, use SSE
+    if stream:
+        return await stream_tool_call(request, tool_name, arguments, request_id)
+    
+    # Otherwise, return standard response
+    result = await mcp_server.handle_tool_call(tool_name, arguments)
+    
+    with tracing.start_span("jsonrpc.serialize"):
         response = {
             "jsonrpc": "2.0",
-            "id": data.get("id"),
+            "id": request_id,
             "result": {
                 "content": [
                     {
@@ -216,37 +507,137 @@ async def mcp_tools_call_handler(request):
                 ]
             }
         }
-        
-        return web.Response(
-            text=json.dumps(response),
-            content_type='application/json'
-        )
-    except Exception as e:
-        logger.error(f"MCP Tools Call error: {e}")
-        return web.Response(
-            text=json.dumps({
-                "jsonrpc": "2.0",
-                "id": data.get("id") if 'data' in locals() else None,
-                "error": {"code": -32603, "message": str(e)}
-            }),
-            status=500,
-            content_type='application/json'
+        body = json.dumps(response)
+    
+    return web.Response(
+        text=body,
+        content_type='application/json'
+    )
+
+def background_job_result(job):
+    """Return the tools/call result announcing a submitted background job."""
+    return {
+        "content": [
+            {
+                "type": "text",
+                "text": (
+                    f"Started background job {job.id} for {job.tool}. "
+                    f"Poll GET /jobs/{job.id} or stream GET /jobs/{job.id}/events."
+                )
+            }
+        ],
+        "job": job.to_dict()
+    }
+
+async def start_background_job(tool_name, arguments, request_id):
+    """Submit a tool call as a background job and return its ID at once."""
+    try:
+        job = await job_manager.submit(tool_name, arguments)
+    except JobLimitExceeded as e:
+        return retryable_error_response(request_id, str(e), retry_after=5)
+    
+    return web.Response(
+        text=json.dumps({
+            "jsonrpc": "2.0",
+            "id": request_id,
+            "result": background_job_result(job)
+        }),
+        content_type='application/json'
+    )
+
+def _job_not_found(job_id):
+    return web.Response(
+        text=json.dumps({"status": "error", "message": f"Job {job_id} not found"}),
+        status=404,
+        content_type='application/json'
+    )
+
+async def job_status_handler(request):
+    """Return a background job's status, and its result once finished."""
+    job_id = request.match_info['job_id']
+    job = job_manager.get(job_id) if job_manager is not None else None
+    if job is None:
+        return _job_not_found(job_id)
+    return web.Response(text=json.dumps(job.to_dict()), content_type='application/json')
+
+async def job_cancel_handler(request):
+    """Cancel a background job that has not finished."""
+    job_id = request.match_info['job_id']
+    job = job_manager.get(job_id) if job_manager is not None else None
+    if job is None:
+        return _job_not_found(job_id)
+    cancelled = await job_manager.cancel(job_id)
+    return web.Response(
+        text=json.dumps({"cancelled": cancelled, **job.to_dict(include_result=False)}),
+        content_type='application/json'
+    )
+
+async def job_events_handler(request):
+    """Stream a background job's events as SSE, resuming after Last-Event-ID."""
+    job_id = request.match_info['job_id']
+    job = job_manager.get(job_id) if job_manager is not None else None
+    if job is None:
+        return _job_not_found(job_id)
+    
+    try:
+        last_event_id = int(
+            request.headers.get('Last-Event-ID') or request.query.get('last_event_id') or 0
         )
+    except ValueError:
+        last_event_id = 0
+    
+    response = web.StreamResponse(status=200, reason='OK', headers={
+        'Content-Type': 'text/event-stream',
+        'Cache-Control': 'no-cache',
+        'Connection': 'keep-alive',
+        'X-Accel-Buffering': 'no'
+    })
+    await response.prepare(request)
+    
+    while shutdown is None or not shutdown.draining:
+        events = await job.wait_for_events(last_event_id, JOB_EVENTS_KEEPALIVE)
+        if not events:
+            if job.done:
+                break
+            await response.write(b": keepalive\n\n")
+            continue
+        for event in events:
+            last_event_id += 1
+            await response.write(f"id: {last_event_id}\ndata: {json.dumps(event)}\n\n".encode())
+        if job.done and last_event_id >= len(job.events):
+            break
+    
+    await response.write_eof()
+    return response
 
 async def stream_tool_call(request, tool_name, arguments, request_id):
     """Stream tool call results using Server-Sent Events (SSE)."""
-    response = web.StreamResponse(
-        status=200,
-        reason='OK',
-        headers={
-            'Content-Type': 'text/event-stream',
-            'Cache-Control': 'no-cache',
-            'Connection': 'keep-alive',
-            'X-Accel-Buffering': 'no'  # Disable buffering for Cloud Run
-        }
-    )
+    headers = {
+        'Content-Type': 'text/event-stream',
+        'Cache-Control': 'no-cache',
+        'Connection': 'keep-alive',
+        'X-Accel-Buffering': 'no'  # Disable buffering for Cloud Run
+    }
+
+    # The stream size is unknown when headers are sent, so SSE is compressed
+    # whenever the client negotiates an encoding. Every event is flushed.
+    compressor = None
+    if compression.is_enabled():
+        encoding = compression.negotiate_encoding(request.headers.get('Accept-Encoding'))
+        if encoding is not None:
+            compressor = compression.StreamCompressor(encoding)
+            headers['Content-Encoding'] = encoding
+            headers['Vary'] = 'Accept-Encoding'
+
+    response = web.StreamResponse(status=200, reason='OK', headers=headers)
     
     await response.prepare(request)
+
+    async def send_event(message):
+        payload = f"data: {json.dumps(message)}\n\n".encode()
+        if compressor is not None:
+            payload = compressor.compress(payload)
+        await response.write(payload)
     
     try:
         # Send initial status
@@ -262,7 +653,7 @@ async def stream_tool_call(request, tool_name, arguments, request_id):
                 ]
             }
         }
-        await response.write(f"data: {json.dumps(initial_message)}\n\n".encode())
+        await send_event(initial_message)
         
         # Call the tool (this is async, so we can stream progress)
         # For now, we'll stream the result in chunks
@@ -287,14 +678,14 @@ async def stream_tool_call(request, tool_name, arguments, request_id):
                     ]
                 }
             }
-            await response.write(f"data: {json.dumps(chunk_message)}\n\n".encode())
+            await send_event(chunk_message)
             await asyncio.sleep(0.01)  # Small delay for streaming effect
         
         # Send final completion message (optional, some clients don't need it)
         # The complete result is already sent in the last chunk
         
     except Exception as e:
-        logger.error(f"Streaming error: {e}")
+        logger.error("Streaming error: %s", e)
         error_message = {
             "jsonrpc": "2.0",
             "id": request_id,
@@ -303,12 +694,185 @@ async def stream_tool_call(request, tool_name, arguments, request_id):
                 "message": str(e)
             }
         }
-        await response.write(f"data: {json.dumps(error_message)}\n\n".encode())
+        await send_event(error_message)
     finally:
+        if compressor is not None:
+            await response.write(compressor.finish())
         await response.write_eof()
     
     return response
 
+def jsonrpc_error(request_id, code, message):
+    """Build a JSON-RPC error message."""
+    return {"jsonrpc": "2.0", "id": request_id, "error": {"code": code, "message": message}}
+
+async def mcp_websocket_handler(request):
+    """Serve JSON-RPC over one long-lived WebSocket connection.
+    
+    Each text message is one JSON-RPC request. Requests are handled
+    concurrently (up to MCP_WS_MAX_CONCURRENT per connection) and responses
+    are matched by id, so a slow tool call does not hold up the others.
+    """
+    ws = web.WebSocketResponse(heartbeat=WS_HEARTBEAT)
+    await ws.prepare(request)
+    open_websockets.add(ws)
+    
+    connection = {
+        "caller": caller_key(request.headers, request.remote),
+        "priority": normalize_priority(request.headers.get('X-MCP-Priority')),
+        "traceparent": request.headers.get('traceparent'),
+    }
+    slots = asyncio.Semaphore(WS_MAX_CONCURRENT)
+    tasks = set()
+    
+    def on_done(task):
+        tasks.discard(task)
+        slots.release()
+    
+    try:
+        async for message in ws:
+            if message.type != WSMsgType.TEXT:
+                continue
+            # Stop reading while the connection is at its concurrency limit
+            await slots.acquire()
+            task = asyncio.create_task(ws_handle_message(ws, message.data, connection))
+            tasks.add(task)
+            task.add_done_callback(on_done)
+    finally:
+        # The client is gone, so nobody is waiting for these results
+        for task in list(tasks):
+            task.cancel()
+        open_websockets.discard(ws)
+    
+    return ws
+
+async def ws_handle_message(ws, text, connection):
+    """Handle one JSON-RPC message received over a WebSocket."""
+    try:
+        data = json.loads(text)
+    except ValueError:
+        await ws_send(ws, jsonrpc_error(None, -32700, "Parse error"))
+        return
+    if not isinstance(data, dict):
+        await ws_send(ws, jsonrpc_error(None, -32600, "Invalid request"))
+        return
+    
+    request_id = data.get("id")
+    method = data.get("method")
+    with tracing.start_span(
+        "WS /mcp/ws",
+        {"rpc.method": method if isinstance(method, str) else None},
+        kind=tracing.KIND_SERVER,
+        traceparent=connection["traceparent"]
+    ):
+        if shutdown is not None and shutdown.draining:
+            reply = retryable_error(request_id, "Server is shutting down", retry_after=1)
+        else:
+            if shutdown is not None:
+                shutdown.begin()
+            try:
+                reply = await ws_dispatch(ws, data, connection)
+            except Exception as e:
+                logger.error("WebSocket %s error: %s", method, e)
+                reply = jsonrpc_error(request_id, -32603, str(e))
+            finally:
+                if shutdown is not None:
+                    shutdown.end()
+    
+    # Notifications (no id) get no response
+    if reply is not None and request_id is not None:
+        await ws_send(ws, reply)
+
+async def ws_send(ws, message):
+    """Send a JSON message unless the connection has closed."""
+    if not ws.closed:
+        await ws.send_str(json.dumps(message))
+
+async def ws_dispatch(ws, data, connection):
+    """Route a WebSocket JSON-RPC request and return the response message."""
+    request_id = data.get("id")
+    method = data.get("method")
+    
+    if mcp_server is None:
+        return jsonrpc_error(request_id, -32603, "MCP server not initialized")
+    if method == "initialize":
+        result = initialize_result()
+    elif method == "ping":
+        result = {}
+    elif method == "tools/list":
+        result = tools_list_result()
+    elif method == "tools/call":
+        return await ws_tool_call(ws, data, connection)
+    elif method == "resources/list":
+        result = {"resources": []}
+    elif method == "prompts/list":
+        result = {"prompts": []}
+    elif isinstance(method, str) and method.startswith("notifications/"):
+        return None
+    else:
+        return jsonrpc_error(request_id, -32601, f"Method not found: {method}")
+    return {"jsonrpc": "2.0", "id": request_id, "result": result}
+
+async def ws_tool_call(ws, data, connection):
+    """Run a tools/call received over a WebSocket, with the HTTP limits applied."""
+    request_id = data.get("id")
+    params = data.get("params") or {}
+    tool_name = params.get("name")
+    arguments = params.get("arguments", {})
+    
+    if not tool_name:
+        return jsonrpc_error(request_id, -32602, "Missing tool name")
+    
+    if caller_limiter is not None:
+        wait = caller_limiter.try_acquire(connection["caller"])
+        if wait:
+            return retryable_error(request_id, "Rate limit exceeded for this caller", wait)
+    
+    if params.get("background"):
+        try:
+            job = await job_manager.submit(tool_name, arguments)
+        except JobLimitExceeded as e:
+            return retryable_error(request_id, str(e), retry_after=5)
+        return {"jsonrpc": "2.0", "id": request_id, "result": background_job_result(job)}
+    
+    if admission is None:
+        return await ws_run_tool_call(ws, request_id, tool_name, arguments, params)
+    try:
+        async with admission.slot(connection["priority"]):
+            return await ws_run_tool_call(ws, request_id, tool_name, arguments, params)
+    except AdmissionRejected as e:
+        return retryable_error(request_id, str(e), e.retry_after)
+
+async def ws_run_tool_call(ws, request_id, tool_name, arguments, params):
+    """Execute a tool call, pushing partial results first when streaming."""
+    result = await mcp_server.handle_tool_call(tool_name, arguments)
+    
+    if params.get("stream"):
+        # Push the result in chunks as progress notifications; the final
+        # response still carries the complete text
+        progress_token = (params.get("_meta") or {}).get("progressToken", request_id)
+        chunk_size = 500
+        total = max(1, math.ceil(len(result) / chunk_size))
+        for i in range(total):
+            await ws_send(ws, {
+                "jsonrpc": "2.0",
+                "method": "notifications/progress",
+                "params": {
+                    "progressToken": progress_token,
+                    "progress": i + 1,
+                    "total": total,
+                    "content": [
+                        {"type": "text", "text": result[i * chunk_size:(i + 1) * chunk_size]}
+                    ]
+                }
+            })
+    
+    return {
+        "jsonrpc": "2.0",
+        "id": request_id,
+        "result": {"content": [{"type": "text", "text": result}]}
+    }
+
 async def mcp_resources_list_handler(request):
     """Handle MCP resources/list requests (stub)."""
     data = await request.json()
@@ -372,10 +936,26 @@ async def mcp_prompts_get_handler(request):
     )
 
 async def mcp_handler(request):
-    """Handle all MCP requests."""
+    """Handle all MCP requests, each inside a server trace span."""
+    with tracing.start_span(
+        "POST /mcp",
+        {"http.request.method": "POST", "http.route": "/mcp"},
+        kind=tracing.KIND_SERVER,
+        traceparent=request.headers.get('traceparent')
+    ) as span:
+        response = await dispatch_mcp_request(request, span)
+        span.set_attribute("http.response.status_code", response.status)
+        if span.sampled and not response.prepared:
+            response.headers['traceparent'] = span.traceparent
+        return response
+
+async def dispatch_mcp_request(request, span):
+    """Route a JSON-RPC request to the handler for its method."""
     try:
-        data = await request.json()
+        with tracing.start_span("jsonrpc.parse"):
+            data = await request.json()
         method = data.get("method")
+        span.set_attribute("rpc.method", method if isinstance(method, str) else None)
         
         if method == "initialize":
             return await mcp_initialize_handler(request)
@@ -392,7 +972,7 @@ async def mcp_handler(request):
         elif method == "prompts/get":
             return await mcp_prompts_get_handler(request)
         else:
-            logger.warning(f"Unsupported MCP method requested: {method}")
+            logger.warning("Unsupported MCP method requested: %s", LazyPayload(method, limit=100))
             return web.Response(
                 text=json.dumps({
                     "jsonrpc": "2.0",
@@ -402,7 +982,7 @@ async def mcp_handler(request):
                 content_type='application/json'
             )
     except Exception as e:
-        logger.error(f"MCP Handler error: {e}")
+        logger.error("MCP Handler error: %s", e)
         return web.Response(
             text=json.dumps({
                 "jsonrpc": "2.0",
@@ -413,19 +993,38 @@ async def mcp_handler(request):
             content_type='application/json'
         )
 
+def get_tool_names():
+    """Return the cached list of tool names."""
+    global tool_names
+    if tool_names is None:
+        tool_names = [tool.name for tool in mcp_server.get_all_tools()]
+    return tool_names
+
 async def init_mcp_server():
-    """Initialize the MCP server."""
-    global mcp_server
-    try:
-        mcp_server = GorgiasMCPServer()
-        logger.info("✅ MCP server initialized successfully")
-        return True
-    except Exception as e:
-        logger.error(f"Failed to initialize MCP server: {e}")
-        return False
+    """Initialize the MCP server (at most once, even if called concurrently)."""
+    global mcp_server, _init_lock
+    if _init_lock is None:
+        _init_lock = asyncio.Lock()
+    async with _init_lock:
+        if mcp_server is not None:
+            return True
+        try:
+            mcp_server = GorgiasMCPServer()
+            if not fast_boot_enabled():
+                get_tool_names()
+            logger.info("✅ MCP server initialized successfully")
+            return True
+        except Exception as e:
+            logger.error(f"Failed to initialize MCP server: {e}")
+            return False
 
-async def start_http_server():
-    """Start the HTTP server with MCP endpoints."""
+async def start_http_server(reuse_port=False):
+    """Start the HTTP server with MCP endpoints.
+    
+    Args:
+        reuse_port: Bind with SO_REUSEPORT so several worker processes can
+            share the listening port.
+    """
     app = web.Application()
     
     # Add CORS headers for Cloud Run
@@ -433,72 +1032,230 @@ async def start_http_server():
         async def middleware_handler(request):
             response = await handler(request)
             response.headers['Access-Control-Allow-Origin'] = '*'
-            response.headers['Access-Control-Allow-Methods'] = 'GET, POST, OPTIONS'
-            response.headers['Access-Control-Allow-Headers'] = 'Content-Type, Authorization'
+            response.headers['Access-Control-Allow-Methods'] = 'GET, POST, DELETE, OPTIONS'
+            response.headers['Access-Control-Allow-Headers'] = 'Content-Type, Authorization, X-MCP-Priority, Mcp-Session-Id, X-Session-Id, Last-Event-ID, traceparent'
             return response
         return middleware_handler
     
     app.middlewares.append(cors_middleware)
+    app.middlewares.append(compression_middleware)
+    app.middlewares.append(metrics_middleware)
+    app.middlewares.append(drain_middleware)
+    if worker_stats is not None:
+        app.middlewares.append(stats_middleware)
     
     # Add routes
     app.router.add_get('/', healthcheck_handler)
     app.router.add_get('/health', healthcheck_handler)
+    app.router.add_get('/health/live', liveness_handler)
+    app.router.add_get('/health/ready', readiness_handler)
+    app.router.add_get('/stats', worker_stats_handler)
+    app.router.add_get('/runtime', runtime_handler)
+    app.router.add_get('/metrics', metrics_handler)
     app.router.add_post('/mcp', mcp_handler)
+    app.router.add_get('/mcp/ws', mcp_websocket_handler)
+    app.router.add_get('/jobs/{job_id}', job_status_handler)
+    app.router.add_delete('/jobs/{job_id}', job_cancel_handler)
+    app.router.add_get('/jobs/{job_id}/events', job_events_handler)
     app.router.add_options('/mcp', lambda r: web.Response(headers={
         'Access-Control-Allow-Origin': '*',
-        'Access-Control-Allow-Methods': 'GET, POST, OPTIONS',
-        'Access-Control-Allow-Headers': 'Content-Type, Authorization'
+        'Access-Control-Allow-Methods': 'GET, POST, DELETE, OPTIONS',
+        'Access-Control-Allow-Headers': 'Content-Type, Authorization, X-MCP-Priority, Mcp-Session-Id, X-Session-Id, Last-Event-ID, traceparent'
     }))
     
     # Get port from Cloud Run environment (PORT is set by Cloud Run)
     port = int(os.environ.get('PORT', 8080))
     
     # Start the server
-    runner = web.AppRunner(app)
+    # In-flight work is drained before cleanup, so aiohttp only needs a short
+    # grace period for whatever is left when the drain deadline expires
+    runner = web.AppRunner(app, shutdown_timeout=1.0)
     await runner.setup()
-    site = web.TCPSite(runner, '0.0.0.0', port)
+    if runtime.is_enabled():
+        sock = runtime.create_listen_socket('0.0.0.0', port, reuse_port=reuse_port)
+        site = web.SockSite(runner, sock)
+    else:
+        site = web.TCPSite(runner, '0.0.0.0', port, reuse_port=reuse_port or None)
     await site.start()
     
     logger.info(f"🌐 HTTP server started on port {port}")
     logger.info("📡 Healthcheck available at /health")
+    logger.info("💓 Liveness at /health/live, readiness at /health/ready")
+    logger.info("📈 Metrics available at /metrics")
     logger.info("🔧 MCP endpoint available at /mcp")
+    logger.info("🔌 WebSocket JSON-RPC endpoint available at /mcp/ws")
     logger.info("📋 MCP clients can POST to /mcp with JSON-RPC requests")
     logger.info("🌊 Streaming support enabled (use stream: true in params)")
     
     return runner
 
-async def main():
-    """Main function to start the HTTP MCP server."""
+async def main(reuse_port=False, worker_id=0):
+    """Main function to start the HTTP MCP server.
+    
+    Args:
+        reuse_port: Bind the listening socket with SO_REUSEPORT (worker mode).
+        worker_id: Index of this worker process (0 in single-process mode).
+    """
+    startup_timer = StartupTimer(_BOOT_START)
+    startup_timer.mark("imports")
+    tracing.configure_tracing()
     logger.info("🚀 Starting Gorgias MCP Server on Google Cloud Run...")
     
     # Check environment variables
-    if not check_environment():
-        sys.exit(1)
+    with startup_timer.phase("environment_check"):
+        if not check_environment():
+            sys.exit(1)
     
     # Initialize MCP server
-    if not await init_mcp_server():
-        sys.exit(1)
+    with startup_timer.phase("server_init"):
+        if not await init_mcp_server():
+            sys.exit(1)
+    
+    global admission
+    admission = AdmissionController.from_env()
+    if admission is not None:
+        logger.info(
+            f"🚦 Admission control: {admission.max_in_flight} concurrent tool calls, "
+            f"{admission.queue_size} queued per priority"
+        )
+    
+    global job_manager
+    job_manager = JobManager.from_env(mcp_server.handle_tool_call, is_error=is_error_result)
+    
+    global caller_limiter
+    caller_limiter = CallerLimiter.from_env()
+    if caller_limiter is not None:
+        logger.info(
+            f"⚖️ Per-caller limit: {caller_limiter.rate:g} calls/s, burst {caller_limiter.burst:g}"
+        )
+    
+    # Probe Gorgias in the background so readiness checks never call upstream
+    global readiness_probe
+    readiness_probe = ReadinessProbe(
+        mcp_server.api_client,
+        interval=float(os.environ.get('MCP_READINESS_INTERVAL', 30))
+    )
+    readiness_probe.start()
+    
+    # Fill the phone and fuzzy name indexes in the background (opt-in: walks every customer)
+    global customer_sync
+    if os.environ.get('MCP_CUSTOMER_INDEX', 'false').lower() == 'true':
+        customer_sync = mcp_server.customer_tools.customer_sync
+        # The indexes live in each worker's memory, so every worker walks;
+        # stretching the pacing keeps N walks at the upstream cost of one
+        page_delay = float(os.environ.get('MCP_CUSTOMER_INDEX_PAGE_DELAY', 0.5)) * get_worker_count()
+        customer_sync.start(
+            mcp_server.api_client,
+            refresh_interval=float(os.environ.get('MCP_CUSTOMER_INDEX_REFRESH', 3600)),
+            page_delay=page_delay
+        )
+        logger.info("📇 Customer index sync started")
+    
+    # Pull customer and ticket deltas into the local mirror (opt-in via MCP_MIRROR_PATH)
+    global mirror_sync
+    mirror_sync = MirrorSync.from_env(mcp_server.api_client)
+    if mirror_sync is not None:
+        # Tools answer max_staleness reads from the store once a run completes
+        mcp_server.customer_tools.mirror = mirror_sync.store
+        mcp_server.ticket_tools.mirror = mirror_sync.store
+        # Workers share the file; only the first one pulls from Gorgias
+        if worker_id == 0:
+            mirror_sync.start()
+            logger.info(f"🪞 Mirror sync started ({mirror_sync.store.path})")
+        else:
+            logger.info(f"🪞 Reading the mirror synced by worker 0 ({mirror_sync.store.path})")
     
     # Start HTTP server with MCP endpoints
-    http_runner = await start_http_server()
+    with startup_timer.phase("http_start"):
+        http_runner = await start_http_server(reuse_port=reuse_port)
+    startup_timer.report()
+    
+    if runtime.is_enabled():
+        global loop_monitor
+        loop_monitor = runtime.LoopLagMonitor()
+        loop_monitor.start()
+        logger.info(f"⚡ Performance mode enabled (event loop: {runtime.loop_name()})")
     
     logger.info("✅ Gorgias MCP Server is ready!")
     logger.info("🔧 MCP functionality available via HTTP POST to /mcp")
     logger.info("🌊 Streaming available (set stream: true in request params)")
     logger.info("🏥 Healthcheck endpoint available at /health")
     
+    global shutdown
+    shutdown = GracefulShutdown()
+    shutdown.install_signal_handlers()
+    
     try:
-        # Keep the server running
-        while True:
-            await asyncio.sleep(1)
-    except KeyboardInterrupt:
-        logger.info("Server stopped by user")
-    except Exception as e:
-        logger.error(f"Server error: {e}")
-        sys.exit(1)
+        # Serve until Cloud Run sends SIGTERM (or the user presses Ctrl+C)
+        await shutdown.wait_for_stop()
+        logger.info(f"🛑 Received signal {shutdown.signal_received}, shutting down")
     finally:
+        # Stop accepting connections, then let in-flight calls and streams finish
+        for site in list(http_runner.sites):
+            await site.stop()
+        await shutdown.drain(float(os.environ.get('MCP_SHUTDOWN_TIMEOUT', 8)))
+        await job_manager.shutdown()
+        for ws in list(open_websockets):
+            await ws.close(code=WSCloseCode.GOING_AWAY, message=b"Server shutting down")
         await http_runner.cleanup()
+        
+        if loop_monitor is not None:
+            await loop_monitor.stop()
+        await readiness_probe.stop()
+        if customer_sync is not None:
+            await customer_sync.stop()
+        if mirror_sync is not None:
+            await mirror_sync.stop()
+        await mcp_server.api_client.aclose()
+        
+        logger.info(f"📊 Final metrics: {json.dumps(metrics.summary())}")
+        logger.info("👋 Gorgias MCP Server stopped")
+        tracing.shutdown_tracing()
+        shutdown_logging()
+
+def get_worker_count():
+    """Get the number of worker processes from MCP_WORKERS ("auto" = one per CPU)."""
+    value = os.environ.get('MCP_WORKERS', '1').strip().lower()
+    if value == 'auto':
+        try:
+            return len(os.sched_getaffinity(0))
+        except AttributeError:
+            return os.cpu_count() or 1
+    return max(1, int(value))
+
+def _worker_entry(worker_id, stats):
+    """Entry point for a forked worker process."""
+    global worker_stats
+    # The log listener thread does not survive fork(), so start a fresh one
+    configure_logging(force=True)
+    if stats is not None:
+        stats.worker_id = worker_id
+        worker_stats = stats
+    runtime.run(partial(main, reuse_port=True, worker_id=worker_id))
+
+def run():
+    """Run the server in single-process or multi-worker mode."""
+    workers = get_worker_count()
+    
+    if workers > 1 and not reuse_port_supported():
+        logger.warning("SO_REUSEPORT is not supported on this platform; running a single worker")
+        workers = 1
+    
+    if workers == 1:
+        runtime.run(main)
+        return
+    
+    if not check_environment():
+        sys.exit(1)
+    
+    stats = None
+    if os.environ.get('MCP_WORKER_STATS', 'false').lower() == 'true':
+        stats = SharedStats(workers)
+    
+    logger.info(f"🧵 Starting {workers} worker processes sharing port {os.environ.get('PORT', 8080)}")
+    supervisor = WorkerSupervisor(_worker_entry, workers, stats=stats)
+    sys.exit(supervisor.run())
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run()
 
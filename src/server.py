@@ -1,23 +1,37 @@
 """Main MCP server for Gorgias integration."""
 
-import asyncio
-import logging
-import sys
-from typing import Any, Dict, List, Optional
-from mcp.server import Server
-from mcp.server.stdio import stdio_server
-from mcp.types import Tool, TextContent
-from .utils.auth import GorgiasAuth
-from .utils.api_client import GorgiasAPIClient
-from .tools.customers import CustomerTools
-from .tools.tickets import TicketTools
+import time
+
+_BOOT_START = time.perf_counter()
+
+import asyncio  # noqa: E402
+import logging  # noqa: E402
+import sys  # noqa: E402
+import threading  # noqa: E402
+from typing import TYPE_CHECKING, Any, Dict, List, Optional  # noqa: E402
+from .utils.auth import GorgiasAuth  # noqa: E402
+from .utils.api_client import GorgiasAPIClient  # noqa: E402
+from .utils import metrics, runtime, tracing  # noqa: E402
+from .utils.startup import StartupTimer, fast_boot_enabled  # noqa: E402
+from .utils.structured_logging import configure_logging  # noqa: E402
+
+if TYPE_CHECKING:
+    from mcp.server import Server
+    from mcp.types import Tool
+    from .tools.customers import CustomerTools
+    from .tools.tickets import TicketTools
 
 # Configure logging
-logging.basicConfig(level=logging.INFO)
+configure_logging()
 logger = logging.getLogger(__name__)
 
-# Initialize MCP server
-server = Server("gorgias-mcp-server")
+
+def is_error_result(result: str) -> bool:
+    """Whether a tool result reports a failure (tools return errors as text)."""
+    return (
+        result.startswith(("Error", "Unknown tool"))
+        or result.endswith("tools not available")
+    )
 
 
 class GorgiasMCPServer:
@@ -27,23 +41,61 @@ class GorgiasMCPServer:
         """Initialize the MCP server with all tools."""
         self.auth = None
         self.api_client = None
-        self.customer_tools = None
-        self.ticket_tools = None
+        self._customer_tools = None
+        self._ticket_tools = None
+        self._tools_lock = threading.Lock()
+        self._tool_names: Optional[frozenset] = None
         self._initialize_tools()
     
     def _initialize_tools(self):
-        """Initialize authentication and all tool classes."""
+        """Initialize authentication and all tool classes.
+        
+        In fast-boot mode the tool modules (and the MCP SDK they import) are
+        loaded on first use instead.
+        """
         try:
             self.auth = GorgiasAuth()
             self.api_client = GorgiasAPIClient(self.auth)
-            self.customer_tools = CustomerTools(self.api_client)
-            self.ticket_tools = TicketTools(self.api_client)
+            if not fast_boot_enabled():
+                self._load_tools()
             logger.info("Successfully initialized Gorgias MCP server")
         except Exception as e:
             logger.error(f"Failed to initialize Gorgias MCP server: {e}")
             raise
     
-    def get_all_tools(self) -> List[Tool]:
+    def _load_tools(self):
+        """Import and construct the tool classes exactly once."""
+        with self._tools_lock:
+            if self._customer_tools is None:
+                from .tools.customers import CustomerTools
+                self._customer_tools = CustomerTools(self.api_client)
+            if self._ticket_tools is None:
+                from .tools.tickets import TicketTools
+                self._ticket_tools = TicketTools(self.api_client)
+    
+    @property
+    def customer_tools(self) -> Optional["CustomerTools"]:
+        """Customer tools, constructed on first access in fast-boot mode."""
+        if self._customer_tools is None and self.api_client is not None:
+            self._load_tools()
+        return self._customer_tools
+    
+    @customer_tools.setter
+    def customer_tools(self, value: Optional["CustomerTools"]):
+        self._customer_tools = value
+    
+    @property
+    def ticket_tools(self) -> Optional["TicketTools"]:
+        """Ticket tools, constructed on first access in fast-boot mode."""
+        if self._ticket_tools is None and self.api_client is not None:
+            self._load_tools()
+        return self._ticket_tools
+    
+    @ticket_tools.setter
+    def ticket_tools(self, value: Optional["TicketTools"]):
+        self._ticket_tools = value
+    
+    def get_all_tools(self) -> List["Tool"]:
         """Get all available tools from all tool classes.
         
         Returns:
@@ -56,6 +108,16 @@ class GorgiasMCPServer:
             tools.extend(self.ticket_tools.get_tools())
         return tools
     
+    @property
+    def tool_names(self) -> frozenset:
+        """Names of the registered tools (cached once both tool classes exist)."""
+        if self._tool_names is not None:
+            return self._tool_names
+        names = frozenset(tool.name for tool in self.get_all_tools())
+        if self._customer_tools is not None and self._ticket_tools is not None:
+            self._tool_names = names
+        return names
+    
     async def handle_tool_call(self, name: str, arguments: Dict[str, Any]) -> str:
         """Handle tool calls by routing to appropriate tool class.
         
@@ -66,6 +128,27 @@ class GorgiasMCPServer:
         Returns:
             Result of the tool execution.
         """
+        start = time.perf_counter()
+        # Keep arbitrary client-supplied names out of the label set
+        tool_label = name if name in self.tool_names else "unknown"
+        outcome = "error"
+        metrics.tool_calls_in_flight.inc()
+        try:
+            with tracing.start_span("handle_tool_call") as span:
+                result = await self._dispatch_tool_call(name, arguments)
+                if not is_error_result(result):
+                    outcome = "success"
+                else:
+                    span.set_error(result[:200])
+                span.set_attribute("tool.name", tool_label)
+                span.set_attribute("tool.outcome", outcome)
+                return result
+        finally:
+            metrics.tool_calls_in_flight.dec()
+            metrics.record_tool_call(tool_label, time.perf_counter() - start, outcome)
+    
+    async def _dispatch_tool_call(self, name: str, arguments: Dict[str, Any]) -> str:
+        """Route a tool call to the tool class that implements it."""
         try:
             # Route to customer tools
             if name.startswith(("list_customers", "get_customer", "create_customer", 
@@ -73,8 +156,7 @@ class GorgiasMCPServer:
                 if not self.customer_tools:
                     return "Customer tools not available"
                 
-                method = getattr(self.customer_tools, name)
-                return await method(**arguments)
+                return await self._call_tool_method(self.customer_tools, name, arguments)
             
             # Route to ticket tools
             elif name.startswith(("list_tickets", "get_ticket", "create_ticket", 
@@ -82,63 +164,103 @@ class GorgiasMCPServer:
                 if not self.ticket_tools:
                     return "Ticket tools not available"
                 
-                method = getattr(self.ticket_tools, name)
-                return await method(**arguments)
+                return await self._call_tool_method(self.ticket_tools, name, arguments)
             
-            elif name in ["add_customer_email", "set_customer_type"]:
+            elif name in ["add_customer_email", "set_customer_type", "find_customer_by_phone",
+                          "bulk_upsert_customers", "bulk_update_customers", "find_duplicate_customers"]:
                 if not self.customer_tools:
                     return "Customer tools not available"
                 
-                method = getattr(self.customer_tools, name)
-                return await method(**arguments)
+                return await self._call_tool_method(self.customer_tools, name, arguments)
             
             else:
                 return f"Unknown tool: {name}"
                 
         except Exception as e:
-            logger.error(f"Error executing tool {name}: {e}")
+            logger.error("Error executing tool %s: %s", name, e)
             return f"Error executing tool {name}: {str(e)}"
+    
+    async def _call_tool_method(self, tools: Any, name: str, arguments: Dict[str, Any]) -> str:
+        """Invoke a tool method inside its own trace span."""
+        method = getattr(tools, name)
+        with tracing.start_span(f"{type(tools).__name__}.{name}"):
+            return await method(**arguments)
 
 
 # Lazily-initialized server instance
 gorgias_server: Optional[GorgiasMCPServer] = None
+_server_lock = threading.Lock()
 
 
 def _get_server() -> GorgiasMCPServer:
     """Get or initialize the global GorgiasMCPServer instance."""
     global gorgias_server
     if gorgias_server is None:
-        gorgias_server = GorgiasMCPServer()
+        # Double-checked so concurrent first calls build only one instance
+        with _server_lock:
+            if gorgias_server is None:
+                gorgias_server = GorgiasMCPServer()
     return gorgias_server
 
 
-@server.list_tools()
-async def list_tools() -> List[Tool]:
-    """List all available tools.
+def create_server() -> "Server":
+    """Create the stdio MCP server and register the tool handlers.
     
     Returns:
-        List of all available Tool objects.
+        Configured MCP Server instance.
     """
-    return _get_server().get_all_tools()
-
-
-@server.call_tool()
-async def call_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
-    """Call a tool by name with arguments.
+    from mcp.server import Server
+    from mcp.types import TextContent
+    
+    server = Server("gorgias-mcp-server")
     
-    Args:
-        name: Name of the tool to call.
-        arguments: Arguments for the tool.
+    @server.list_tools()
+    async def list_tools() -> List["Tool"]:
+        """List all available tools.
         
-    Returns:
-        List containing the result as TextContent.
-    """
-    result = await _get_server().handle_tool_call(name, arguments)
-    return [TextContent(type="text", text=result)]
+        Returns:
+            List of all available Tool objects.
+        """
+        return _get_server().get_all_tools()
+    
+    @server.call_tool()
+    async def call_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
+        """Call a tool by name with arguments.
+        
+        Args:
+            name: Name of the tool to call.
+            arguments: Arguments for the tool.
+            
+        Returns:
+            List containing the result as TextContent.
+        """
+        result = await _get_server().handle_tool_call(name, arguments)
+        return [TextContent(type="text", text=result)]
+    
+    return server
 
 
 async def main():
     """Main entry point for the MCP server."""
+    startup_timer = StartupTimer(_BOOT_START)
+    startup_timer.mark("imports")
+    tracing.configure_tracing()
+    
+    with startup_timer.phase("mcp_server"):
+        from mcp.server.stdio import stdio_server
+        server = create_server()
+    
+    if not fast_boot_enabled():
+        with startup_timer.phase("tools_init"):
+            _get_server()
+    startup_timer.report()
+    
+    loop_monitor = None
+    if runtime.is_enabled():
+        loop_monitor = runtime.LoopLagMonitor()
+        loop_monitor.start()
+        logger.info(f"Performance mode enabled (event loop: {runtime.loop_name()})")
+    
     try:
         # Run the server with stdio
         async with stdio_server() as (read_stream, write_stream):
@@ -152,7 +274,13 @@ async def main():
     except Exception as e:
         logger.error(f"Server error: {e}")
         raise
+    finally:
+        if loop_monitor is not None:
+            await loop_monitor.stop()
+        if gorgias_server is not None and gorgias_server.api_client is not None:
+            await gorgias_server.api_client.aclose()
+        tracing.shutdown_tracing()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    runtime.run(main)
@@ -1,13 +1,38 @@
 """Customer management tools for Gorgias MCP server."""
 
+import asyncio
+import copy
 import json
 import logging
+import os
 from typing import Any, Dict, List, Optional, Tuple
 from mcp.types import Tool
+from ..utils import bulk, tracing
 from ..utils.api_client import GorgiasAPIClient
+from ..utils.customer_sync import CustomerSync, iter_customer_pages
+from ..utils.dedup import DuplicateDetector
+from ..utils.entity_cache import EntityCache
+from ..utils.fuzzy_index import TrigramIndex
+from ..utils.mirror import MirrorStore, read_mirror, source_label
+from ..utils.pagination import MAX_PAGE_SIZE, more_label, read_page
+from ..utils.phone_index import PhoneIndex, customer_email, normalize_phone
 
 logger = logging.getLogger(__name__)
 
+# Customer type is kept in the note field (Gorgias has no custom customer fields)
+CUSTOMER_TYPE_NOTE = "Customer Type: {} - Professional pet grooming services"
+
+# Customer list filters accepted by bulk_update_customers
+CUSTOMER_FILTERS = ("name", "email", "created_after", "created_before")
+
+# get_customer_overview sections and the fields kept from each record
+OVERVIEW_SECTIONS = ("customer", "tickets", "orders")
+OVERVIEW_TICKET_FIELDS = ("id", "subject", "status", "channel", "priority", "updated_datetime")
+OVERVIEW_ORDER_FIELDS = (
+    "id", "name", "order_number", "financial_status", "fulfillment_status",
+    "total_price", "currency", "created_at"
+)
+
 
 class CustomerTools:
     """Tools for managing Gorgias customers."""
@@ -19,6 +44,13 @@ class CustomerTools:
             api_client: GorgiasAPIClient instance.
         """
         self.api_client = api_client
+        # Local indexes, kept current from every customer record seen
+        self.phone_index = PhoneIndex()
+        self.name_index = TrigramIndex()
+        self.customer_cache = EntityCache.from_env()
+        self.customer_sync = CustomerSync([self.phone_index, self.name_index, self.customer_cache])
+        # Local SQLite mirror for max_staleness reads (attached when the sync runs)
+        self.mirror: Optional[MirrorStore] = None
     
     def get_tools(self) -> List[Tool]:
         """Get list of customer-related tools.
@@ -29,15 +61,22 @@ class CustomerTools:
         return [
             Tool(
                 name="list_customers",
-                description="List all customers with optional filtering by name, email, or date",
+                description=(
+                    "List customers with optional filtering by name, email, or date, one page at a time; "
+                    "pass the returned next_page_token as page_token for the next page"
+                ),
                 inputSchema={
                     "type": "object",
                     "properties": {
                         "limit": {
                             "type": "integer",
-                            "description": "Maximum number of customers to return",
+                            "description": f"Customers per page (at most {MAX_PAGE_SIZE})",
                             "default": 50
                         },
+                        "page_token": {
+                            "type": "string",
+                            "description": "next_page_token from a previous page, to continue the same listing"
+                        },
                         "name": {
                             "type": "string",
                             "description": "Filter by customer full name (e.g., 'Tony Katz')"
@@ -53,6 +92,10 @@ class CustomerTools:
                         "created_before": {
                             "type": "string",
                             "description": "Filter customers created before this date (ISO format)"
+                        },
+                        "max_staleness": {
+                            "type": "number",
+                            "description": "Accept data up to this many seconds old from the local mirror (omit for live data)"
                         }
                     }
                 }
@@ -141,7 +184,10 @@ class CustomerTools:
             ),
             Tool(
                 name="search_customers",
-                description="Search customers by name or email. Uses the Gorgias customers API with name/email filters.",
+                description=(
+                    "Search customers by name or email. Uses the Gorgias customers API with "
+                    "name/email filters, or mode 'fuzzy' for ranked matches that tolerate misspellings."
+                ),
                 inputSchema={
                     "type": "object",
                     "properties": {
@@ -157,13 +203,29 @@ class CustomerTools:
                             "type": "integer",
                             "description": "Maximum number of results",
                             "default": 50
+                        },
+                        "mode": {
+                            "type": "string",
+                            "enum": ["exact", "fuzzy"],
+                            "description": (
+                                "'exact' uses the Gorgias filters; 'fuzzy' ranks local trigram "
+                                "matches (e.g. 'Tony Kats' finds 'Tony Katz')"
+                            ),
+                            "default": "exact"
+                        },
+                        "max_staleness": {
+                            "type": "number",
+                            "description": "Accept data up to this many seconds old from the local mirror (omit for live data)"
                         }
                     }
                 }
             ),
             Tool(
                 name="get_customer_tickets",
-                description="Get all tickets for a specific customer",
+                description=(
+                    "Get a customer's tickets one page at a time; pass the returned next_page_token "
+                    "as page_token for older tickets"
+                ),
                 inputSchema={
                     "type": "object",
                     "properties": {
@@ -173,8 +235,48 @@ class CustomerTools:
                         },
                         "limit": {
                             "type": "integer",
-                            "description": "Maximum number of tickets to return",
+                            "description": f"Tickets per page (at most {MAX_PAGE_SIZE})",
                             "default": 50
+                        },
+                        "page_token": {
+                            "type": "string",
+                            "description": "next_page_token from a previous page, to continue the same listing"
+                        },
+                        "max_staleness": {
+                            "type": "number",
+                            "description": "Accept data up to this many seconds old from the local mirror (omit for live data)"
+                        }
+                    },
+                    "required": ["customer_id"]
+                }
+            ),
+            Tool(
+                name="get_customer_overview",
+                description=(
+                    "Brief on a customer in one call: profile, recent tickets and recent orders, "
+                    "fetched concurrently. Sections that fail or exceed their time budget are "
+                    "reported under 'errors' while the rest are still returned."
+                ),
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "customer_id": {
+                            "type": "integer",
+                            "description": "ID of the customer"
+                        },
+                        "sections": {
+                            "type": "array",
+                            "items": {"type": "string", "enum": list(OVERVIEW_SECTIONS)},
+                            "description": "Sections to include (default: all)"
+                        },
+                        "limit": {
+                            "type": "integer",
+                            "description": "Most recent tickets and orders to include",
+                            "default": 5
+                        },
+                        "budget_ms": {
+                            "type": "integer",
+                            "description": "Time budget per section in milliseconds (default 2500)"
                         }
                     },
                     "required": ["customer_id"]
@@ -220,42 +322,194 @@ class CustomerTools:
                     },
                     "required": ["customer_id", "customer_type"]
                 }
+            ),
+            Tool(
+                name="find_customer_by_phone",
+                description="Find customers by phone number (any format) using the local phone index",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "phone": {
+                            "type": "string",
+                            "description": "Caller phone number, e.g. '+1 555 010 1234'"
+                        }
+                    },
+                    "required": ["phone"]
+                }
+            ),
+            Tool(
+                name="bulk_upsert_customers",
+                description=(
+                    "Create or update many customers from CSV or JSONL (columns/keys as for "
+                    "create_customer). Rows run concurrently under the bulk rate limit; returns "
+                    "per-row outcomes and throughput. Run large imports with background: true."
+                ),
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "data": {
+                            "type": "string",
+                            "description": "Inline CSV (with header row) or JSONL text"
+                        },
+                        "path": {
+                            "type": "string",
+                            "description": "File to stream, relative to the server's import directory"
+                        },
+                        "format": {
+                            "type": "string",
+                            "enum": ["csv", "jsonl"],
+                            "description": "Input format (detected when omitted)"
+                        },
+                        "concurrency": {
+                            "type": "integer",
+                            "description": "Rows processed at the same time (default 4)"
+                        },
+                        "report": {
+                            "type": "string",
+                            "enum": ["all", "failures"],
+                            "description": "Which per-row outcomes to include",
+                            "default": "all"
+                        }
+                    }
+                }
+            ),
+            Tool(
+                name="find_duplicate_customers",
+                description=(
+                    "Scan every customer for likely duplicates: clusters sharing an email (case and "
+                    "+tag insensitive) or phone number, plus customers sharing a full name. Walks the "
+                    "whole customer base, so run it with background: true."
+                ),
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "include_names": {
+                            "type": "boolean",
+                            "description": "Also report same-name groups",
+                            "default": True
+                        },
+                        "max_clusters": {
+                            "type": "integer",
+                            "description": "Largest clusters and name groups to list",
+                            "default": 50
+                        },
+                        "max_staleness": {
+                            "type": "number",
+                            "description": (
+                                "Scan the local mirror instead if it is at most this many seconds old "
+                                "(customers deleted since its last daily sweep may still appear)"
+                            )
+                        }
+                    }
+                }
+            ),
+            Tool(
+                name="bulk_update_customers",
+                description=(
+                    "Set the customer type and/or add or remove channels (e.g. emails) for many "
+                    "customers at once, selected by ID list or by a list_customers filter. "
+                    "Returns counts and the failures only."
+                ),
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "customer_ids": {
+                            "type": "array",
+                            "items": {"type": "integer"},
+                            "description": "Customers to update"
+                        },
+                        "filter": {
+                            "type": "object",
+                            "properties": {
+                                "name": {"type": "string"},
+                                "email": {"type": "string"},
+                                "created_after": {"type": "string"},
+                                "created_before": {"type": "string"}
+                            },
+                            "description": "Update every customer matching these list_customers filters"
+                        },
+                        "customer_type": {
+                            "type": "string",
+                            "description": "Customer type to set (e.g., Groomer, Customer, VIP)"
+                        },
+                        "add_channels": {
+                            "type": "array",
+                            "items": {
+                                "type": "object",
+                                "properties": {
+                                    "type": {"type": "string", "description": "email or phone"},
+                                    "address": {"type": "string"},
+                                    "preferred": {"type": "boolean", "default": False}
+                                },
+                                "required": ["type", "address"]
+                            },
+                            "description": "Channels to add where missing"
+                        },
+                        "remove_channels": {
+                            "type": "array",
+                            "items": {
+                                "type": "object",
+                                "properties": {
+                                    "type": {"type": "string"},
+                                    "address": {"type": "string"}
+                                },
+                                "required": ["type", "address"]
+                            },
+                            "description": "Channels to remove where present"
+                        },
+                        "concurrency": {
+                            "type": "integer",
+                            "description": "Customers updated at the same time (default 4)"
+                        },
+                        "max_customers": {
+                            "type": "integer",
+                            "description": "Stop after this many filter matches",
+                            "default": 10000
+                        }
+                    }
+                }
             )
         ]
     
     def _format_json(self, data: Any) -> str:
         """Format data as a pretty-printed JSON string."""
-        try:
-            return json.dumps(data, indent=2, default=str)
-        except (TypeError, ValueError):
-            return str(data)
+        with tracing.start_span("format_json"):
+            try:
+                return json.dumps(data, indent=2, default=str)
+            except (TypeError, ValueError):
+                return str(data)
 
     async def list_customers(self, **kwargs) -> str:
-        """List customers with optional filtering.
+        """List one page of customers with optional filtering.
         
         Args:
-            **kwargs: Filter parameters (name, email, created_after, created_before, limit).
+            **kwargs: Filter parameters (name, email, created_after, created_before),
+                ``limit`` (page size), ``page_token`` to continue a previous
+                listing, and ``max_staleness`` to allow answering from the
+                local mirror.
             
         Returns:
-            JSON string of customers data.
+            JSON string of the page and its ``next_page_token``.
         """
         try:
-            # Build query parameters
-            params = {}
-            if "limit" in kwargs:
-                params["limit"] = kwargs["limit"]
-            if "name" in kwargs:
-                params["name"] = kwargs["name"]
-            if "email" in kwargs:
-                params["email"] = kwargs["email"]
-            if "created_after" in kwargs:
-                params["created_after"] = kwargs["created_after"]
-            if "created_before" in kwargs:
-                params["created_before"] = kwargs["created_before"]
-            
-            data = await self.api_client.get("customers", params=params)
-            count = len(data.get("data", [])) if isinstance(data, dict) else 0
-            return f"Found {count} customers:\n{self._format_json(data)}"
+            max_staleness = kwargs.get("max_staleness")
+            filters = {key: kwargs.get(key) for key in CUSTOMER_FILTERS}
+            data = await read_page(
+                self.api_client, "customers", "list_customers", filters,
+                limit=kwargs.get("limit"),
+                page_token=kwargs.get("page_token"),
+                mirror=self.mirror,
+                max_staleness=max_staleness,
+                mirror_query=lambda store, query, limit, offset: store.query_customers(
+                    **query, limit=limit, offset=offset
+                ),
+            )
+            if data["meta"].get("source") != "mirror":
+                self.customer_sync.index_response(data)
+            return (
+                f"Found {len(data['data'])} customers{source_label(data, max_staleness)}{more_label(data)}:\n"
+                f"{self._format_json(data)}"
+            )
             
         except Exception as e:
             return f"Error listing customers: {str(e)}"
@@ -271,6 +525,7 @@ class CustomerTools:
         """
         try:
             data = await self.api_client.get(f"customers/{customer_id}")
+            self.customer_sync.index_customer(data)
             return f"Customer {customer_id} details:\n{self._format_json(data)}"
             
         except Exception as e:
@@ -282,9 +537,13 @@ class CustomerTools:
         This method follows the workflow requested by the user:
 
         * Check if a customer already exists using email/phone identifiers.
-        * If the customer exists, append/update the record with any extra data.
-        * If the customer does not exist, create the minimal viable record and
-          then append the additional details.
+        * If the customer exists, append/update the record with any extra data,
+          reusing the record returned by the search.
+        * If the customer does not exist, create it with all fields in a
+          single request.
+
+        New customers take one or two round trips (search + create) and
+        existing ones two (search + update, none if nothing changed).
 
         Args:
             **kwargs: Customer creation parameters.
@@ -294,71 +553,88 @@ class CustomerTools:
         """
 
         try:
-            email: Optional[str] = kwargs.get("email")
-            phone: Optional[str] = kwargs.get("phone")
+            _, _, messages = await self._upsert_customer(kwargs)
+            return "\n".join(messages)
 
-            if not email and not phone:
-                return "Error creating customer: either email or phone must be provided"
+        except Exception as e:
+            return f"Error creating customer: {str(e)}"
 
-            messages: List[str] = []
+    async def _upsert_customer(self, kwargs: Dict[str, Any]) -> Tuple[str, Any, List[str]]:
+        """Create or update one customer.
 
-            existing = await self._find_existing_customer(email=email, phone=phone)
+        Returns:
+            ``(status, customer_id, messages)`` where status is ``created``,
+            ``updated``, ``unchanged`` or ``failed``.
 
-            # Extract additional data to append after ensuring the record exists
-            update_payload, channel_payload = self._build_update_payload(kwargs)
+        Raises:
+            ValueError: If neither email nor phone is given.
+        """
+        email: Optional[str] = kwargs.get("email")
+        phone: Optional[str] = kwargs.get("phone")
 
-            if update_payload.get("email") == email and len(update_payload) == 1:
-                update_payload.pop("email")
+        if not email and not phone:
+            raise ValueError("either email or phone must be provided")
 
-            if existing:
-                customer_id = existing.get("id")
-                messages.append(
-                    f"Customer already exists (ID: {customer_id}). Skipping creation."
-                )
+        existing = await self._find_existing_customer(email=email, phone=phone)
 
-                update_messages = await self._append_customer_data(
-                    customer_id,
-                    update_payload,
-                    channel_payload,
-                )
-                messages.extend(update_messages)
-            else:
-                create_payload = self._build_minimal_create_payload(email=email, phone=phone)
-                created = await self.api_client.post("customers", data=create_payload)
-                customer_id = created.get("id", "unknown") if isinstance(created, dict) else "unknown"
-                messages.append(
-                    f"Created customer {customer_id}:\n{self._format_json(created)}"
-                )
+        # Extract additional data to append after ensuring the record exists
+        update_payload, channel_payload = self._build_update_payload(kwargs)
 
-                update_messages = await self._append_customer_data(
-                    customer_id,
-                    update_payload,
-                    channel_payload,
-                )
-                messages.extend(update_messages)
+        if email and update_payload.get("email") == email and len(update_payload) == 1:
+            update_payload.pop("email")
 
-            return "\n".join(messages)
+        if existing:
+            customer_id = existing.get("id")
+            status, update_messages = await self._append_customer_data(
+                customer_id,
+                update_payload,
+                channel_payload,
+                existing=existing,
+            )
+            messages = [f"Customer already exists (ID: {customer_id}). Skipping creation."]
+            return status, customer_id, messages + update_messages
 
-        except Exception as e:
-            return f"Error creating customer: {str(e)}"
+        create_payload = self._build_create_payload(
+            email=email,
+            phone=phone,
+            update_payload=update_payload,
+            channel_payload=channel_payload,
+        )
+        created = await self.api_client.post("customers", data=create_payload)
+        self.customer_sync.index_customer(created)
+        customer_id = created.get("id", "unknown") if isinstance(created, dict) else "unknown"
+        return "created", customer_id, [f"Created customer {customer_id}:\n{self._format_json(created)}"]
 
     async def _append_customer_data(
         self,
         customer_id: Any,
         update_payload: Dict[str, Any],
-        channel_payload: Optional[Dict[str, Any]]
-    ) -> List[str]:
-        """Append additional details to an existing customer record."""
+        channel_payload: Optional[Dict[str, Any]],
+        existing: Optional[Dict[str, Any]] = None
+    ) -> Tuple[str, List[str]]:
+        """Append additional details to an existing customer record.
+
+        ``existing`` is the record already in hand (e.g. from the search);
+        it is only re-fetched when missing or without its channels.
+
+        Returns:
+            ``(status, messages)`` where status is ``updated``, ``unchanged``
+            or ``failed``.
+        """
 
         messages: List[str] = []
 
+        if not update_payload and not channel_payload:
+            return "unchanged", [f"No additional data provided to append for customer {customer_id}."]
+
         # Get existing customer data to preserve channels
-        existing = await self._get_customer_details(customer_id)
+        if existing is None or "channels" not in existing:
+            existing = await self._get_customer_details(customer_id)
         if existing is None:
             messages.append(
                 f"Warning: Unable to retrieve customer {customer_id}; skipping update."
             )
-            return messages
+            return "failed", messages
 
         # Build the complete update payload
         base_payload = self._build_base_update_payload(existing)
@@ -369,7 +645,7 @@ class CustomerTools:
         
         # Preserve existing channels (except phone if we're updating it)
         phone_updated = False
-        for channel in existing.get("channels", []):
+        for channel in existing.get("channels") or []:
             if channel.get("type") == "phone" and channel_payload:
                 # Skip old phone channel if we're updating phone
                 phone_updated = True
@@ -383,7 +659,7 @@ class CustomerTools:
             channels.append(channel_payload)
         elif not phone_updated:
             # If no phone update requested, keep existing phone channels
-            for channel in existing.get("channels", []):
+            for channel in existing.get("channels") or []:
                 if channel.get("type") == "phone":
                     channels.append(channel)
 
@@ -391,20 +667,24 @@ class CustomerTools:
         if channels:
             merged_payload["channels"] = channels
 
-        if not merged_payload:
+        status = "unchanged"
+        if not self._has_changes(existing, update_payload, channel_payload):
+            messages.append(f"Customer {customer_id} is already up to date.")
+        elif not merged_payload:
             messages.append(
                 f"Skipped updating customer {customer_id}: no valid data to send."
             )
         else:
             try:
-                updated = await self.api_client.put(
-                    f"customers/{customer_id}",
-                    data=merged_payload,
-                )
+                updated = await self._put_customer(customer_id, merged_payload)
+                status = "updated"
                 messages.append(
                     f"Updated customer {customer_id}:\n{self._format_json(updated)}"
                 )
             except Exception as update_error:
+                if bulk.rate_limit_delay(update_error) is not None:
+                    raise
+                status = "failed"
                 messages.append(
                     f"Warning: Failed to update customer {customer_id}: {update_error}"
                 )
@@ -412,7 +692,7 @@ class CustomerTools:
         if not messages:
             messages.append(f"No additional data provided to append for customer {customer_id}.")
 
-        return messages
+        return status, messages
 
     async def _find_existing_customer(
         self,
@@ -433,16 +713,66 @@ class CustomerTools:
                 if data:
                     return data[0]
             except Exception as e:
-                logger.debug(f"Failed to search customer by email {email}: {e}")
+                # Creating after a throttled search could duplicate the customer
+                if bulk.rate_limit_delay(e) is not None:
+                    raise
+                logger.debug("Failed to search customer by email: %s", e)
 
-        # Note: Gorgias API doesn't support phone-based search directly
-        # Phone lookup would require fetching customers and filtering locally
-        # For now, we only support email-based lookup
-        if phone and not email:
-            logger.debug(f"Phone-only lookup not supported by Gorgias API: {phone}")
+        # Gorgias API doesn't support phone-based search, so use the local index.
+        # The summary has no channels, so an update re-fetches the full record.
+        if phone:
+            matches = self.phone_index.lookup(phone)
+            if matches:
+                return matches[0]
 
         return None
 
+    def _has_changes(
+        self,
+        existing: Dict[str, Any],
+        update_payload: Dict[str, Any],
+        channel_payload: Optional[Dict[str, Any]]
+    ) -> bool:
+        """Check whether an update would change the existing record."""
+
+        for key, value in update_payload.items():
+            if existing.get(key) != value:
+                return True
+
+        if channel_payload:
+            # The same number in another format is not a change
+            phones = [
+                normalize_phone(channel.get("address"))
+                for channel in existing.get("channels") or []
+                if channel.get("type") == "phone"
+            ]
+            if phones != [normalize_phone(channel_payload["address"])]:
+                return True
+
+        return False
+
+    def _build_create_payload(
+        self,
+        *,
+        email: Optional[str],
+        phone: Optional[str],
+        update_payload: Dict[str, Any],
+        channel_payload: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Create the payload for a new customer including all known fields."""
+
+        payload = self._build_minimal_create_payload(email=email, phone=phone)
+        payload.update(update_payload)
+
+        if channel_payload and email:
+            # Listing channels replaces the defaults, so keep the email one too
+            payload["channels"] = [
+                {"type": "email", "address": email, "preferred": True},
+                channel_payload,
+            ]
+
+        return payload
+
     def _build_minimal_create_payload(
         self,
         *,
@@ -522,14 +852,34 @@ class CustomerTools:
         return update_payload, channel_payload
 
     async def _get_customer_details(self, customer_id: Any) -> Optional[Dict[str, Any]]:
-        """Retrieve the latest customer details to support update operations."""
+        """Retrieve the latest customer details to support update operations.
+
+        A fresh cached record (from a recent read or write) is used as is;
+        otherwise the customer is fetched.
+        """
 
+        cached = self.customer_cache.get(customer_id)
+        if cached is not None:
+            return cached
         try:
             data = await self.api_client.get(f"customers/{customer_id}")
+            self.customer_sync.index_customer(data)
             return data if isinstance(data, dict) else None
         except Exception:
             return None
 
+    async def _put_customer(self, customer_id: Any, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Update a customer and write the response through to the local indexes."""
+
+        try:
+            result = await self.api_client.put(f"customers/{customer_id}", data=data)
+        except Exception:
+            # The write may or may not have landed, so the cached base is unreliable
+            self.customer_cache.invalidate(customer_id)
+            raise
+        self.customer_sync.index_customer(result)
+        return result
+
     def _build_base_update_payload(
         self,
         existing: Optional[Dict[str, Any]]
@@ -570,7 +920,7 @@ class CustomerTools:
             if not update_payload and not channel_payload:
                 return f"No valid update fields provided for customer {customer_id}."
 
-            messages = await self._append_customer_data(
+            _, messages = await self._append_customer_data(
                 customer_id,
                 update_payload,
                 channel_payload,
@@ -581,18 +931,34 @@ class CustomerTools:
         except Exception as e:
             return f"Error updating customer {customer_id}: {str(e)}"
     
-    async def search_customers(self, name: str = None, email: str = None, limit: int = 50) -> str:
-        """Search customers by name or email using Gorgias API filters.
+    async def search_customers(
+        self,
+        name: str = None,
+        email: str = None,
+        limit: int = 50,
+        mode: str = "exact",
+        max_staleness: Optional[float] = None
+    ) -> str:
+        """Search customers by name or email.
         
         Args:
             name: Customer name to search for.
             email: Customer email to search for.
             limit: Maximum number of results.
+            mode: "exact" for Gorgias API filters, "fuzzy" for the local
+                trigram index.
+            max_staleness: Seconds of lag acceptable to answer an exact
+                search from the local mirror.
             
         Returns:
             JSON string of search results.
         """
         try:
+            if mode == "fuzzy":
+                return await self._fuzzy_search(name, email, limit)
+            elif mode != "exact":
+                return f"Error searching customers: unknown mode '{mode}' (expected exact or fuzzy)"
+            
             params = {"limit": limit}
             search_terms = []
             
@@ -606,43 +972,182 @@ class CustomerTools:
             if not search_terms:
                 return "Error: Please provide either 'name' or 'email' to search for."
             
-            data = await self.api_client.get("customers", params=params)
+            data = await read_mirror(self.mirror, "customers", max_staleness, lambda store: store.query_customers(
+                name=name, email=email, limit=limit
+            ))
+            if data is None:
+                data = await self.api_client.get("customers", params=params)
+                self.customer_sync.index_response(data)
             count = len(data.get("data", [])) if isinstance(data, dict) else 0
             search_desc = " and ".join(search_terms)
             return (
-                f"Found {count} customers matching {search_desc}:\n"
+                f"Found {count} customers matching {search_desc}{source_label(data, max_staleness)}:\n"
                 f"{self._format_json(data)}"
             )
             
         except Exception as e:
             return f"Error searching customers: {str(e)}"
     
-    async def get_customer_tickets(self, customer_id: int, limit: int = 50) -> str:
-        """Get all tickets for a specific customer.
+    async def _fuzzy_search(self, name: Optional[str], email: Optional[str], limit: int) -> str:
+        """Rank customers from the local trigram index.
+        
+        Until a full sync has completed the index only holds customers this
+        process has already seen, so the exact API search runs first and its
+        results are indexed before ranking; the header says coverage is partial.
+        """
+        query = name or email
+        if not query:
+            return "Error: Please provide either 'name' or 'email' to search for."
+        
+        field = "name" if name else "email"
+        coverage = ""
+        if not self.customer_sync.complete:
+            exact = await self.api_client.get("customers", params={"limit": limit, field: query})
+            self.customer_sync.index_response(exact)
+            coverage = f" (partial index of {len(self.name_index)} customers, exact API matches included)"
+        
+        matches = self.name_index.search(query, limit=limit)
+        return (
+            f"Found {len(matches)} customers fuzzily matching {field}='{query}'{coverage}:\n"
+            f"{self._format_json(matches)}"
+        )
+    
+    async def get_customer_tickets(
+        self,
+        customer_id: int,
+        limit: int = 50,
+        page_token: Optional[str] = None,
+        max_staleness: Optional[float] = None
+    ) -> str:
+        """Get one page of tickets for a specific customer.
         
         Args:
             customer_id: ID of the customer.
-            limit: Maximum number of tickets to return.
+            limit: Tickets per page.
+            page_token: ``next_page_token`` of the previous page.
+            max_staleness: Seconds of lag acceptable to answer from the
+                local mirror.
             
         Returns:
-            JSON string of customer tickets.
+            JSON string of the page and its ``next_page_token``.
         """
         try:
-            params = {
-                "customer_id": customer_id,
-                "limit": limit
-            }
-            
-            data = await self.api_client.get("tickets", params=params)
-            count = len(data.get("data", [])) if isinstance(data, dict) else 0
+            data = await read_page(
+                self.api_client, "tickets", "get_customer_tickets", {"customer_id": customer_id},
+                limit=limit,
+                page_token=page_token,
+                mirror=self.mirror,
+                max_staleness=max_staleness,
+                mirror_query=lambda store, query, limit, offset: store.query_tickets(
+                    **query, limit=limit, offset=offset
+                ),
+            )
             return (
-                f"Found {count} tickets for customer {customer_id}:\n"
+                f"Found {len(data['data'])} tickets for customer {customer_id}"
+                f"{source_label(data, max_staleness)}{more_label(data)}:\n"
                 f"{self._format_json(data)}"
             )
             
         except Exception as e:
             return f"Error getting tickets for customer {customer_id}: {str(e)}"
     
+    async def get_customer_overview(
+        self,
+        customer_id: int,
+        sections: Optional[List[str]] = None,
+        limit: int = 5,
+        budget_ms: Optional[int] = None
+    ) -> str:
+        """Fetch a customer's profile, tickets and orders concurrently.
+        
+        Each section runs under its own time budget; a section that fails
+        or runs out of time is reported in ``errors`` without holding back
+        the others.
+        
+        Args:
+            customer_id: ID of the customer.
+            sections: Sections to include (customer, tickets, orders).
+            limit: Most recent tickets and orders to include.
+            budget_ms: Time budget per section in milliseconds.
+            
+        Returns:
+            JSON string of the merged, compact overview.
+        """
+        try:
+            sections = [section for section in (sections or OVERVIEW_SECTIONS) if section in OVERVIEW_SECTIONS]
+            if not sections:
+                return f"Error: 'sections' must contain one of {', '.join(OVERVIEW_SECTIONS)}"
+            if budget_ms is None:
+                budget_ms = int(os.getenv("MCP_OVERVIEW_BUDGET_MS", "2500"))
+            budget = budget_ms / 1000
+            
+            fetchers = {
+                "customer": lambda: self._overview_customer(customer_id),
+                "tickets": lambda: self._overview_list("tickets", customer_id, limit, OVERVIEW_TICKET_FIELDS),
+                "orders": lambda: self._overview_list("orders", customer_id, limit, OVERVIEW_ORDER_FIELDS),
+            }
+            
+            async def run(section: str) -> Any:
+                with tracing.start_span(f"overview.{section}") as span:
+                    try:
+                        return await asyncio.wait_for(fetchers[section](), budget)
+                    except asyncio.TimeoutError:
+                        span.set_error("budget exceeded")
+                        raise TimeoutError(f"timed out after {budget_ms} ms")
+            
+            results = await asyncio.gather(*(run(section) for section in sections), return_exceptions=True)
+            
+            overview: Dict[str, Any] = {"customer_id": customer_id}
+            errors: Dict[str, str] = {}
+            for section, result in zip(sections, results):
+                if isinstance(result, Exception):
+                    errors[section] = str(result) or type(result).__name__
+                else:
+                    overview[section] = result
+            if len(errors) == len(sections):
+                details = "; ".join(f"{section}: {error}" for section, error in errors.items())
+                return f"Error getting overview for customer {customer_id}: {details}"
+            if errors:
+                overview["errors"] = errors
+            
+            partial = f" (partial: {', '.join(errors)} unavailable)" if errors else ""
+            return f"Customer {customer_id} overview{partial}:\n{self._format_json(overview)}"
+            
+        except Exception as e:
+            return f"Error getting overview for customer {customer_id}: {str(e)}"
+    
+    async def _overview_customer(self, customer_id: Any) -> Dict[str, Any]:
+        """Compact profile, from the write-through cache when fresh."""
+        customer = self.customer_cache.get(customer_id)
+        if customer is None:
+            customer = await self.api_client.get(f"customers/{customer_id}")
+            self.customer_sync.index_customer(customer)
+        channels = customer.get("channels") or []
+        return {
+            "id": customer.get("id"),
+            "name": customer.get("name"),
+            "email": customer_email(customer),
+            "phones": [c.get("address") for c in channels if c.get("type") == "phone"],
+            "language": customer.get("language"),
+            "note": customer.get("note"),
+            "created_datetime": customer.get("created_datetime"),
+        }
+    
+    async def _overview_list(
+        self,
+        endpoint: str,
+        customer_id: Any,
+        limit: int,
+        fields: Tuple[str, ...]
+    ) -> List[Dict[str, Any]]:
+        """Most recent records of a customer, trimmed to ``fields``."""
+        data = await self.api_client.get(endpoint, params={"customer_id": customer_id, "limit": limit})
+        items = data.get("data", []) if isinstance(data, dict) else []
+        return [
+            {field: item[field] for field in fields if item.get(field) is not None}
+            for item in items[:limit]
+        ]
+    
     async def add_customer_email(self, customer_id: int, email: str, preferred: bool = False) -> str:
         """Add an additional email address to a customer.
         
@@ -661,7 +1166,7 @@ class CustomerTools:
                 return f"Error: Customer {customer_id} not found"
             
             # Build channels array preserving existing channels
-            channels = existing.get("channels", []).copy()
+            channels = existing.get("channels") or [].copy()
             
             # Add new email channel
             new_email_channel = {
@@ -686,7 +1191,7 @@ class CustomerTools:
             if existing.get("note"):
                 update_data["note"] = existing.get("note")
             
-            result = await self.api_client.put(f"customers/{customer_id}", data=update_data)
+            result = await self._put_customer(customer_id, update_data)
             
             email_count = len([c for c in result.get("channels", []) if c.get("type") == "email"])
             return (
@@ -720,7 +1225,7 @@ class CustomerTools:
                 "firstname": existing.get("firstname"),
                 "lastname": existing.get("lastname"),
                 "email": existing.get("email"),
-                "note": f"Customer Type: {customer_type} - Professional pet grooming services"
+                "note": CUSTOMER_TYPE_NOTE.format(customer_type)
             }
             
             # Include channels if they exist
@@ -731,7 +1236,7 @@ class CustomerTools:
             if existing.get("language"):
                 update_data["language"] = existing.get("language")
             
-            result = await self.api_client.put(f"customers/{customer_id}", data=update_data)
+            result = await self._put_customer(customer_id, update_data)
             
             return (
                 f"Successfully set customer type to '{customer_type}' for customer {customer_id}. "
@@ -741,5 +1246,318 @@ class CustomerTools:
             
         except Exception as e:
             return f"Error setting customer type for customer {customer_id}: {str(e)}"
-
-
+    
+    async def find_customer_by_phone(self, phone: str) -> str:
+        """Find customers by phone number using the local phone index.
+        
+        Args:
+            phone: Phone number in any common format.
+            
+        Returns:
+            JSON string of matching customer summaries.
+        """
+        try:
+            normalized = normalize_phone(phone)
+            if normalized is None:
+                return f"Error: '{phone}' is not a valid phone number"
+            
+            matches = self.phone_index.lookup(normalized)
+            if matches:
+                return (
+                    f"Found {len(matches)} customers with phone {normalized}:\n"
+                    f"{self._format_json(matches)}"
+                )
+            
+            if self.customer_sync.complete:
+                return f"No customer found with phone {normalized}"
+            return (
+                f"No customer found with phone {normalized} "
+                f"(phone index not fully synced yet; {self.customer_sync.customers_scanned} customers scanned)"
+            )
+            
+        except Exception as e:
+            return f"Error finding customer by phone {phone}: {str(e)}"
+    
+    async def bulk_upsert_customers(
+        self,
+        data: Optional[str] = None,
+        path: Optional[str] = None,
+        format: Optional[str] = None,
+        concurrency: Optional[int] = None,
+        report: str = "all"
+    ) -> str:
+        """Create or update customers from a CSV or JSONL stream.
+        
+        Rows go through the same upsert as ``create_customer``. Input is read
+        lazily, rows run ``concurrency`` at a time, and every upstream request
+        waits for the bulk rate limiter (``MCP_BULK_RATE``).
+        
+        Args:
+            data: Inline CSV (with header row) or JSONL text.
+            path: File relative to ``MCP_BULK_IMPORT_DIR``.
+            format: ``csv`` or ``jsonl``; detected when omitted.
+            concurrency: Rows processed at the same time.
+            report: ``all`` or ``failures`` per-row outcomes.
+            
+        Returns:
+            Summary with throughput and per-row outcomes.
+        """
+        try:
+            if not data and not path:
+                return "Error: Please provide either 'data' or 'path' to import."
+            
+            # Same indexes, cache and upsert logic, but every request is rate limited
+            client = bulk.RateLimitedClient(self.api_client, bulk.RateLimiter.from_env())
+            paced = copy.copy(self)
+            paced.api_client = client
+            
+            async def upsert_row(item: Tuple[int, Any]) -> Dict[str, Any]:
+                number, record = item
+                if isinstance(record, Exception):
+                    return {"row": number, "status": "failed", "error": str(record)}
+                try:
+                    status, customer_id, messages = await bulk.with_rate_limit_retries(
+                        lambda: paced._upsert_customer(record)
+                    )
+                except Exception as e:
+                    return {"row": number, "status": "failed", "error": str(e)}
+                outcome = {"row": number, "status": status, "customer_id": customer_id}
+                if status == "failed":
+                    outcome["error"] = messages[-1]
+                return outcome
+            
+            outcomes: List[Dict[str, Any]] = []
+            
+            def keep(outcome: Dict[str, Any]):
+                if report == "all" or outcome["status"] == "failed":
+                    outcomes.append(outcome)
+            
+            stats = bulk.BulkStats("bulk_upsert_customers")
+            await bulk.run_bulk(
+                bulk.iter_records(data=data, path=path, fmt=format),
+                upsert_row,
+                bulk.bulk_concurrency(concurrency),
+                stats,
+                on_result=keep,
+            )
+            
+            outcomes.sort(key=lambda outcome: outcome["row"])
+            summary = stats.to_dict(upstream_requests=client.requests)
+            return (
+                f"Bulk upsert processed {summary['rows']} rows in {summary['elapsed_s']}s "
+                f"({summary['rows_per_s']} rows/s):\n"
+                f"{self._format_json({'summary': summary, 'rows': outcomes})}"
+            )
+            
+        except Exception as e:
+            return f"Error bulk upserting customers: {str(e)}"
+    
+    def _build_bulk_update_payload(
+        self,
+        existing: Dict[str, Any],
+        customer_type: Optional[str],
+        add_channels: List[Dict[str, Any]],
+        remove_channels: List[Dict[str, Any]]
+    ) -> Optional[Dict[str, Any]]:
+        """Build the PUT payload for a bulk mutation, or None if nothing changes."""
+        
+        def key(channel: Dict[str, Any]) -> Tuple[Any, str]:
+            return channel.get("type"), str(channel.get("address") or "").strip().lower()
+        
+        removals = {key(channel) for channel in remove_channels}
+        current = existing.get("channels") or []
+        channels = [channel for channel in current if key(channel) not in removals]
+        present = {key(channel) for channel in channels}
+        for channel in add_channels:
+            if key(channel) not in present:
+                present.add(key(channel))
+                channels.append({
+                    "type": channel["type"],
+                    "address": channel["address"],
+                    "preferred": bool(channel.get("preferred", False))
+                })
+        
+        note = CUSTOMER_TYPE_NOTE.format(customer_type) if customer_type else existing.get("note")
+        if channels == current and note == existing.get("note"):
+            return None
+        
+        payload = {
+            "name": existing.get("name"),
+            "firstname": existing.get("firstname"),
+            "lastname": existing.get("lastname"),
+            "email": existing.get("email"),
+            "channels": channels
+        }
+        if note:
+            payload["note"] = note
+        if existing.get("language"):
+            payload["language"] = existing.get("language")
+        return payload
+    
+    async def bulk_update_customers(
+        self,
+        customer_ids: Optional[List[int]] = None,
+        filter: Optional[Dict[str, Any]] = None,
+        customer_type: Optional[str] = None,
+        add_channels: Optional[List[Dict[str, Any]]] = None,
+        remove_channels: Optional[List[Dict[str, Any]]] = None,
+        concurrency: Optional[int] = None,
+        max_customers: int = 10000
+    ) -> str:
+        """Apply the same type and channel edits to many customers.
+        
+        With a filter, customer pages are fetched ahead while earlier
+        customers are updated, and listed records are updated without a
+        per-customer GET. Customers already in the target state are not
+        written. Requests go through the bulk rate limiter.
+        
+        Args:
+            customer_ids: Customers to update.
+            filter: list_customers filters selecting the customers instead.
+            customer_type: Customer type to set.
+            add_channels: Channels to add where missing.
+            remove_channels: Channels to remove where present.
+            concurrency: Customers updated at the same time.
+            max_customers: Stop after this many filter matches.
+            
+        Returns:
+            Summary counts and the failed customers.
+        """
+        try:
+            add_channels = add_channels or []
+            remove_channels = remove_channels or []
+            if not customer_type and not add_channels and not remove_channels:
+                return "Error: Please provide 'customer_type', 'add_channels' or 'remove_channels'."
+            filters = {k: v for k, v in (filter or {}).items() if k in CUSTOMER_FILTERS and v}
+            if not customer_ids and not filters:
+                return (
+                    "Error: Please provide 'customer_ids' or a non-empty 'filter' "
+                    f"({', '.join(CUSTOMER_FILTERS)})."
+                )
+            
+            client = bulk.RateLimitedClient(self.api_client, bulk.RateLimiter.from_env())
+            truncated = False
+            
+            async def matching_customers():
+                nonlocal truncated
+                seen = 0
+                async for page in iter_customer_pages(bulk.RetryingReader(client), filters):
+                    for customer in page:
+                        if seen >= max_customers:
+                            truncated = True
+                            return
+                        seen += 1
+                        yield customer
+            
+            # Same indexes and cache, but every request is rate limited
+            paced = copy.copy(self)
+            paced.api_client = client
+            
+            async def mutate_once(item: Any) -> Dict[str, Any]:
+                existing = item if isinstance(item, dict) and "channels" in item else None
+                customer_id = item.get("id") if isinstance(item, dict) else item
+                if existing is None:
+                    existing = self.customer_cache.get(customer_id)
+                if existing is None:
+                    existing = await client.get(f"customers/{customer_id}")
+                    self.customer_sync.index_customer(existing)
+                payload = self._build_bulk_update_payload(
+                    existing, customer_type, add_channels, remove_channels
+                )
+                if payload is None:
+                    return {"customer_id": customer_id, "status": "unchanged"}
+                await paced._put_customer(customer_id, payload)
+                return {"customer_id": customer_id, "status": "updated"}
+            
+            async def mutate(item: Any) -> Dict[str, Any]:
+                try:
+                    return await bulk.with_rate_limit_retries(lambda: mutate_once(item))
+                except Exception as e:
+                    customer_id = item.get("id") if isinstance(item, dict) else item
+                    return {"customer_id": customer_id, "status": "failed", "error": str(e)}
+            
+            failures: List[Dict[str, Any]] = []
+            updated: List[Any] = []
+            
+            def keep(outcome: Dict[str, Any]):
+                if outcome["status"] == "failed":
+                    failures.append(outcome)
+                elif outcome["status"] == "updated":
+                    updated.append(outcome["customer_id"])
+            
+            stats = bulk.BulkStats("bulk_update_customers")
+            items = list(dict.fromkeys(customer_ids)) if customer_ids else matching_customers()
+            try:
+                await bulk.run_bulk(items, mutate, bulk.bulk_concurrency(concurrency), stats, on_result=keep)
+            except Exception as e:
+                # Fetching the next page failed: report what was already changed
+                summary = stats.to_dict(upstream_requests=client.requests)
+                return (
+                    f"Error bulk updating customers: {str(e)}. Stopped after {summary['rows']} customers: "
+                    f"{summary.get('updated', 0)} updated, {summary.get('unchanged', 0)} unchanged, "
+                    f"{summary.get('failed', 0)} failed:\n"
+                    f"{self._format_json({'summary': summary, 'updated': updated, 'failed': failures})}"
+                )
+            
+            summary = stats.to_dict(upstream_requests=client.requests)
+            if truncated:
+                summary["truncated_at"] = max_customers
+            return (
+                f"Bulk update processed {summary['rows']} customers in {summary['elapsed_s']}s: "
+                f"{summary.get('updated', 0)} updated, {summary.get('unchanged', 0)} unchanged, "
+                f"{summary.get('failed', 0)} failed:\n"
+                f"{self._format_json({'summary': summary, 'failed': failures})}"
+            )
+            
+        except Exception as e:
+            return f"Error bulk updating customers: {str(e)}"
+    
+    async def find_duplicate_customers(
+        self,
+        include_names: bool = True,
+        max_clusters: int = 50,
+        max_staleness: Optional[float] = None
+    ) -> str:
+        """Find candidate duplicate customers across the whole customer base.
+        
+        Customers are streamed page by page (under the bulk rate limiter) or
+        from a fresh enough local mirror, and bucketed on normalized email,
+        phone and name in a single pass.
+        
+        Args:
+            include_names: Also report same-name groups.
+            max_clusters: Largest clusters and name groups to list.
+            max_staleness: Seconds of lag acceptable to scan the local mirror.
+            
+        Returns:
+            JSON string of the summary, clusters and name groups.
+        """
+        try:
+            detector = DuplicateDetector(include_names=include_names)
+            stats = bulk.BulkStats("find_duplicate_customers")
+            source = "live API"
+            
+            # The mirror query is a generator, so records stream in batches here too
+            mirrored = await read_mirror(self.mirror, "customers", max_staleness,
+                                         lambda store: store.iter_records("customers"))
+            if mirrored is not None:
+                source = f"local mirror, synced {mirrored['meta']['age_s']:g}s ago"
+                # Decoding and hashing the whole store would stall the event loop
+                await asyncio.to_thread(detector.add_many, mirrored["data"])
+            else:
+                client = bulk.RateLimitedClient(self.api_client, bulk.RateLimiter.from_env())
+                async for page in iter_customer_pages(bulk.RetryingReader(client)):
+                    detector.add_many(page)
+            stats.finish()
+            
+            report = detector.report(max_clusters)
+            summary = report["summary"]
+            summary["elapsed_s"] = round(stats.elapsed, 3)
+            return (
+                f"Scanned {summary['customers_scanned']} customers (source: {source}): "
+                f"{summary['clusters']} duplicate clusters covering {summary['duplicate_customers']} customers:\n"
+                f"{self._format_json(report)}"
+            )
+            
+        except Exception as e:
+            return f"Error finding duplicate customers: {str(e)}"
@@ -3,6 +3,7 @@
 import json
 from typing import Any, List
 from mcp.types import Tool
+from ..utils import tracing
 from ..utils.api_client import GorgiasAPIClient
 
 
@@ -133,10 +134,11 @@ class OrderTools:
     
     def _format_json(self, data: Any) -> str:
         """Format data as a pretty-printed JSON string."""
-        try:
-            return json.dumps(data, indent=2, default=str)
-        except (TypeError, ValueError):
-            return str(data)
+        with tracing.start_span("format_json"):
+            try:
+                return json.dumps(data, indent=2, default=str)
+            except (TypeError, ValueError):
+                return str(data)
 
     async def list_orders(self, **kwargs) -> str:
         """List orders with optional filtering.
@@ -1,10 +1,17 @@
 """Ticket management tools for Gorgias MCP server."""
 
 import json
+import math
 import os
-from typing import Any, List, Optional
+from typing import Any, Dict, List, Optional
 from mcp.types import Tool
+from ..utils import tracing
 from ..utils.api_client import GorgiasAPIClient
+from ..utils.mirror import MirrorStore, read_mirror, source_label
+from ..utils.pagination import MAX_PAGE_SIZE, more_label, next_position, read_page
+
+# Search result pages scanned for filter matches (the search endpoint has no filters)
+SEARCH_FILTER_PAGES = 5
 
 
 class TicketTools:
@@ -17,6 +24,8 @@ class TicketTools:
             api_client: GorgiasAPIClient instance.
         """
         self.api_client = api_client
+        # Local SQLite mirror for max_staleness reads (attached when the sync runs)
+        self.mirror: Optional[MirrorStore] = None
     
     def get_tools(self) -> List[Tool]:
         """Get list of ticket-related tools.
@@ -27,15 +36,22 @@ class TicketTools:
         return [
             Tool(
                 name="list_tickets",
-                description="List all tickets with optional filtering",
+                description=(
+                    "List tickets with optional filtering, one page at a time; pass the returned "
+                    "next_page_token as page_token for the next page"
+                ),
                 inputSchema={
                     "type": "object",
                     "properties": {
                         "limit": {
                             "type": "integer",
-                            "description": "Maximum number of tickets to return",
+                            "description": f"Tickets per page (at most {MAX_PAGE_SIZE})",
                             "default": 50
                         },
+                        "page_token": {
+                            "type": "string",
+                            "description": "next_page_token from a previous page, to continue the same listing"
+                        },
                         "status": {
                             "type": "string",
                             "description": "Filter by ticket status",
@@ -53,6 +69,10 @@ class TicketTools:
                         "customer_id": {
                             "type": "integer",
                             "description": "Filter by customer ID"
+                        },
+                        "max_staleness": {
+                            "type": "number",
+                            "description": "Accept data up to this many seconds old from the local mirror (omit for live data)"
                         }
                     }
                 }
@@ -144,7 +164,11 @@ class TicketTools:
             ),
             Tool(
                 name="search_tickets",
-                description="Search tickets by content, customer, or other criteria",
+                description=(
+                    "Search tickets by content, customer, or other criteria. mode 'local' ranks "
+                    "subjects and message bodies in the local mirror by relevance, with snippets, "
+                    "without an upstream request"
+                ),
                 inputSchema={
                     "type": "object",
                     "properties": {
@@ -156,6 +180,33 @@ class TicketTools:
                             "type": "integer",
                             "description": "Maximum number of results",
                             "default": 50
+                        },
+                        "mode": {
+                            "type": "string",
+                            "description": "'api' for Gorgias search, 'local' for the full-text index of the mirror",
+                            "enum": ["api", "local"],
+                            "default": "api"
+                        },
+                        "status": {
+                            "type": "string",
+                            "description": "Filter by ticket status",
+                            "enum": ["open", "closed", "pending", "solved"]
+                        },
+                        "customer_id": {
+                            "type": "integer",
+                            "description": "Filter by customer ID"
+                        },
+                        "created_after": {
+                            "type": "string",
+                            "description": "Filter tickets created after this date (ISO format)"
+                        },
+                        "created_before": {
+                            "type": "string",
+                            "description": "Filter tickets created before this date (ISO format)"
+                        },
+                        "max_staleness": {
+                            "type": "number",
+                            "description": "In local mode, fall back to the live API if the mirror is older than this many seconds"
                         }
                     },
                     "required": ["query"]
@@ -165,37 +216,54 @@ class TicketTools:
     
     def _format_json(self, data: Any) -> str:
         """Format data as a pretty-printed JSON string."""
-        try:
-            return json.dumps(data, indent=2, default=str)
-        except (TypeError, ValueError):
-            return str(data)
+        with tracing.start_span("format_json"):
+            try:
+                return json.dumps(data, indent=2, default=str)
+            except (TypeError, ValueError):
+                return str(data)
+
+    def _matches_filters(self, ticket: Any, filters: Dict[str, Any]) -> bool:
+        """Apply the search filters to a ticket returned by the API."""
+        if not isinstance(ticket, dict):
+            return False
+        customer = ticket.get("customer")
+        customer_id = customer.get("id") if isinstance(customer, dict) else ticket.get("customer_id")
+        created = ticket.get("created_datetime") or ""
+        return (
+            (filters["status"] is None or ticket.get("status") == filters["status"])
+            and (filters["customer_id"] is None or customer_id == filters["customer_id"])
+            and (filters["created_after"] is None or created > filters["created_after"])
+            and (filters["created_before"] is None or created < filters["created_before"])
+        )
 
     async def list_tickets(self, **kwargs) -> str:
-        """List tickets with optional filtering.
+        """List one page of tickets with optional filtering.
         
         Args:
-            **kwargs: Filter parameters.
+            **kwargs: Filter parameters, ``limit`` (page size), ``page_token``
+                to continue a previous listing, and ``max_staleness`` to
+                allow answering from the local mirror.
             
         Returns:
-            JSON string of tickets data.
+            JSON string of the page and its ``next_page_token``.
         """
         try:
-            # Build query parameters
-            params = {}
-            if "limit" in kwargs:
-                params["limit"] = kwargs["limit"]
-            if "status" in kwargs:
-                params["status"] = kwargs["status"]
-            if "priority" in kwargs:
-                params["priority"] = kwargs["priority"]
-            if "assignee_id" in kwargs:
-                params["assignee_id"] = kwargs["assignee_id"]
-            if "customer_id" in kwargs:
-                params["customer_id"] = kwargs["customer_id"]
-            
-            data = await self.api_client.get("tickets", params=params)
-            count = len(data.get("data", [])) if isinstance(data, dict) else 0
-            return f"Found {count} tickets:\n{self._format_json(data)}"
+            max_staleness = kwargs.get("max_staleness")
+            filters = {key: kwargs.get(key) for key in ("status", "priority", "assignee_id", "customer_id")}
+            data = await read_page(
+                self.api_client, "tickets", "list_tickets", filters,
+                limit=kwargs.get("limit"),
+                page_token=kwargs.get("page_token"),
+                mirror=self.mirror,
+                max_staleness=max_staleness,
+                mirror_query=lambda store, query, limit, offset: store.query_tickets(
+                    **query, limit=limit, offset=offset
+                ),
+            )
+            return (
+                f"Found {len(data['data'])} tickets{source_label(data, max_staleness)}{more_label(data)}:\n"
+                f"{self._format_json(data)}"
+            )
             
         except Exception as e:
             return f"Error listing tickets: {str(e)}"
@@ -353,26 +421,85 @@ class TicketTools:
         except Exception as e:
             return f"Error updating ticket {ticket_id}: {str(e)}"
     
-    async def search_tickets(self, query: str, limit: int = 50) -> str:
+    async def search_tickets(
+        self,
+        query: str,
+        limit: int = 50,
+        mode: str = "api",
+        status: Optional[str] = None,
+        customer_id: Optional[int] = None,
+        created_after: Optional[str] = None,
+        created_before: Optional[str] = None,
+        max_staleness: Optional[float] = None
+    ) -> str:
         """Search tickets by content or other criteria.
         
         Args:
             query: Search query.
             limit: Maximum number of results.
+            mode: ``api`` for the Gorgias search endpoint, ``local`` for
+                BM25-ranked full-text search of the mirror.
+            status: Filter by ticket status.
+            customer_id: Filter by customer ID.
+            created_after: Filter tickets created after this date.
+            created_before: Filter tickets created before this date.
+            max_staleness: In local mode, seconds of lag acceptable before
+                falling back to the API (default: any synced mirror).
             
         Returns:
             JSON string of search results.
         """
         try:
+            filters = {
+                "status": status,
+                "customer_id": customer_id,
+                "created_after": created_after,
+                "created_before": created_before,
+            }
+            if mode == "local":
+                if max_staleness is None:
+                    max_staleness = math.inf
+                # Without FTS5 in this SQLite build, search the API instead
+                store = self.mirror if self.mirror is not None and self.mirror.full_text else None
+                data = await read_mirror(store, "tickets", max_staleness, lambda store: store.search_tickets(
+                    query, limit=limit, **filters
+                ))
+                if data is not None:
+                    return (
+                        f"Found {len(data['data'])} tickets matching '{query}'{source_label(data, max_staleness)}:\n"
+                        f"{self._format_json(data)}"
+                    )
+            elif mode != "api":
+                return f"Error searching tickets: unknown mode '{mode}' (expected api or local)"
+            
             params = {
                 "q": query,
                 "limit": limit
             }
             
             data = await self.api_client.get("tickets/search", params=params)
+            note = ""
+            if any(value is not None for value in filters.values()):
+                # Filter locally, paging on until enough results match
+                items = data.get("data", []) if isinstance(data, dict) else []
+                hits = [ticket for ticket in items if self._matches_filters(ticket, filters)]
+                position: Dict[str, Any] = {}
+                pages = 1
+                while len(hits) < limit:
+                    position = next_position(data, items, limit, position)
+                    if position is None:
+                        break
+                    if pages >= SEARCH_FILTER_PAGES:
+                        note = f" (filtered locally over the first {pages} result pages; more may exist)"
+                        break
+                    data = await self.api_client.get("tickets/search", params={**params, **position})
+                    pages += 1
+                    items = data.get("data", []) if isinstance(data, dict) else []
+                    hits += [ticket for ticket in items if self._matches_filters(ticket, filters)]
+                data = {"data": hits[:limit]}
             count = len(data.get("data", [])) if isinstance(data, dict) else 0
             return (
-                f"Found {count} tickets matching '{query}':\n"
+                f"Found {count} tickets matching '{query}'{source_label(data, max_staleness)}{note}:\n"
                 f"{self._format_json(data)}"
             )
             
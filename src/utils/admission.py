@@ -0,0 +1,165 @@
+"""Admission control and load shedding for tool calls.
+
+At most ``max_in_flight`` tool calls run at once. Further calls wait in a
+bounded FIFO queue per priority; freed slots go to the highest-priority
+waiter first. When a queue is full, or a waiter is not admitted within
+``queue_timeout``, the call is rejected immediately with a retry hint so
+the client backs off and Cloud Run can scale out, instead of piling up
+coroutines on an instance whose upstream is slow.
+"""
+
+import asyncio
+import math
+import os
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, Deque, Dict, Optional
+
+from . import metrics
+
+# Highest priority first
+PRIORITIES = ("high", "normal", "low")
+DEFAULT_PRIORITY = "normal"
+
+admission_in_flight = metrics.registry.register(metrics.Gauge(
+    "gorgias_mcp_admission_in_flight", "Tool calls holding an admission slot"
+))
+admission_queued = metrics.registry.register(metrics.Gauge(
+    "gorgias_mcp_admission_queued", "Tool calls waiting for an admission slot", ("priority",)
+))
+admission_rejected = metrics.registry.register(metrics.Counter(
+    "gorgias_mcp_admission_rejected_total", "Tool calls shed by admission control",
+    ("priority", "reason")
+))
+admission_wait = metrics.registry.register(metrics.Histogram(
+    "gorgias_mcp_admission_wait_seconds", "Time spent queued before admission", ("priority",)
+))
+
+
+class AdmissionRejected(Exception):
+    """Raised when a call cannot be admitted."""
+
+    def __init__(self, message: str, retry_after: float):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+def normalize_priority(value: Optional[str]) -> str:
+    """Map a client-supplied priority to one of ``PRIORITIES``."""
+    value = (value or "").strip().lower()
+    return value if value in PRIORITIES else DEFAULT_PRIORITY
+
+
+class AdmissionController:
+    """Bound concurrent tool calls with per-priority wait queues."""
+
+    def __init__(self, max_in_flight: int, queue_size: int = 32, queue_timeout: float = 5.0):
+        """Initialize the controller.
+
+        Args:
+            max_in_flight: Maximum number of concurrently running calls.
+            queue_size: Maximum number of waiting calls per priority.
+            queue_timeout: Seconds a call may wait before being shed.
+        """
+        self.max_in_flight = max_in_flight
+        self.queue_size = queue_size
+        self.queue_timeout = queue_timeout
+        self.in_flight = 0
+        self._queues: Dict[str, Deque[asyncio.Future]] = {p: deque() for p in PRIORITIES}
+        # Exponentially weighted average call duration, used for Retry-After
+        self._avg_service_time = 1.0
+
+    @classmethod
+    def from_env(cls) -> Optional["AdmissionController"]:
+        """Build a controller from ``MCP_MAX_IN_FLIGHT`` (0 disables it)."""
+        max_in_flight = int(os.getenv("MCP_MAX_IN_FLIGHT", "64"))
+        if max_in_flight <= 0:
+            return None
+        return cls(
+            max_in_flight,
+            queue_size=int(os.getenv("MCP_ADMISSION_QUEUE_SIZE", "32")),
+            queue_timeout=float(os.getenv("MCP_ADMISSION_QUEUE_TIMEOUT", "5")),
+        )
+
+    @property
+    def queued(self) -> int:
+        """Number of calls currently waiting."""
+        return sum(len(queue) for queue in self._queues.values())
+
+    def retry_after(self) -> float:
+        """Estimate how long a rejected client should wait, in seconds."""
+        backlog = self.queued + 1
+        return max(1.0, math.ceil(self._avg_service_time * backlog / self.max_in_flight))
+
+    def _reject(self, priority: str, reason: str, message: str) -> AdmissionRejected:
+        admission_rejected.inc(priority, reason)
+        return AdmissionRejected(message, self.retry_after())
+
+    async def acquire(self, priority: str = DEFAULT_PRIORITY):
+        """Wait for a slot or raise ``AdmissionRejected``."""
+        if self.in_flight < self.max_in_flight and not self.queued:
+            self.in_flight += 1
+            admission_in_flight.set(self.in_flight)
+            return
+
+        queue = self._queues[priority]
+        if len(queue) >= self.queue_size:
+            raise self._reject(priority, "queue_full", "Server is at capacity")
+
+        waiter = asyncio.get_running_loop().create_future()
+        queue.append(waiter)
+        admission_queued.set(len(queue), priority)
+        start = time.perf_counter()
+        try:
+            await asyncio.wait_for(waiter, self.queue_timeout)
+        except (asyncio.TimeoutError, asyncio.CancelledError) as e:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over just as we gave up; pass it on
+                self.release()
+            else:
+                try:
+                    queue.remove(waiter)
+                except ValueError:
+                    pass
+            admission_queued.set(len(queue), priority)
+            if isinstance(e, asyncio.CancelledError):
+                raise
+            raise self._reject(priority, "queue_timeout", "Timed out waiting for capacity") from None
+        admission_wait.observe(time.perf_counter() - start, priority)
+
+    def release(self):
+        """Free a slot, handing it to the highest-priority waiter if any."""
+        for priority in PRIORITIES:
+            queue = self._queues[priority]
+            while queue:
+                waiter = queue.popleft()
+                admission_queued.set(len(queue), priority)
+                if not waiter.done():
+                    # The slot moves to the waiter, so in_flight is unchanged
+                    waiter.set_result(None)
+                    return
+        self.in_flight -= 1
+        admission_in_flight.set(self.in_flight)
+
+    @asynccontextmanager
+    async def slot(self, priority: str = DEFAULT_PRIORITY):
+        """Hold an admission slot for the duration of the block."""
+        await self.acquire(priority)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self._avg_service_time = 0.9 * self._avg_service_time + 0.1 * elapsed
+            self.release()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return current capacity and queue depths."""
+        return {
+            "max_in_flight": self.max_in_flight,
+            "in_flight": self.in_flight,
+            "queue_size": self.queue_size,
+            "queued": {p: len(q) for p, q in self._queues.items()},
+            "avg_service_time_s": round(self._avg_service_time, 3),
+        }
@@ -2,9 +2,16 @@
 
 import asyncio
 import logging
+import time
 from typing import Any, Dict, List, Optional
-import httpx
+from . import metrics, tracing
 from .auth import GorgiasAuth
+from .runtime import upstream_socket_options
+from .startup import lazy_import
+from .structured_logging import LazyPayload
+
+# Loaded on first request in fast-boot mode
+httpx = lazy_import("httpx")
 
 logger = logging.getLogger(__name__)
 
@@ -12,17 +19,70 @@ logger = logging.getLogger(__name__)
 class GorgiasAPIClient:
     """Client for interacting with Gorgias API."""
     
-    def __init__(self, auth: GorgiasAuth, timeout: int = 30):
+    def __init__(
+        self,
+        auth: GorgiasAuth,
+        timeout: int = 30,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 10
+    ):
         """Initialize the API client.
         
         Args:
             auth: GorgiasAuth instance for authentication.
             timeout: Request timeout in seconds.
+            max_connections: Maximum concurrent connections in the pool.
+            max_keepalive_connections: Idle connections kept open for reuse.
         """
         self.auth = auth
         self.timeout = timeout
         self.base_url = auth.get_base_url()
         self.headers = auth.get_headers()
+        self.socket_options = upstream_socket_options()
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self._client: Optional["httpx.AsyncClient"] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._in_flight = 0
+        self._requests_served = 0
+    
+    def _get_client(self) -> "httpx.AsyncClient":
+        """Return the pooled HTTP client, creating it for the running loop if needed."""
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._client_loop is not loop:
+            limits = httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_keepalive_connections,
+                keepalive_expiry=30.0
+            )
+            transport = httpx.AsyncHTTPTransport(
+                limits=limits,
+                socket_options=self.socket_options
+            )
+            self._client = httpx.AsyncClient(timeout=self.timeout, transport=transport)
+            self._client_loop = loop
+        return self._client
+    
+    async def aclose(self):
+        """Close the connection pool."""
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
+        self._client_loop = None
+    
+    def pool_status(self) -> Dict[str, Any]:
+        """Describe the connection pool without touching the network.
+        
+        Returns:
+            Dictionary with pool state, limits and request counters.
+        """
+        return {
+            "open": self._client is not None and not self._client.is_closed,
+            "max_connections": self.max_connections,
+            "max_keepalive_connections": self.max_keepalive_connections,
+            "in_flight": self._in_flight,
+            "requests_served": self._requests_served
+        }
     
     async def _make_request(
         self,
@@ -50,14 +110,30 @@ class GorgiasAPIClient:
         url = f"{self.base_url}/{endpoint.lstrip('/')}"
         timeout = timeout or self.timeout
         
-        async with httpx.AsyncClient(timeout=timeout) as client:
+        client = self._get_client()
+        status = "error"
+        start = time.perf_counter()
+        self._in_flight += 1
+        metrics.upstream_in_flight.inc()
+        
+        with tracing.start_span(
+            f"HTTP {method}",
+            {"http.request.method": method, "url.template": metrics.endpoint_template(endpoint)},
+            kind=tracing.KIND_CLIENT
+        ) as span:
             try:
                 response = await client.request(
                     method=method,
                     url=url,
                     headers=self.headers,
                     params=params,
-                    json=data
+                    json=data,
+                    timeout=timeout
+                )
+                status = str(response.status_code)
+                span.set_attribute("http.response.status_code", response.status_code)
+                metrics.record_rate_limit(
+                    response.headers.get("X-Gorgias-Account-Api-Call-Limit")
                 )
                 response.raise_for_status()
                 if response.status_code == 204 or not response.content:
@@ -74,11 +150,22 @@ class GorgiasAPIClient:
                         "content": response.text
                     }
             except httpx.HTTPStatusError as e:
-                logger.error(f"HTTP error {e.response.status_code}: {e.response.text}")
+                logger.error(
+                    "HTTP error %s from %s %s",
+                    e.response.status_code, method, metrics.endpoint_template(endpoint)
+                )
+                logger.debug("Upstream error body: %s", LazyPayload(e.response.text, limit=512))
                 raise
             except httpx.RequestError as e:
-                logger.error(f"Request error: {e}")
+                logger.error(
+                    "Request error for %s %s: %s", method, metrics.endpoint_template(endpoint), e
+                )
                 raise
+            finally:
+                self._in_flight -= 1
+                self._requests_served += 1
+                metrics.upstream_in_flight.dec()
+                metrics.record_upstream(method, endpoint, status, time.perf_counter() - start)
     
     async def get(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Make a GET request.
@@ -0,0 +1,363 @@
+"""Bounded-concurrency bulk operations against the Gorgias API.
+
+Bulk tools process an input stream with a fixed number of workers pulling
+from a shared iterator, so at most ``concurrency`` rows are in memory at a
+time; async sources (e.g. API pages) are read ahead by a producer into a
+small queue, so fetching the next page overlaps with work on the last.
+
+Upstream requests go through a token bucket (``MCP_BULK_RATE`` requests per
+second) that leaves the rest of the Gorgias quota to interactive calls; a
+429 response pauses the bucket for ``Retry-After`` seconds and the row (or
+page) is retried.
+"""
+
+import asyncio
+import csv
+import io
+import json
+import os
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any, AsyncIterable, Awaitable, Callable, Dict, Iterable, Iterator, Optional, Tuple, Union
+
+from . import metrics
+
+bulk_rows = metrics.registry.register(metrics.Counter(
+    "gorgias_mcp_bulk_rows_total", "Rows processed by bulk tools", ("tool", "status")
+))
+
+# Column aliases accepted in import files, mapped to create_customer arguments
+COLUMN_ALIASES = {
+    "firstname": "first_name",
+    "lastname": "last_name",
+    "phone_number": "phone",
+    "email_address": "email",
+}
+
+
+def bulk_concurrency(requested: Optional[int] = None) -> int:
+    """Return the worker count: the requested value capped by ``MCP_BULK_MAX_CONCURRENCY``."""
+    limit = int(os.getenv("MCP_BULK_MAX_CONCURRENCY", "16"))
+    if requested is None:
+        requested = int(os.getenv("MCP_BULK_CONCURRENCY", "4"))
+    return max(1, min(int(requested), limit))
+
+
+def rate_limit_delay(error: BaseException) -> Optional[float]:
+    """Seconds to back off if ``error`` is an upstream 429, else None."""
+    response = getattr(error, "response", None)
+    if getattr(response, "status_code", None) != 429:
+        return None
+    try:
+        return max(0.0, float(response.headers.get("Retry-After", 1)))
+    except (TypeError, ValueError):
+        return 1.0
+
+
+class RateLimiter:
+    """Async token bucket shared by the workers of one bulk operation."""
+
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        """Initialize the limiter.
+
+        Args:
+            rate: Requests per second.
+            burst: Bucket capacity (defaults to one second's worth).
+        """
+        self.rate = rate
+        self.burst = max(1.0, burst if burst is not None else rate)
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+
+    @classmethod
+    def from_env(cls, rate: Optional[float] = None) -> Optional["RateLimiter"]:
+        """Build a limiter from ``MCP_BULK_RATE`` (0 disables it)."""
+        if rate is None:
+            rate = float(os.getenv("MCP_BULK_RATE", "2"))
+        if rate <= 0:
+            return None
+        burst = os.getenv("MCP_BULK_BURST")
+        return cls(rate, burst=float(burst) if burst else None)
+
+    def pause(self, seconds: float):
+        """Hold every worker back, e.g. after an upstream 429."""
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+        self._tokens = 0.0
+
+    async def acquire(self):
+        """Wait for a token."""
+        while True:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            wait = self._paused_until - now
+            if wait <= 0 and self._tokens >= 1.0:
+                self._tokens -= 1.0
+                return
+            await asyncio.sleep(max(wait, (1.0 - self._tokens) / self.rate))
+
+
+class RateLimitedClient:
+    """API client proxy that takes a limiter token before every request."""
+
+    def __init__(self, api_client: Any, limiter: Optional[RateLimiter]):
+        self._api_client = api_client
+        self._limiter = limiter
+        self.requests = 0
+
+    async def _call(self, method: str, *args: Any, **kwargs: Any) -> Dict[str, Any]:
+        if self._limiter is not None:
+            await self._limiter.acquire()
+        self.requests += 1
+        try:
+            return await getattr(self._api_client, method)(*args, **kwargs)
+        except Exception as e:
+            delay = rate_limit_delay(e)
+            if delay is not None and self._limiter is not None:
+                self._limiter.pause(delay)
+            raise
+
+    async def get(self, *args: Any, **kwargs: Any) -> Dict[str, Any]:
+        return await self._call("get", *args, **kwargs)
+
+    async def post(self, *args: Any, **kwargs: Any) -> Dict[str, Any]:
+        return await self._call("post", *args, **kwargs)
+
+    async def put(self, *args: Any, **kwargs: Any) -> Dict[str, Any]:
+        return await self._call("put", *args, **kwargs)
+
+    async def patch(self, *args: Any, **kwargs: Any) -> Dict[str, Any]:
+        return await self._call("patch", *args, **kwargs)
+
+    async def delete(self, *args: Any, **kwargs: Any) -> Dict[str, Any]:
+        return await self._call("delete", *args, **kwargs)
+
+
+class RetryingReader:
+    """Read-only client proxy that retries GETs after upstream 429s.
+
+    Wraps the client feeding pages to ``run_bulk``, so a throttled page is
+    waited out like a throttled row instead of aborting the whole run.
+    """
+
+    def __init__(self, api_client: Any, retries: int = 3):
+        self._api_client = api_client
+        self._retries = retries
+
+    async def get(self, *args: Any, **kwargs: Any) -> Dict[str, Any]:
+        return await with_rate_limit_retries(lambda: self._api_client.get(*args, **kwargs), self._retries)
+
+
+class BulkStats:
+    """Outcome counts and throughput of a bulk operation."""
+
+    def __init__(self, tool: str):
+        self.tool = tool
+        self.statuses: Counter = Counter()
+        self.started = time.perf_counter()
+        self.elapsed = 0.0
+
+    def record(self, status: str):
+        """Count one finished row."""
+        self.statuses[status] += 1
+        bulk_rows.inc(self.tool, status)
+
+    @property
+    def rows(self) -> int:
+        """Rows finished so far."""
+        return sum(self.statuses.values())
+
+    def finish(self):
+        """Stop the clock."""
+        self.elapsed = time.perf_counter() - self.started
+
+    def to_dict(self, upstream_requests: Optional[int] = None) -> Dict[str, Any]:
+        """Summarize counts, duration and rows per second."""
+        elapsed = self.elapsed or (time.perf_counter() - self.started)
+        summary = {
+            "rows": self.rows,
+            **dict(sorted(self.statuses.items())),
+            "elapsed_s": round(elapsed, 3),
+            "rows_per_s": round(self.rows / elapsed, 2) if elapsed > 0 else None,
+        }
+        if upstream_requests is not None:
+            summary["upstream_requests"] = upstream_requests
+        return summary
+
+
+_DONE = object()
+
+
+async def run_bulk(
+    items: Union[Iterable[Any], AsyncIterable[Any]],
+    operation: Callable[[Any], Awaitable[Dict[str, Any]]],
+    concurrency: int,
+    stats: BulkStats,
+    on_result: Optional[Callable[[Dict[str, Any]], None]] = None
+):
+    """Apply ``operation`` to every item with at most ``concurrency`` in flight.
+
+    Workers pull from one shared iterator, so the input is consumed lazily.
+    Each result must carry a ``status``; ``on_result`` sees results as they
+    finish (not in input order).
+    """
+    concurrency = max(1, concurrency)
+
+    async def handle(item: Any):
+        result = await operation(item)
+        stats.record(result.get("status", "unknown"))
+        if on_result is not None:
+            on_result(result)
+
+    if not hasattr(items, "__aiter__"):
+        iterator = iter(items)
+
+        async def worker():
+            # next() never awaits, so workers cannot interleave inside it
+            for item in iterator:
+                await handle(item)
+
+        try:
+            await asyncio.gather(*(worker() for _ in range(concurrency)))
+        finally:
+            stats.finish()
+        return
+
+    queue: asyncio.Queue = asyncio.Queue(maxsize=concurrency * 2)
+
+    async def produce():
+        try:
+            async for item in items:
+                await queue.put(item)
+        finally:
+            for _ in range(concurrency):
+                await queue.put(_DONE)
+
+    async def consume():
+        while True:
+            item = await queue.get()
+            if item is _DONE:
+                return
+            await handle(item)
+
+    try:
+        results = await asyncio.gather(
+            produce(), *(consume() for _ in range(concurrency)), return_exceptions=True
+        )
+    finally:
+        stats.finish()
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+
+
+async def with_rate_limit_retries(
+    attempt: Callable[[], Awaitable[Dict[str, Any]]],
+    retries: int = 3
+) -> Dict[str, Any]:
+    """Run ``attempt``, retrying after upstream 429s.
+
+    The limiter is already paused by ``RateLimitedClient``; this only waits
+    out the ``Retry-After`` delay before trying the row again.
+    """
+    retry = 0
+    while True:
+        try:
+            return await attempt()
+        except Exception as e:
+            delay = rate_limit_delay(e)
+            if delay is None or retry >= retries:
+                raise
+            retry += 1
+            await asyncio.sleep(delay)
+
+
+def import_path(path: str) -> Path:
+    """Resolve an import file inside ``MCP_BULK_IMPORT_DIR``.
+
+    Raises:
+        ValueError: If file imports are disabled or the path escapes the directory.
+    """
+    root = os.getenv("MCP_BULK_IMPORT_DIR")
+    if not root:
+        raise ValueError("file imports are disabled (set MCP_BULK_IMPORT_DIR)")
+    base = Path(root).resolve()
+    resolved = (base / path).resolve()
+    if base != resolved and base not in resolved.parents:
+        raise ValueError(f"'{path}' is outside the import directory")
+    return resolved
+
+
+def _detect_format(first_line: str, path: Optional[Path]) -> str:
+    if path is not None:
+        suffix = path.suffix.lower()
+        if suffix in (".jsonl", ".ndjson", ".json"):
+            return "jsonl"
+        if suffix == ".csv":
+            return "csv"
+    return "jsonl" if first_line.lstrip().startswith("{") else "csv"
+
+
+def _normalize_record(record: Dict[str, Any]) -> Dict[str, Any]:
+    normalized = {}
+    for key, value in record.items():
+        if key is None:
+            continue
+        key = key.strip().lower().replace(" ", "_")
+        key = COLUMN_ALIASES.get(key, key)
+        if isinstance(value, str):
+            value = value.strip()
+        if value not in (None, ""):
+            normalized[key] = value
+    return normalized
+
+
+def iter_records(
+    data: Optional[str] = None,
+    path: Optional[str] = None,
+    fmt: Optional[str] = None
+) -> Iterator[Tuple[int, Any]]:
+    """Stream ``(row_number, record)`` pairs from CSV or JSONL input.
+
+    Malformed rows yield a ``ValueError`` in place of the record so they are
+    reported without stopping the import. Row numbers count data rows from 1.
+
+    Args:
+        data: Inline CSV or JSONL text.
+        path: File relative to ``MCP_BULK_IMPORT_DIR``.
+        fmt: ``csv`` or ``jsonl``; detected from the extension or the first
+            line when omitted.
+    """
+    file_path = import_path(path) if path else None
+    stream = open(file_path, newline="", encoding="utf-8-sig") if file_path else io.StringIO(data or "")
+    with stream:
+        lines = (line for line in stream if line.strip())
+        first = next(lines, None)
+        if first is None:
+            return
+        fmt = (fmt or _detect_format(first, file_path)).lower()
+        lines = _chain(first, lines)
+
+        if fmt == "jsonl":
+            for number, line in enumerate(lines, 1):
+                try:
+                    record = json.loads(line)
+                except ValueError as e:
+                    yield number, ValueError(f"invalid JSON: {e}")
+                    continue
+                if not isinstance(record, dict):
+                    yield number, ValueError("expected a JSON object")
+                    continue
+                yield number, _normalize_record(record)
+        elif fmt == "csv":
+            for number, record in enumerate(csv.DictReader(lines), 1):
+                yield number, _normalize_record(record)
+        else:
+            raise ValueError(f"unsupported format '{fmt}' (expected csv or jsonl)")
+
+
+def _chain(first: str, rest: Iterator[str]) -> Iterator[str]:
+    yield first
+    yield from rest
@@ -0,0 +1,148 @@
+"""Response compression helpers for the HTTP transport.
+
+gzip is always available through the standard library. brotli and zstd are
+used only when the optional ``brotli`` / ``zstandard`` packages are installed.
+"""
+
+import os
+import zlib
+from typing import Dict, Optional
+
+try:
+    import brotli  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+try:
+    import zstandard  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+
+# Levels are tuned for latency rather than ratio: tool results are JSON and
+# compress well even at the fast end of each codec.
+GZIP_LEVEL = 5
+BROTLI_QUALITY = 4
+ZSTD_LEVEL = 3
+
+# Preference order used to break ties between equally weighted encodings.
+_PREFERENCE = ("zstd", "br", "gzip")
+
+
+def available_encodings() -> tuple:
+    """Return the encodings supported by this process, most preferred first."""
+    encodings = []
+    if zstandard is not None:
+        encodings.append("zstd")
+    if brotli is not None:
+        encodings.append("br")
+    encodings.append("gzip")
+    return tuple(encodings)
+
+
+def is_enabled() -> bool:
+    """Check whether response compression is enabled."""
+    return os.getenv("MCP_COMPRESSION", "true").lower() == "true"
+
+
+def get_min_size() -> int:
+    """Get the minimum body size in bytes before compression kicks in."""
+    return int(os.getenv("MCP_COMPRESSION_MIN_SIZE", "1024"))
+
+
+def _parse_accept_encoding(header: str) -> Dict[str, float]:
+    """Parse an Accept-Encoding header into a mapping of coding -> q-value."""
+    weights: Dict[str, float] = {}
+    for part in header.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        coding, _, params = part.partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        weights[coding.strip().lower()] = quality
+    return weights
+
+
+def negotiate_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """Pick the best supported encoding for an Accept-Encoding header.
+
+    Args:
+        accept_encoding: Raw Accept-Encoding header value.
+
+    Returns:
+        The chosen content coding, or None to send the body uncompressed.
+    """
+    if not accept_encoding:
+        return None
+
+    weights = _parse_accept_encoding(accept_encoding)
+    wildcard = weights.get("*", 0.0)
+
+    best = None
+    best_quality = 0.0
+    for encoding in available_encodings():
+        quality = weights.get(encoding, wildcard)
+        if quality > best_quality:
+            best = encoding
+            best_quality = quality
+    return best
+
+
+def compress(data: bytes, encoding: str) -> bytes:
+    """Compress a complete body with the given content coding."""
+    if encoding == "gzip":
+        compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+        return compressor.compress(data) + compressor.flush()
+    if encoding == "br" and brotli is not None:
+        return brotli.compress(data, quality=BROTLI_QUALITY)
+    if encoding == "zstd" and zstandard is not None:
+        return zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(data)
+    raise ValueError(f"Unsupported content encoding: {encoding}")
+
+
+class StreamCompressor:
+    """Incremental compressor for streamed (SSE) responses.
+
+    Every call to ``compress`` flushes the codec so that each event reaches
+    the client immediately instead of sitting in the compressor's buffer.
+    """
+
+    def __init__(self, encoding: str):
+        """Initialize a streaming compressor.
+
+        Args:
+            encoding: Content coding negotiated with the client.
+        """
+        self.encoding = encoding
+        if encoding == "gzip":
+            self._compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+        elif encoding == "br" and brotli is not None:
+            self._compressor = brotli.Compressor(quality=BROTLI_QUALITY)
+        elif encoding == "zstd" and zstandard is not None:
+            self._compressor = zstandard.ZstdCompressor(level=ZSTD_LEVEL).compressobj()
+        else:
+            raise ValueError(f"Unsupported content encoding: {encoding}")
+
+    def compress(self, data: bytes) -> bytes:
+        """Compress a chunk and flush it so it can be sent right away."""
+        if self.encoding == "gzip":
+            return self._compressor.compress(data) + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+        if self.encoding == "br":
+            return self._compressor.process(data) + self._compressor.flush()
+        return self._compressor.compress(data) + self._compressor.flush(
+            zstandard.COMPRESSOBJ_FLUSH_BLOCK
+        )
+
+    def finish(self) -> bytes:
+        """Finish the compressed stream and return any trailing bytes."""
+        if self.encoding == "gzip":
+            return self._compressor.flush(zlib.Z_FINISH)
+        if self.encoding == "br":
+            return self._compressor.finish()
+        return self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_FINISH)
@@ -3,7 +3,7 @@
 import os
 import sys
 from typing import Optional
-from dotenv import load_dotenv
+from .startup import fast_boot_enabled, running_in_container
 
 
 class GorgiasConfig:
@@ -11,8 +11,12 @@ class GorgiasConfig:
     
     def __init__(self):
         """Initialize configuration by loading environment variables."""
-        # Load .env file if it exists
-        load_dotenv()
+        # Load .env file if it exists. In fast-boot mode, containers get their
+        # configuration from the environment, so skip the file lookup (and the
+        # dotenv import) there.
+        if not (fast_boot_enabled() and running_in_container()):
+            from dotenv import load_dotenv
+            load_dotenv()
         
         # Load configuration values
         self.api_key = os.getenv("GORGIAS_API_KEY")
@@ -0,0 +1,168 @@
+"""Keep local customer indexes filled and current.
+
+``CustomerSync`` feeds customer records to a set of local indexes (phone,
+fuzzy name): records seen by the customer tools are indexed as they pass
+through, and an optional paged background sync walks every customer so the
+indexes also cover customers nobody has touched yet. Each complete sync
+also drops customers it did not see (deleted or merged upstream).
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Set
+
+from .bulk import RetryingReader
+
+logger = logging.getLogger(__name__)
+
+
+async def iter_customer_pages(
+    api_client: Any,
+    filters: Optional[Dict[str, Any]] = None,
+    page_size: int = 100,
+    page_delay: float = 0.0
+) -> AsyncIterator[List[Dict[str, Any]]]:
+    """Yield pages of customers matching ``filters``.
+
+    Supports both cursor (``meta.next_cursor``) and page-number
+    pagination. ``page_delay`` paces the walk so live tool calls keep
+    most of the API quota.
+    """
+    filters = dict(filters or {})
+    params: Dict[str, Any] = {**filters, "limit": page_size}
+    page = 1
+    while True:
+        response = await api_client.get("customers", params=params)
+        items = response.get("data", []) if isinstance(response, dict) else []
+        yield items
+
+        meta = response.get("meta") if isinstance(response, dict) else None
+        next_cursor = (meta or {}).get("next_cursor")
+        if next_cursor:
+            params = {**filters, "limit": page_size, "cursor": next_cursor}
+        elif len(items) == page_size:
+            page += 1
+            params = {**filters, "limit": page_size, "page": page}
+        else:
+            return
+        if page_delay:
+            await asyncio.sleep(page_delay)
+
+
+class CustomerSync:
+    """Feed customer records to local indexes and run the background sync."""
+
+    def __init__(self, indexes: Sequence[Any]):
+        """Initialize the sync.
+
+        Args:
+            indexes: Objects with ``index_customer(customer)`` and
+                ``snapshot()`` methods. Indexes that also have
+                ``customer_ids()`` and ``remove(customer_id)`` are swept
+                after each complete sync.
+        """
+        self.indexes = list(indexes)
+        self.synced_at: Optional[float] = None
+        self.syncing = False
+        self.customers_scanned = 0
+        # Customer IDs seen during the running sync (None when idle)
+        self._seen: Optional[Set[Any]] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def complete(self) -> bool:
+        """Whether at least one full sync has finished."""
+        return self.synced_at is not None
+
+    def index_customer(self, customer: Any):
+        """Add or refresh one customer record in every index."""
+        if self._seen is not None and isinstance(customer, dict) and customer.get("id") is not None:
+            # Records written by tools mid-sync count as seen, even if the walk
+            # already passed their page
+            self._seen.add(customer["id"])
+        for index in self.indexes:
+            index.index_customer(customer)
+
+    def index_response(self, data: Any):
+        """Index a customer, or every customer in a list response."""
+        if isinstance(data, dict) and isinstance(data.get("data"), list):
+            for customer in data["data"]:
+                self.index_customer(customer)
+        else:
+            self.index_customer(data)
+
+    async def sync(self, api_client: Any, page_size: int = 100, page_delay: float = 0.5):
+        """Walk every customer page and index it (see ``iter_customer_pages``).
+
+        Throttled pages are retried after ``Retry-After``. Once the walk
+        completes, customers indexed earlier but not seen in it are removed.
+        A failed walk removes nothing.
+        """
+        self.syncing = True
+        self.customers_scanned = 0
+        self._seen = set()
+        start = time.perf_counter()
+        try:
+            client = RetryingReader(api_client)
+            async for items in iter_customer_pages(client, page_size=page_size, page_delay=page_delay):
+                for customer in items:
+                    self.index_customer(customer)
+                self.customers_scanned += len(items)
+            removed = self._sweep(self._seen)
+            self.synced_at = time.time()
+            logger.info(
+                "Customer indexes synced: %d customers scanned, %d stale entries removed in %.1fs",
+                self.customers_scanned, removed, time.perf_counter() - start
+            )
+        finally:
+            self.syncing = False
+            self._seen = None
+
+    def _sweep(self, seen: Set[Any]) -> int:
+        """Remove customers not in ``seen`` from every sweepable index."""
+        removed = 0
+        for index in self.indexes:
+            if not (hasattr(index, "customer_ids") and hasattr(index, "remove")):
+                continue
+            for customer_id in [cid for cid in index.customer_ids() if cid not in seen]:
+                index.remove(customer_id)
+                removed += 1
+        return removed
+
+    def start(self, api_client: Any, refresh_interval: float = 3600.0, page_delay: float = 0.5):
+        """Sync in the background now and then every ``refresh_interval`` seconds."""
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(
+                self._run(api_client, refresh_interval, page_delay)
+            )
+
+    async def _run(self, api_client: Any, refresh_interval: float, page_delay: float):
+        while True:
+            try:
+                await self.sync(api_client, page_delay=page_delay)
+            except Exception as e:
+                logger.warning("Customer index sync failed: %s", e)
+            if refresh_interval <= 0:
+                return
+            await asyncio.sleep(refresh_interval)
+
+    async def stop(self):
+        """Stop the background sync."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return sync state and the size of each index."""
+        return {
+            "complete": self.complete,
+            "syncing": self.syncing,
+            "customers_scanned": self.customers_scanned,
+            "synced_at": self.synced_at,
+            "indexes": {type(index).__name__: index.snapshot() for index in self.indexes},
+        }
@@ -0,0 +1,170 @@
+"""Streaming duplicate-customer detection.
+
+``DuplicateDetector`` takes customers one at a time and hash-buckets them
+on normalized keys: email (lower-cased, ``+tag`` dropped), E.164 phone and
+name (accent-free, word order ignored). Each key is reduced to a 64-bit
+digest mapped to the first customer that had it, so a pass is linear in
+the number of customers and keeps one small entry per distinct key; only
+customers that actually collide are tracked further.
+
+Shared emails or phones merge customers into clusters (union-find). Names
+are a weaker signal: same-name groups are reported separately, and names
+shared by more than ``max_name_group`` customers are dropped as too common.
+"""
+
+import hashlib
+import unicodedata
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from .phone_index import normalize_phone
+
+
+def _digest(key: str) -> int:
+    return int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), "big")
+
+
+def normalize_email(value: Any) -> Optional[str]:
+    """Lower-case an email and drop any ``+tag`` from the local part."""
+    if not isinstance(value, str) or "@" not in value:
+        return None
+    local, _, domain = value.strip().lower().rpartition("@")
+    local = local.split("+", 1)[0]
+    if not local or not domain:
+        return None
+    return f"{local}@{domain}"
+
+
+def normalize_name(value: Any) -> Optional[str]:
+    """Accent-free, lower-cased name words in sorted order (two words or more)."""
+    if not isinstance(value, str):
+        return None
+    text = unicodedata.normalize("NFKD", value)
+    text = "".join(char if char.isalnum() else " " for char in text if not unicodedata.combining(char))
+    words = sorted(text.lower().split())
+    return " ".join(words) if len(words) >= 2 else None
+
+
+def customer_keys(customer: Dict[str, Any]) -> Set[str]:
+    """Strong match keys (``email:...`` and ``phone:...``) of a customer."""
+    keys = set()
+    email = normalize_email(customer.get("email"))
+    if email:
+        keys.add(f"email:{email}")
+    for channel in customer.get("channels") or []:
+        address = channel.get("address")
+        if channel.get("type") == "email":
+            email = normalize_email(address)
+            if email:
+                keys.add(f"email:{email}")
+        elif channel.get("type") == "phone":
+            phone = normalize_phone(address)
+            if phone:
+                keys.add(f"phone:{phone}")
+    return keys
+
+
+class DuplicateDetector:
+    """Single-pass, hash-bucketed duplicate finder."""
+
+    def __init__(self, include_names: bool = True, max_name_group: int = 5):
+        """Initialize the detector.
+
+        Args:
+            include_names: Also report customers sharing a full name.
+            max_name_group: Name groups larger than this are dropped.
+        """
+        self.include_names = include_names
+        self.max_name_group = max_name_group
+        self.customers_scanned = 0
+        # key digest -> first customer ID with that key
+        self._first: Dict[int, Any] = {}
+        # union-find over customers that share a strong key
+        self._parent: Dict[Any, Any] = {}
+        self._matches: Dict[Any, Set[str]] = {}
+        # name digest -> first customer ID; colliding names get a group
+        self._first_name: Dict[int, Any] = {}
+        self._name_groups: Dict[int, Dict[str, Any]] = {}
+
+    def _find(self, customer_id: Any) -> Any:
+        root = self._parent.setdefault(customer_id, customer_id)
+        while self._parent[root] != root:
+            root = self._parent[root]
+        while customer_id != root:
+            self._parent[customer_id], customer_id = root, self._parent[customer_id]
+        return root
+
+    def _union(self, left: Any, right: Any, key: str):
+        left, right = self._find(left), self._find(right)
+        matches = self._matches.pop(left, set()) | self._matches.pop(right, set())
+        if left != right:
+            self._parent[right] = left
+        matches.add(key)
+        self._matches[left] = matches
+
+    def add(self, customer: Any):
+        """Bucket one customer record."""
+        if not isinstance(customer, dict) or customer.get("id") is None:
+            return
+        customer_id = customer["id"]
+        self.customers_scanned += 1
+
+        for key in customer_keys(customer):
+            owner = self._first.setdefault(_digest(key), customer_id)
+            if owner != customer_id:
+                self._union(owner, customer_id, key)
+
+        if self.include_names:
+            name = normalize_name(customer.get("name") or " ".join(
+                part for part in (customer.get("firstname"), customer.get("lastname")) if part
+            ))
+            if name:
+                digest = _digest(name)
+                owner = self._first_name.setdefault(digest, customer_id)
+                if owner != customer_id:
+                    group = self._name_groups.setdefault(digest, {"name": name, "customer_ids": [owner]})
+                    ids = group["customer_ids"]
+                    if ids is not None and customer_id not in ids:
+                        # Too common to mean anything: stop tracking the group
+                        group["customer_ids"] = ids + [customer_id] if len(ids) < self.max_name_group else None
+
+    def add_many(self, customers: Iterable[Any]):
+        """Bucket every customer from an iterable."""
+        for customer in customers:
+            self.add(customer)
+
+    def clusters(self) -> List[Dict[str, Any]]:
+        """Customers sharing an email or phone, largest clusters first."""
+        members: Dict[Any, List[Any]] = {}
+        for customer_id in self._parent:
+            members.setdefault(self._find(customer_id), []).append(customer_id)
+        clusters = [
+            {"customer_ids": sorted(ids, key=str), "matches": sorted(self._matches.get(root, ()))}
+            for root, ids in members.items() if len(ids) > 1
+        ]
+        clusters.sort(key=lambda cluster: (-len(cluster["customer_ids"]), str(cluster["customer_ids"][0])))
+        return clusters
+
+    def name_groups(self) -> List[Dict[str, Any]]:
+        """Customers sharing a full name, excluding over-common names."""
+        groups = [
+            {"name": group["name"], "customer_ids": group["customer_ids"]}
+            for group in self._name_groups.values() if group["customer_ids"] is not None
+        ]
+        groups.sort(key=lambda group: (-len(group["customer_ids"]), group["name"]))
+        return groups
+
+    def report(self, max_clusters: int = 50) -> Dict[str, Any]:
+        """Counts plus the largest clusters and name groups."""
+        clusters = self.clusters()
+        name_groups = self.name_groups() if self.include_names else []
+        return {
+            "summary": {
+                "customers_scanned": self.customers_scanned,
+                "clusters": len(clusters),
+                "duplicate_customers": sum(len(cluster["customer_ids"]) for cluster in clusters),
+                "name_groups": len(name_groups),
+                "distinct_keys": len(self._first),
+            },
+            "clusters": clusters[:max_clusters],
+            "name_groups": name_groups[:max_clusters],
+        }
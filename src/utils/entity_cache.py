@@ -0,0 +1,86 @@
+"""Write-through cache of full customer records.
+
+Customer mutations send the whole ``channels`` list, so each one needs the
+current record as its base. ``EntityCache`` keeps the latest record seen for
+each customer: it is fed by ``CustomerSync`` like the other local indexes,
+so GET, list, POST and PUT responses all refresh it, and a mutation only
+re-fetches when the entry is missing or older than the TTL. Records without
+``channels`` cannot serve as a merge base, so they drop the entry instead of
+replacing it, and so does a failed write, since the upstream state is then
+unknown.
+"""
+
+import copy
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from . import metrics
+
+cache_entries = metrics.registry.register(metrics.Gauge(
+    "gorgias_mcp_customer_cache_entries", "Customer records in the write-through cache"
+))
+
+
+class EntityCache:
+    """LRU map from customer ID to its latest full record."""
+
+    def __init__(self, ttl: float = 60.0, max_entries: int = 10000, name: str = "customer"):
+        """Initialize the cache.
+
+        Args:
+            ttl: Seconds an entry may be used as a merge base (0 disables the cache).
+            max_entries: Entries kept; the least recently used go first.
+            name: Cache label in the ``gorgias_mcp_cache_*`` metrics.
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.name = name
+        # customer id -> (record, monotonic time stored)
+        self._entries: "OrderedDict[Any, Tuple[Dict[str, Any], float]]" = OrderedDict()
+
+    @classmethod
+    def from_env(cls) -> "EntityCache":
+        """Build a cache from ``MCP_CUSTOMER_CACHE_TTL`` and ``MCP_CUSTOMER_CACHE_SIZE``."""
+        return cls(
+            ttl=float(os.getenv("MCP_CUSTOMER_CACHE_TTL", "60")),
+            max_entries=int(os.getenv("MCP_CUSTOMER_CACHE_SIZE", "10000")),
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def index_customer(self, customer: Any):
+        """Store a full record; a partial one (no channels) drops the entry."""
+        if self.ttl <= 0 or not isinstance(customer, dict) or customer.get("id") is None:
+            return
+        if "channels" not in customer:
+            self.invalidate(customer["id"])
+            return
+        self._entries[customer["id"]] = (copy.deepcopy(customer), time.monotonic())
+        self._entries.move_to_end(customer["id"])
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        cache_entries.set(len(self._entries))
+
+    def get(self, customer_id: Any) -> Optional[Dict[str, Any]]:
+        """Return a copy of a fresh entry, or None if missing or stale."""
+        if self.ttl <= 0:
+            return None
+        entry = self._entries.get(customer_id)
+        fresh = entry is not None and time.monotonic() - entry[1] < self.ttl
+        metrics.record_cache(self.name, fresh)
+        if not fresh:
+            return None
+        self._entries.move_to_end(customer_id)
+        return copy.deepcopy(entry[0])
+
+    def invalidate(self, customer_id: Any):
+        """Drop an entry, e.g. after a failed write."""
+        if self._entries.pop(customer_id, None) is not None:
+            cache_entries.set(len(self._entries))
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return the cache size and settings."""
+        return {"entries": len(self._entries), "ttl_s": self.ttl, "max_entries": self.max_entries}
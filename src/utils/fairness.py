@@ -0,0 +1,130 @@
+"""Per-caller rate limiting for tool calls.
+
+Every caller gets its own token bucket, so one runaway session looping on a
+tool cannot use up the shared Gorgias quota for everyone else. Callers are
+identified by session header (``Mcp-Session-Id`` / ``X-Session-Id`` /
+``X-Call-Id``), then API key (``Authorization``), then client IP: a voice
+platform sends every call with one key, so the session has to come first.
+Identifiers are hashed before they are stored or exported as metric labels.
+
+The limiter is opt-in: set ``MCP_CALLER_RATE`` to enable it.
+"""
+
+import hashlib
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Mapping, Optional
+
+from . import metrics
+
+SESSION_HEADERS = ("Mcp-Session-Id", "X-Session-Id", "X-Call-Id")
+
+caller_calls = metrics.registry.register(metrics.Counter(
+    "gorgias_mcp_caller_calls_total", "Tool calls per caller and outcome", ("caller", "outcome")
+))
+callers_tracked = metrics.registry.register(metrics.Gauge(
+    "gorgias_mcp_callers_tracked", "Callers with a live rate-limit bucket"
+))
+
+
+def _digest(value: str) -> str:
+    return hashlib.sha256(value.encode()).hexdigest()[:12]
+
+
+def caller_key(headers: Mapping[str, str], remote: Optional[str]) -> str:
+    """Derive a stable, hashed caller identifier from request metadata.
+
+    Args:
+        headers: Request headers.
+        remote: Peer address as seen by the server.
+
+    Returns:
+        Identifier such as ``session:1a2b3c4d5e6f``.
+    """
+    for header in SESSION_HEADERS:
+        session = headers.get(header)
+        if session:
+            return f"session:{_digest(session)}"
+    authorization = headers.get("Authorization")
+    if authorization:
+        return f"key:{_digest(authorization)}"
+    # Cloud Run's front end appends the client address to X-Forwarded-For
+    forwarded = headers.get("X-Forwarded-For")
+    address = forwarded.split(",")[0].strip() if forwarded else remote
+    return f"ip:{_digest(address or 'unknown')}"
+
+
+class CallerLimiter:
+    """Token bucket per caller with LRU eviction of idle callers."""
+
+    def __init__(self, rate: float, burst: float, max_callers: int = 10000, metric_callers: int = 100):
+        """Initialize the limiter.
+
+        Args:
+            rate: Tokens added per second for each caller.
+            burst: Bucket capacity, i.e. calls allowed back to back.
+            max_callers: Buckets kept in memory; the least recently used
+                caller is forgotten (and starts with a full bucket again).
+            metric_callers: Distinct callers given their own metric label;
+                later callers are counted as ``other``.
+        """
+        self.rate = rate
+        self.burst = burst
+        self.max_callers = max_callers
+        self.metric_callers = metric_callers
+        # caller -> [tokens, last refill time]
+        self._buckets: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._labelled: set = set()
+
+    @classmethod
+    def from_env(cls) -> Optional["CallerLimiter"]:
+        """Build a limiter from ``MCP_CALLER_RATE`` (unset or 0 disables it)."""
+        rate = float(os.getenv("MCP_CALLER_RATE", "0"))
+        if rate <= 0:
+            return None
+        return cls(rate, burst=float(os.getenv("MCP_CALLER_BURST", "20")))
+
+    def _label(self, caller: str) -> str:
+        if caller in self._labelled:
+            return caller
+        if len(self._labelled) < self.metric_callers:
+            self._labelled.add(caller)
+            return caller
+        return "other"
+
+    def try_acquire(self, caller: str) -> float:
+        """Take one token for a caller.
+
+        Returns:
+            0 if the call may proceed, otherwise the seconds until a token
+            becomes available.
+        """
+        now = time.monotonic()
+        bucket = self._buckets.get(caller)
+        if bucket is None:
+            bucket = self._buckets[caller] = [self.burst, now]
+            if len(self._buckets) > self.max_callers:
+                self._buckets.popitem(last=False)
+            callers_tracked.set(len(self._buckets))
+        else:
+            self._buckets.move_to_end(caller)
+            bucket[0] = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate)
+            bucket[1] = now
+
+        if bucket[0] >= 1.0:
+            bucket[0] -= 1.0
+            caller_calls.inc(self._label(caller), "admitted")
+            return 0.0
+        caller_calls.inc(self._label(caller), "throttled")
+        return (1.0 - bucket[0]) / self.rate
+
+    def snapshot(self, top: int = 10) -> Dict[str, Any]:
+        """Return limiter settings and the callers with the emptiest buckets."""
+        busiest = sorted(self._buckets.items(), key=lambda item: item[1][0])[:top]
+        return {
+            "rate_per_s": self.rate,
+            "burst": self.burst,
+            "callers": len(self._buckets),
+            "busiest": [{"caller": caller, "tokens": round(tokens, 2)} for caller, (tokens, _) in busiest],
+        }
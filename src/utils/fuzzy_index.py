@@ -0,0 +1,134 @@
+"""Trigram index for fuzzy customer name and email search.
+
+Speech-to-text often misspells names ("Tony Kats" for "Tony Katz"), which the
+Gorgias ``customers`` filter does not match. ``TrigramIndex`` breaks names
+and emails into character trigrams (as PostgreSQL ``pg_trgm`` does) and keeps
+an inverted index from trigram to customers. A query gathers candidates
+sharing trigrams with it and ranks them by Dice similarity, which takes a
+few milliseconds even for large customer bases.
+"""
+
+import re
+import unicodedata
+from collections import Counter
+from typing import Any, Dict, FrozenSet, List, Optional, Set
+
+from . import metrics
+from .phone_index import customer_email
+
+_NON_ALNUM = re.compile(r"[^0-9a-z]+")
+
+# Candidates (by shared trigram count) scored exactly per query
+MAX_CANDIDATES = 500
+
+fuzzy_index_size = metrics.registry.register(metrics.Gauge(
+    "gorgias_mcp_fuzzy_index_customers", "Customers in the fuzzy name/email index"
+))
+
+
+def _normalize(text: str) -> str:
+    text = unicodedata.normalize("NFKD", text)
+    text = "".join(char for char in text if not unicodedata.combining(char))
+    return _NON_ALNUM.sub(" ", text.lower()).strip()
+
+
+def trigrams(text: Optional[str]) -> FrozenSet[str]:
+    """Return the padded character trigrams of each word in ``text``."""
+    if not text:
+        return frozenset()
+    grams: Set[str] = set()
+    for word in _normalize(text).split():
+        padded = f"  {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return frozenset(grams)
+
+
+def similarity(left: FrozenSet[str], right: FrozenSet[str]) -> float:
+    """Dice coefficient of two trigram sets."""
+    if not left or not right:
+        return 0.0
+    return 2 * len(left & right) / (len(left) + len(right))
+
+
+class TrigramIndex:
+    """Inverted trigram index over customer names and emails."""
+
+    def __init__(self):
+        """Initialize an empty index."""
+        self._postings: Dict[str, Set[Any]] = {}
+        # customer id -> (summary, name trigrams, email trigrams)
+        self._customers: Dict[Any, tuple] = {}
+
+    def __len__(self) -> int:
+        return len(self._customers)
+
+    def customer_ids(self) -> List[Any]:
+        """Return the IDs of the indexed customers."""
+        return list(self._customers)
+
+    def index_customer(self, customer: Any):
+        """Add or refresh one customer record."""
+        if not isinstance(customer, dict) or customer.get("id") is None:
+            return
+        customer_id = customer["id"]
+        name = customer.get("name") or " ".join(
+            part for part in (customer.get("firstname"), customer.get("lastname")) if part
+        )
+        email = customer_email(customer)
+        name_grams = trigrams(name)
+        # Only the local part of an email carries the person's name
+        email_grams = trigrams(email.split("@")[0]) if email else frozenset()
+
+        self.remove(customer_id)
+        if not name_grams and not email_grams:
+            return
+        summary = {"id": customer_id, "name": name or None, "email": email}
+        self._customers[customer_id] = (summary, name_grams, email_grams)
+        for gram in name_grams | email_grams:
+            self._postings.setdefault(gram, set()).add(customer_id)
+        fuzzy_index_size.set(len(self._customers))
+
+    def remove(self, customer_id: Any):
+        """Drop a customer from the index."""
+        previous = self._customers.pop(customer_id, None)
+        if previous is None:
+            return
+        fuzzy_index_size.set(len(self._customers))
+        for gram in previous[1] | previous[2]:
+            owners = self._postings.get(gram)
+            if owners is not None:
+                owners.discard(customer_id)
+                if not owners:
+                    del self._postings[gram]
+
+    def search(self, query: str, limit: int = 10, threshold: float = 0.3) -> List[Dict[str, Any]]:
+        """Return customers ranked by similarity to ``query``.
+
+        Args:
+            query: Name or email as heard or typed.
+            limit: Maximum number of matches.
+            threshold: Minimum similarity between 0 and 1.
+
+        Returns:
+            Customer summaries with a ``score`` field, best first.
+        """
+        query_grams = trigrams(query.split("@")[0] if "@" in query else query)
+        if not query_grams:
+            return []
+
+        shared: Counter = Counter()
+        for gram in query_grams:
+            shared.update(self._postings.get(gram, ()))
+
+        matches = []
+        for customer_id, _ in shared.most_common(MAX_CANDIDATES):
+            summary, name_grams, email_grams = self._customers[customer_id]
+            score = max(similarity(query_grams, name_grams), similarity(query_grams, email_grams))
+            if score >= threshold:
+                matches.append({**summary, "score": round(score, 3)})
+        matches.sort(key=lambda match: -match["score"])
+        return matches[:limit]
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return the index size."""
+        return {"customers": len(self._customers), "trigrams": len(self._postings)}
@@ -0,0 +1,111 @@
+"""Background upstream readiness probe.
+
+The probe calls Gorgias on a timer and caches the outcome, so readiness
+checks only read the cached state and never trigger upstream requests.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Dict, Optional
+
+from .api_client import GorgiasAPIClient
+
+logger = logging.getLogger(__name__)
+
+
+class ReadinessProbe:
+    """Periodically check that the Gorgias API is reachable."""
+
+    # Cheap authenticated endpoint that exercises credentials and connectivity
+    PROBE_ENDPOINT = "account"
+
+    def __init__(
+        self,
+        api_client: GorgiasAPIClient,
+        interval: float = 30.0,
+        timeout: float = 5.0,
+        failure_threshold: int = 3
+    ):
+        """Initialize the readiness probe.
+
+        Args:
+            api_client: Client used to reach Gorgias.
+            interval: Seconds between probes.
+            timeout: Timeout for each probe request.
+            failure_threshold: Consecutive failures before reporting not ready.
+        """
+        self.api_client = api_client
+        self.interval = interval
+        self.timeout = timeout
+        self.failure_threshold = failure_threshold
+        self.reachable: Optional[bool] = None
+        self.consecutive_failures = 0
+        self.last_checked: Optional[float] = None
+        self.last_success: Optional[float] = None
+        self.last_latency_ms: Optional[float] = None
+        self.last_error: Optional[str] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        """Start probing in the background on the running loop."""
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        """Stop the background probe."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self):
+        while True:
+            await self.check()
+            await asyncio.sleep(self.interval)
+
+    async def check(self):
+        """Run one probe and update the cached state."""
+        start = time.perf_counter()
+        try:
+            await self.api_client._make_request("GET", self.PROBE_ENDPOINT, timeout=self.timeout)
+        except Exception as e:
+            self.consecutive_failures += 1
+            self.last_error = f"{type(e).__name__}: {e}"
+            if self.consecutive_failures >= self.failure_threshold:
+                if self.reachable is not False:
+                    logger.warning(f"Gorgias API unreachable: {self.last_error}")
+                self.reachable = False
+        else:
+            if self.reachable is False:
+                logger.info("Gorgias API reachable again")
+            self.reachable = True
+            self.consecutive_failures = 0
+            self.last_error = None
+            self.last_success = time.time()
+        finally:
+            self.last_checked = time.time()
+            self.last_latency_ms = round((time.perf_counter() - start) * 1000, 1)
+
+    @property
+    def ready(self) -> bool:
+        """Whether the cached probe state allows serving traffic."""
+        return self.reachable is True
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return the cached upstream and pool state."""
+        return {
+            "upstream": {
+                "reachable": self.reachable,
+                "consecutive_failures": self.consecutive_failures,
+                "last_checked": self.last_checked,
+                "last_success": self.last_success,
+                "last_latency_ms": self.last_latency_ms,
+                "last_error": self.last_error,
+                "probe_interval_s": self.interval
+            },
+            "pool": self.api_client.pool_status()
+        }
@@ -0,0 +1,232 @@
+"""Background job mode for long-running tool calls.
+
+A ``tools/call`` with ``"background": true`` returns a job ID at once; the
+call itself runs in a bounded pool of background tasks. Clients poll
+``GET /jobs/{id}`` or stream ``GET /jobs/{id}/events`` (SSE), and a dropped
+stream resumes from ``Last-Event-ID`` because every job keeps its ordered
+event log until it expires.
+
+Jobs live in the memory of the process that started them.
+"""
+
+import asyncio
+import logging
+import os
+import secrets
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from . import metrics
+
+logger = logging.getLogger(__name__)
+
+PENDING = "pending"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+CANCELLED = "cancelled"
+FINISHED_STATES = frozenset({SUCCEEDED, FAILED, CANCELLED})
+
+jobs_total = metrics.registry.register(metrics.Counter(
+    "gorgias_mcp_jobs_total", "Background jobs by final status", ("status",)
+))
+jobs_active = metrics.registry.register(metrics.Gauge(
+    "gorgias_mcp_jobs_active", "Background jobs by current state", ("status",)
+))
+
+
+class JobLimitExceeded(Exception):
+    """Raised when too many jobs are waiting to run."""
+
+
+class Job:
+    """One background tool call and its event log."""
+
+    def __init__(self, job_id: str, tool: str, arguments: Dict[str, Any]):
+        self.id = job_id
+        self.tool = tool
+        self.arguments = arguments
+        self.status = PENDING
+        self.created = time.time()
+        self.started: Optional[float] = None
+        self.finished: Optional[float] = None
+        self.result: Optional[str] = None
+        self.error: Optional[str] = None
+        self.events: List[Dict[str, Any]] = []
+        self.task: Optional[asyncio.Task] = None
+        self._changed = asyncio.Condition()
+
+    @property
+    def done(self) -> bool:
+        """Whether the job reached a final state."""
+        return self.status in FINISHED_STATES
+
+    async def _set_status(self, status: str, **extra: Any):
+        jobs_active.dec(self.status)
+        self.status = status
+        if status not in FINISHED_STATES:
+            jobs_active.inc(status)
+        event = {"job_id": self.id, "status": status}
+        event.update(extra)
+        async with self._changed:
+            # Event IDs are 1-based positions in the log
+            self.events.append(event)
+            self._changed.notify_all()
+
+    async def wait_for_events(self, after: int, timeout: float) -> List[Dict[str, Any]]:
+        """Return events after the given event ID, waiting up to ``timeout``."""
+        async with self._changed:
+            if len(self.events) <= after and not self.done:
+                try:
+                    await asyncio.wait_for(self._changed.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+            return self.events[after:]
+
+    def to_dict(self, include_result: bool = True) -> Dict[str, Any]:
+        """Serialize the job's state for a status response."""
+        data = {
+            "job_id": self.id,
+            "tool": self.tool,
+            "status": self.status,
+            "created": self.created,
+            "started": self.started,
+            "finished": self.finished,
+            "last_event_id": len(self.events),
+        }
+        if include_result and self.done:
+            data["result"] = self.result
+            data["error"] = self.error
+        return data
+
+
+class JobManager:
+    """Run tool calls in a bounded pool of background tasks."""
+
+    def __init__(
+        self,
+        runner: Callable[[str, Dict[str, Any]], Awaitable[str]],
+        concurrency: int = 4,
+        max_pending: int = 100,
+        ttl: float = 3600.0,
+        max_jobs: int = 1000,
+        is_error: Optional[Callable[[str], bool]] = None
+    ):
+        """Initialize the job manager.
+
+        Args:
+            runner: Coroutine function executing a tool call, e.g.
+                ``GorgiasMCPServer.handle_tool_call``.
+            concurrency: Jobs allowed to run at the same time.
+            max_pending: Jobs allowed to wait for a free slot.
+            ttl: Seconds a finished job (and its result) is kept.
+            max_jobs: Jobs kept in memory; the oldest finished ones go first.
+            is_error: Classifies a returned result as a failure, for runners
+                that report errors as text instead of raising.
+        """
+        self.runner = runner
+        self.is_error = is_error
+        self.concurrency = concurrency
+        self.max_pending = max_pending
+        self.ttl = ttl
+        self.max_jobs = max_jobs
+        self._slots = asyncio.Semaphore(concurrency)
+        self._jobs: "OrderedDict[str, Job]" = OrderedDict()
+
+    @classmethod
+    def from_env(
+        cls,
+        runner: Callable[[str, Dict[str, Any]], Awaitable[str]],
+        is_error: Optional[Callable[[str], bool]] = None
+    ) -> "JobManager":
+        """Build a job manager configured from ``MCP_JOB_*`` variables."""
+        return cls(
+            runner,
+            concurrency=int(os.getenv("MCP_JOB_CONCURRENCY", "4")),
+            max_pending=int(os.getenv("MCP_JOB_MAX_PENDING", "100")),
+            ttl=float(os.getenv("MCP_JOB_TTL", "3600")),
+            is_error=is_error,
+        )
+
+    @property
+    def pending(self) -> int:
+        """Number of jobs waiting for a slot."""
+        return sum(1 for job in self._jobs.values() if job.status == PENDING)
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """Look up a job by ID."""
+        self._expire()
+        return self._jobs.get(job_id)
+
+    async def submit(self, tool: str, arguments: Dict[str, Any]) -> Job:
+        """Create a job and schedule it.
+
+        Raises:
+            JobLimitExceeded: If ``max_pending`` jobs are already waiting.
+        """
+        self._expire()
+        if self.pending >= self.max_pending:
+            raise JobLimitExceeded("Too many background jobs are waiting")
+
+        job = Job(secrets.token_urlsafe(16), tool, arguments)
+        self._jobs[job.id] = job
+        jobs_active.inc(PENDING)
+        job.events.append({"job_id": job.id, "status": PENDING})
+        job.task = asyncio.get_running_loop().create_task(self._run(job))
+        return job
+
+    async def cancel(self, job_id: str) -> bool:
+        """Cancel a job that has not finished yet."""
+        job = self._jobs.get(job_id)
+        if job is None or job.done or job.task is None:
+            return False
+        job.task.cancel()
+        try:
+            await job.task
+        except asyncio.CancelledError:
+            pass
+        return True
+
+    async def _run(self, job: Job):
+        try:
+            async with self._slots:
+                job.started = time.time()
+                await job._set_status(RUNNING)
+                job.result = await self.runner(job.tool, job.arguments)
+            job.finished = time.time()
+            if self.is_error is not None and self.is_error(job.result):
+                job.error = job.result
+                await job._set_status(FAILED, error=job.error)
+            else:
+                await job._set_status(SUCCEEDED, result=job.result)
+        except asyncio.CancelledError:
+            job.finished = time.time()
+            await job._set_status(CANCELLED)
+            raise
+        except Exception as e:
+            logger.error("Background job %s (%s) failed: %s", job.id, job.tool, e)
+            job.error = str(e)
+            job.finished = time.time()
+            await job._set_status(FAILED, error=job.error)
+        finally:
+            jobs_total.inc(job.status)
+
+    def _expire(self):
+        now = time.time()
+        for job_id, job in list(self._jobs.items()):
+            if job.done and now - job.finished > self.ttl:
+                del self._jobs[job_id]
+        overflow = len(self._jobs) - self.max_jobs
+        for job_id, job in list(self._jobs.items()):
+            if overflow <= 0:
+                break
+            if job.done:
+                del self._jobs[job_id]
+                overflow -= 1
+
+    async def shutdown(self):
+        """Cancel every unfinished job."""
+        for job in list(self._jobs.values()):
+            if not job.done:
+                await self.cancel(job.id)
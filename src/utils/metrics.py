@@ -0,0 +1,280 @@
+"""Lightweight Prometheus-style metrics for the Gorgias MCP server.
+
+Metrics are recorded in-process with plain dict and list operations, so
+recording on the hot path costs one dict lookup plus a bisect per histogram
+observation. ``render()`` produces the Prometheus text exposition format.
+
+In multi-worker mode every worker process keeps its own registry.
+"""
+
+import bisect
+import re
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+# Latency buckets in seconds, from fast local work to slow upstream pages
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+_ID_SEGMENT = re.compile(r"/\d+(?=/|$)")
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    parts = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    """Base class holding name, help text and label names."""
+
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+
+    def _header(self) -> List[str]:
+        return [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.kind}",
+        ]
+
+
+class Counter(_Metric):
+    """Monotonically increasing counter."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, *labels: str, amount: float = 1.0):
+        """Increment the counter for the given label values."""
+        self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def get(self, *labels: str) -> float:
+        """Return the current value for the given label values."""
+        return self._values.get(labels, 0.0)
+
+    def items(self) -> Iterable[Tuple[Tuple[str, ...], float]]:
+        """Iterate over (label values, value) pairs."""
+        return list(self._values.items())
+
+    def render(self) -> List[str]:
+        lines = self._header()
+        for labels, value in sorted(self._values.items()):
+            lines.append(f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}")
+        return lines
+
+
+class Gauge(_Metric):
+    """Value that can go up and down."""
+
+    kind = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def set(self, value: float, *labels: str):
+        """Set the gauge for the given label values."""
+        self._values[labels] = value
+
+    def inc(self, *labels: str, amount: float = 1.0):
+        """Increase the gauge."""
+        self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def dec(self, *labels: str, amount: float = 1.0):
+        """Decrease the gauge."""
+        self._values[labels] = self._values.get(labels, 0.0) - amount
+
+    def get(self, *labels: str) -> float:
+        """Return the current value for the given label values."""
+        return self._values.get(labels, 0.0)
+
+    def render(self) -> List[str]:
+        lines = self._header()
+        for labels, value in sorted(self._values.items()):
+            lines.append(f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}")
+        return lines
+
+
+class Histogram(_Metric):
+    """Cumulative histogram with fixed buckets."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(buckets)
+        # Per label set: [bucket counts..., +Inf count], sum
+        self._series: Dict[Tuple[str, ...], List] = {}
+
+    def observe(self, value: float, *labels: str):
+        """Record one observation for the given label values."""
+        series = self._series.get(labels)
+        if series is None:
+            series = self._series[labels] = [[0] * (len(self.buckets) + 1), 0.0]
+        series[0][bisect.bisect_left(self.buckets, value)] += 1
+        series[1] += value
+
+    def count(self, *labels: str) -> int:
+        """Return the number of observations for the given label values."""
+        series = self._series.get(labels)
+        return sum(series[0]) if series else 0
+
+    def total_count(self) -> int:
+        """Return the number of observations across all label values."""
+        return sum(sum(series[0]) for series in self._series.values())
+
+    def render(self) -> List[str]:
+        lines = self._header()
+        for labels, (counts, total) in sorted(self._series.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                le = f'le="{_format_value(bound)}"'
+                lines.append(
+                    f"{self.name}_bucket{_format_labels(self.labelnames, labels, le)} {cumulative}"
+                )
+            label_str = _format_labels(self.labelnames, labels)
+            lines.append(f"{self.name}_sum{label_str} {_format_value(total)}")
+            lines.append(f"{self.name}_count{label_str} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """Collection of metrics rendered together."""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+
+    def register(self, metric: _Metric) -> _Metric:
+        """Register a metric and return it."""
+        self._metrics[metric.name] = metric
+        return metric
+
+    def get(self, name: str) -> Optional[_Metric]:
+        """Look up a registered metric by name."""
+        return self._metrics.get(name)
+
+    def render(self) -> str:
+        """Render all metrics in the Prometheus text exposition format."""
+        lines: List[str] = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+tool_calls = registry.register(Counter(
+    "gorgias_mcp_tool_calls_total", "Tool calls by tool and outcome", ("tool", "outcome")
+))
+tool_duration = registry.register(Histogram(
+    "gorgias_mcp_tool_duration_seconds", "Tool call latency", ("tool",)
+))
+tool_calls_in_flight = registry.register(Gauge(
+    "gorgias_mcp_tool_calls_in_flight", "Tool calls currently executing"
+))
+http_requests = registry.register(Counter(
+    "gorgias_mcp_http_requests_total", "HTTP requests by route and status", ("route", "status")
+))
+http_requests_in_flight = registry.register(Gauge(
+    "gorgias_mcp_http_requests_in_flight", "HTTP requests currently being served"
+))
+upstream_requests = registry.register(Histogram(
+    "gorgias_upstream_request_duration_seconds",
+    "Gorgias API request latency by method, endpoint template and status",
+    ("method", "endpoint", "status")
+))
+upstream_in_flight = registry.register(Gauge(
+    "gorgias_upstream_requests_in_flight", "Gorgias API requests currently in flight"
+))
+rate_limit_remaining = registry.register(Gauge(
+    "gorgias_upstream_rate_limit_remaining", "Remaining Gorgias API calls in the current window"
+))
+rate_limit_limit = registry.register(Gauge(
+    "gorgias_upstream_rate_limit_limit", "Gorgias API call limit for the current window"
+))
+cache_requests = registry.register(Counter(
+    "gorgias_mcp_cache_requests_total", "Cache lookups by cache and result", ("cache", "result")
+))
+cache_hit_ratio = registry.register(Gauge(
+    "gorgias_mcp_cache_hit_ratio", "Cache hit ratio since start", ("cache",)
+))
+
+
+def summary() -> Dict[str, int]:
+    """Return headline totals, e.g. for a final log line at shutdown."""
+    calls = tool_calls.items()
+    return {
+        "tool_calls": int(sum(value for _, value in calls)),
+        "tool_errors": int(sum(value for labels, value in calls if labels[1] == "error")),
+        "upstream_requests": upstream_requests.total_count(),
+    }
+
+
+def endpoint_template(endpoint: str) -> str:
+    """Collapse numeric path segments so endpoints form a bounded label set.
+
+    ``customers/123/`` becomes ``customers/{id}``.
+    """
+    path = "/" + endpoint.strip("/")
+    return _ID_SEGMENT.sub("/{id}", path).lstrip("/")
+
+
+def record_tool_call(tool: str, elapsed: float, outcome: str):
+    """Record a finished tool call."""
+    tool_calls.inc(tool, outcome)
+    tool_duration.observe(elapsed, tool)
+
+
+def record_upstream(method: str, endpoint: str, status: str, elapsed: float):
+    """Record a finished Gorgias API request."""
+    upstream_requests.observe(elapsed, method, endpoint_template(endpoint), status)
+
+
+def record_rate_limit(header_value: Optional[str]):
+    """Update rate-limit gauges from an ``X-Gorgias-Account-Api-Call-Limit`` header.
+
+    The header has the form ``used/limit``, e.g. ``12/40``.
+    """
+    if not header_value:
+        return
+    used, _, limit = header_value.partition("/")
+    try:
+        used_calls = int(used)
+        limit_calls = int(limit)
+    except ValueError:
+        return
+    rate_limit_limit.set(limit_calls)
+    rate_limit_remaining.set(max(0, limit_calls - used_calls))
+
+
+def record_cache(cache: str, hit: bool):
+    """Record a cache lookup and refresh the cache's hit ratio."""
+    cache_requests.inc(cache, "hit" if hit else "miss")
+    hits = cache_requests.get(cache, "hit")
+    total = hits + cache_requests.get(cache, "miss")
+    cache_hit_ratio.set(hits / total, cache)
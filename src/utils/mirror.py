@@ -0,0 +1,774 @@
+"""Incremental local mirror of Gorgias customers and tickets in SQLite.
+
+``MirrorSync`` pages through ``customers`` and ``tickets`` ordered by
+``updated_datetime`` (newest first) and stops at the high-water mark of the
+last completed run, so each run only transfers what changed. Every page is
+written together with a checkpoint (the next page's parameters and the
+run's high-water mark) in one transaction; after a restart an interrupted
+run resumes from its checkpoint instead of starting over.
+
+The store uses WAL mode, so reads (``MirrorStore.query_*``, on their own
+connection) never block on the sync writer. ``read_mirror`` serves tool
+reads from the store, in a worker thread, when the last complete run is recent enough for the
+caller's ``max_staleness``. Deltas do not carry deletions: a periodic sweep
+walks every customer ID and drops mirrored customers that no longer exist
+(deleted or merged upstream). Deleted tickets stay until the store is
+rebuilt.
+
+Tickets are also full-text indexed (SQLite FTS5, Porter-stemmed) on their
+subject and message bodies, for ``MirrorStore.search_tickets`` with BM25
+ranking and snippets. A ticket is indexed with its ``excerpt`` as soon as
+it is mirrored. With ``MCP_MIRROR_MESSAGES`` on, tickets whose messages are
+older than the ticket itself get their messages fetched after each ticket
+run, so an interrupted message pass simply continues on the next run.
+
+Configuration:
+
+* ``MCP_MIRROR_PATH``: SQLite file; the mirror is disabled when unset
+* ``MCP_MIRROR_INTERVAL``: seconds between delta runs (default 300)
+* ``MCP_MIRROR_PAGE_DELAY``: pause between pages (default 0.5)
+* ``MCP_MIRROR_MESSAGES``: fetch message bodies for full-text search
+  (default false; one request per ticket, so the first run walks the
+  whole ticket history)
+* ``MCP_MIRROR_SWEEP_INTERVAL``: seconds between customer deletion sweeps
+  (default 86400, 0 disables; each sweep pages through every customer)
+"""
+
+import asyncio
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+from . import metrics
+from .bulk import RetryingReader
+from .customer_sync import iter_customer_pages
+
+logger = logging.getLogger(__name__)
+
+ENTITIES = ("customers", "tickets")
+
+# sync_state row whose ``synced_at`` is the start of the last customer sweep
+SWEEP_STATE = "customers_sweep"
+
+mirror_rows = metrics.registry.register(metrics.Gauge(
+    "gorgias_mcp_mirror_rows", "Records in the local mirror", ("entity",)
+))
+mirror_synced = metrics.registry.register(metrics.Counter(
+    "gorgias_mcp_mirror_synced_total", "Records written to the local mirror", ("entity",)
+))
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS customers (
+    id INTEGER PRIMARY KEY,
+    email TEXT,
+    name TEXT,
+    updated_datetime TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS customers_email ON customers (email);
+CREATE INDEX IF NOT EXISTS customers_updated ON customers (updated_datetime);
+CREATE TABLE IF NOT EXISTS tickets (
+    id INTEGER PRIMARY KEY,
+    customer_id INTEGER,
+    status TEXT,
+    updated_datetime TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS tickets_customer ON tickets (customer_id, updated_datetime);
+CREATE INDEX IF NOT EXISTS tickets_updated ON tickets (updated_datetime);
+CREATE TABLE IF NOT EXISTS ticket_messages (
+    ticket_id INTEGER PRIMARY KEY,
+    body TEXT,
+    updated_datetime TEXT
+);
+CREATE TABLE IF NOT EXISTS sync_state (
+    entity TEXT PRIMARY KEY,
+    cursor TEXT,
+    run_high_water TEXT,
+    resume_params TEXT,
+    run_started REAL,
+    synced_at REAL
+);
+"""
+
+
+_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS ticket_fts USING fts5(
+    subject, body, tokenize = 'porter unicode61 remove_diacritics 2'
+);
+"""
+
+_STATE_FIELDS = ("entity", "cursor", "run_high_water", "resume_params", "run_started", "synced_at")
+
+# BM25 column weights: a hit in the subject counts more than one in a message
+_FTS_WEIGHTS = (4.0, 1.0)
+
+_HTML_TAG = re.compile(r"<[^>]+>")
+_SEARCH_TERM = re.compile(r"\w+")
+
+_PENDING_MESSAGES = (
+    "FROM tickets t LEFT JOIN ticket_messages m ON m.ticket_id = t.id "
+    "WHERE (m.ticket_id IS NULL OR m.updated_datetime IS NOT t.updated_datetime)"
+)
+
+_FTS_REFRESH = (
+    "INSERT INTO ticket_fts (rowid, subject, body) "
+    "SELECT t.id, json_extract(t.data, '$.subject'), "
+    "COALESCE(NULLIF(m.body, ''), json_extract(t.data, '$.excerpt')) "
+    "FROM tickets t LEFT JOIN ticket_messages m ON m.ticket_id = t.id WHERE t.id = ?"
+)
+
+
+def _ticket_customer_id(ticket: Dict[str, Any]) -> Optional[Any]:
+    customer = ticket.get("customer")
+    if isinstance(customer, dict):
+        return customer.get("id")
+    return ticket.get("customer_id")
+
+
+def _read_state(conn: sqlite3.Connection, entity: str) -> Dict[str, Any]:
+    row = conn.execute(
+        f"SELECT {', '.join(_STATE_FIELDS)} FROM sync_state WHERE entity = ?", (entity,)
+    ).fetchone()
+    state = dict(zip(_STATE_FIELDS, row or (entity,) + (None,) * (len(_STATE_FIELDS) - 1)))
+    state["resume_params"] = json.loads(state["resume_params"]) if state["resume_params"] else None
+    return state
+
+
+def message_text(message: Dict[str, Any]) -> str:
+    """Plain text of a ticket message."""
+    text = message.get("body_text") or message.get("stripped_text")
+    if not text and message.get("body_html"):
+        text = _HTML_TAG.sub(" ", message["body_html"])
+    return " ".join(" ".join(part.split()) for part in (message.get("subject"), text) if part)
+
+
+def match_expression(query: str) -> Optional[str]:
+    """FTS5 query requiring every word of free text (operators are not interpreted)."""
+    terms = _SEARCH_TERM.findall(query)
+    return " ".join(f'"{term}"' for term in terms) if terms else None
+
+
+class MirrorStore:
+    """SQLite tables for mirrored records and per-entity sync checkpoints."""
+
+    def __init__(self, path: str):
+        """Open (or create) the store.
+
+        Args:
+            path: SQLite database file.
+        """
+        self.path = path
+        # Worker processes may share the file; wait for each other's writes
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False, isolation_level=None)
+        self._lock = threading.Lock()
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(_SCHEMA)
+            try:
+                self._conn.executescript(_FTS_SCHEMA)
+                self.full_text = True
+            except sqlite3.OperationalError:
+                logger.warning("SQLite has no FTS5 support; local ticket search is disabled")
+                self.full_text = False
+            if self.full_text:
+                # Index tickets mirrored before full-text search existed
+                self._conn.execute(
+                    "INSERT INTO ticket_fts (rowid, subject, body) "
+                    "SELECT id, json_extract(data, '$.subject'), json_extract(data, '$.excerpt') FROM tickets "
+                    "WHERE id NOT IN (SELECT rowid FROM ticket_fts)"
+                )
+        self._reader = sqlite3.connect(path, timeout=30, check_same_thread=False, isolation_level=None)
+        self._reader_lock = threading.Lock()
+        for entity in ENTITIES:
+            mirror_rows.set(self.count(entity), entity)
+
+    def close(self):
+        """Close the database connections."""
+        with self._lock:
+            self._conn.close()
+        with self._reader_lock:
+            self._reader.close()
+
+    def _query(self, sql: str, params: List[Any]) -> List[Dict[str, Any]]:
+        with self._reader_lock:
+            rows = self._reader.execute(sql, params).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def iter_records(self, entity: str, batch_size: int = 500) -> Iterator[Dict[str, Any]]:
+        """Yield every mirrored record of an entity, one batch in memory at a time."""
+        last_id = None
+        while True:
+            with self._reader_lock:
+                rows = self._reader.execute(
+                    f"SELECT id, data FROM {entity} WHERE ? IS NULL OR id > ? ORDER BY id LIMIT ?",
+                    (last_id, last_id, batch_size)
+                ).fetchall()
+            for _, data in rows:
+                yield json.loads(data)
+            if len(rows) < batch_size:
+                return
+            last_id = rows[-1][0]
+
+    def query_customers(
+        self,
+        name: Optional[str] = None,
+        email: Optional[str] = None,
+        created_after: Optional[str] = None,
+        created_before: Optional[str] = None,
+        limit: int = 50,
+        offset: int = 0
+    ) -> List[Dict[str, Any]]:
+        """Mirrored customers matching the ``list_customers`` filters, newest first."""
+        clauses, params = [], []
+        if name:
+            clauses.append("name = ? COLLATE NOCASE")
+            params.append(name)
+        if email:
+            clauses.append("email = ? COLLATE NOCASE")
+            params.append(email)
+        if created_after:
+            clauses.append("json_extract(data, '$.created_datetime') > ?")
+            params.append(created_after)
+        if created_before:
+            clauses.append("json_extract(data, '$.created_datetime') < ?")
+            params.append(created_before)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        return self._query(
+            f"SELECT data FROM customers {where} ORDER BY updated_datetime DESC, id DESC LIMIT ? OFFSET ?",
+            params + [limit, offset]
+        )
+
+    def query_tickets(
+        self,
+        status: Optional[str] = None,
+        priority: Optional[str] = None,
+        assignee_id: Optional[int] = None,
+        customer_id: Optional[int] = None,
+        limit: int = 50,
+        offset: int = 0
+    ) -> List[Dict[str, Any]]:
+        """Mirrored tickets matching the ``list_tickets`` filters, newest first."""
+        clauses, params = [], []
+        if status:
+            clauses.append("status = ?")
+            params.append(status)
+        if priority:
+            clauses.append("json_extract(data, '$.priority') = ?")
+            params.append(priority)
+        if assignee_id is not None:
+            clauses.append("json_extract(data, '$.assignee_user.id') = ?")
+            params.append(assignee_id)
+        if customer_id is not None:
+            clauses.append("customer_id = ?")
+            params.append(customer_id)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        return self._query(
+            f"SELECT data FROM tickets {where} ORDER BY updated_datetime DESC, id DESC LIMIT ? OFFSET ?",
+            params + [limit, offset]
+        )
+
+    def record_ids(self, entity: str) -> List[Any]:
+        """IDs of every mirrored record of an entity."""
+        with self._reader_lock:
+            return [row[0] for row in self._reader.execute(f"SELECT id FROM {entity}")]
+
+    def count(self, entity: str) -> int:
+        """Number of mirrored records of an entity."""
+        with self._reader_lock:
+            return self._reader.execute(f"SELECT COUNT(*) FROM {entity}").fetchone()[0]
+
+    def state(self, entity: str) -> Dict[str, Any]:
+        """Return the sync checkpoint of an entity."""
+        with self._reader_lock:
+            return _read_state(self._reader, entity)
+
+    def synced_at(self, entity: str) -> Optional[float]:
+        """Wall-clock start of the last complete run: the mirror has every change before it."""
+        return self.state(entity)["synced_at"]
+
+    def apply_page(
+        self,
+        entity: str,
+        records: Iterable[Dict[str, Any]],
+        run_high_water: Optional[str],
+        resume_params: Optional[Dict[str, Any]],
+        run_started: float
+    ) -> int:
+        """Upsert a page of records and save the checkpoint atomically.
+
+        Args:
+            entity: ``customers`` or ``tickets``.
+            records: Records from the API.
+            run_high_water: Newest ``updated_datetime`` seen in this run.
+            resume_params: Request parameters for the next page, or None
+                when the run is complete; the high-water mark then becomes
+                the cursor for the next run.
+            run_started: Wall-clock start of the run.
+
+        Returns:
+            Records written.
+        """
+        if entity == "customers":
+            sql = (
+                "INSERT OR REPLACE INTO customers (id, email, name, updated_datetime, data) "
+                "VALUES (?, ?, ?, ?, ?)"
+            )
+            rows = [
+                (r["id"], r.get("email"), r.get("name"), r.get("updated_datetime"), json.dumps(r, default=str))
+                for r in records if r.get("id") is not None
+            ]
+        else:
+            sql = (
+                "INSERT OR REPLACE INTO tickets (id, customer_id, status, updated_datetime, data) "
+                "VALUES (?, ?, ?, ?, ?)"
+            )
+            rows = [
+                (r["id"], _ticket_customer_id(r), r.get("status"), r.get("updated_datetime"),
+                 json.dumps(r, default=str))
+                for r in records if r.get("id") is not None
+            ]
+
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                # Read the checkpoint under the write lock so it cannot change underneath us
+                previous = _read_state(self._conn, entity)
+                if resume_params is None:
+                    state = (entity, run_high_water or previous["cursor"], None, None, None, run_started)
+                else:
+                    state = (
+                        entity, previous["cursor"], run_high_water, json.dumps(resume_params),
+                        run_started, previous["synced_at"]
+                    )
+                self._conn.executemany(sql, rows)
+                if entity == "tickets" and self.full_text:
+                    self._refresh_fts([row[0] for row in rows])
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO sync_state "
+                    "(entity, cursor, run_high_water, resume_params, run_started, synced_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    state
+                )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        mirror_synced.inc(entity, amount=len(rows))
+        return len(rows)
+
+    def _refresh_fts(self, ticket_ids: List[Any]):
+        # Caller holds the write lock inside a transaction
+        self._conn.executemany("DELETE FROM ticket_fts WHERE rowid = ?", [(i,) for i in ticket_ids])
+        self._conn.executemany(_FTS_REFRESH, [(i,) for i in ticket_ids])
+
+    def apply_messages(self, ticket_id: Any, messages: Iterable[Dict[str, Any]], updated_datetime: Optional[str]):
+        """Store a ticket's message text and re-index it.
+
+        Args:
+            ticket_id: Mirrored ticket.
+            messages: The ticket's messages from the API.
+            updated_datetime: Ticket version the messages belong to.
+        """
+        body = "\n".join(text for text in (message_text(m) for m in messages if isinstance(m, dict)) if text)
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO ticket_messages (ticket_id, body, updated_datetime) VALUES (?, ?, ?)",
+                    (ticket_id, body, updated_datetime)
+                )
+                if self.full_text:
+                    self._refresh_fts([ticket_id])
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        mirror_synced.inc("messages")
+
+    def pending_messages(self, after_id: Optional[int] = None, limit: int = 100) -> List[tuple]:
+        """``(ticket_id, updated_datetime)`` of tickets whose messages are missing or outdated."""
+        # Sync-side scan: use the writer connection so tool reads never queue behind it
+        with self._lock:
+            return self._conn.execute(
+                f"SELECT t.id, t.updated_datetime {_PENDING_MESSAGES} AND (? IS NULL OR t.id > ?) "
+                "ORDER BY t.id LIMIT ?",
+                (after_id, after_id, limit)
+            ).fetchall()
+
+    def count_pending_messages(self) -> int:
+        """Number of tickets whose messages are missing or outdated."""
+        with self._lock:
+            return self._conn.execute(f"SELECT COUNT(*) {_PENDING_MESSAGES}").fetchone()[0]
+
+    def search_tickets(
+        self,
+        query: str,
+        status: Optional[str] = None,
+        customer_id: Optional[int] = None,
+        created_after: Optional[str] = None,
+        created_before: Optional[str] = None,
+        limit: int = 20
+    ) -> List[Dict[str, Any]]:
+        """Full-text search over ticket subjects and messages, best match first.
+
+        Returns:
+            Ticket summaries with a BM25 ``score`` (higher is better) and a
+            ``snippet`` with matches in ``[brackets]``.
+
+        Raises:
+            ValueError: If SQLite lacks FTS5 or the query has no words.
+        """
+        if not self.full_text:
+            raise ValueError("local ticket search needs SQLite with FTS5")
+        expression = match_expression(query)
+        if expression is None:
+            raise ValueError("search query has no words")
+        clauses, params = ["ticket_fts MATCH ?"], [expression]
+        if status:
+            clauses.append("t.status = ?")
+            params.append(status)
+        if customer_id is not None:
+            clauses.append("t.customer_id = ?")
+            params.append(customer_id)
+        if created_after:
+            clauses.append("json_extract(t.data, '$.created_datetime') > ?")
+            params.append(created_after)
+        if created_before:
+            clauses.append("json_extract(t.data, '$.created_datetime') < ?")
+            params.append(created_before)
+        with self._reader_lock:
+            rows = self._reader.execute(
+                f"SELECT t.data, bm25(ticket_fts, {', '.join(map(str, _FTS_WEIGHTS))}) AS rank, "
+                "snippet(ticket_fts, -1, '[', ']', '…', 16) "
+                "FROM ticket_fts JOIN tickets t ON t.id = ticket_fts.rowid "
+                f"WHERE {' AND '.join(clauses)} ORDER BY rank LIMIT ?",
+                params + [limit]
+            ).fetchall()
+        results = []
+        for data, rank, snippet in rows:
+            ticket = json.loads(data)
+            results.append({
+                "id": ticket.get("id"),
+                "subject": ticket.get("subject"),
+                "status": ticket.get("status"),
+                "customer_id": _ticket_customer_id(ticket),
+                "created_datetime": ticket.get("created_datetime"),
+                "updated_datetime": ticket.get("updated_datetime"),
+                "score": round(-rank, 4),
+                "snippet": snippet,
+            })
+        return results
+
+    def remove_customers(self, customer_ids: Iterable[Any], swept_at: float) -> int:
+        """Delete customers and record the sweep that found them gone, atomically.
+
+        Returns:
+            Customers deleted.
+        """
+        ids = [(customer_id,) for customer_id in customer_ids]
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.executemany("DELETE FROM customers WHERE id = ?", ids)
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO sync_state (entity, synced_at) VALUES (?, ?)",
+                    (SWEEP_STATE, swept_at)
+                )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        return len(ids)
+
+    def reset_run(self, entity: str):
+        """Forget an interrupted run's resume point (e.g. an expired cursor)."""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE sync_state SET run_high_water = NULL, resume_params = NULL, run_started = NULL "
+                "WHERE entity = ?",
+                (entity,)
+            )
+
+
+async def read_mirror(
+    store: Optional[MirrorStore],
+    entity: str,
+    max_staleness: Optional[float],
+    query: Callable[[MirrorStore], List[Dict[str, Any]]]
+) -> Optional[Dict[str, Any]]:
+    """Answer a read from the mirror if it is fresh enough.
+
+    SQLite calls run in a worker thread, so a slow query never stalls the
+    event loop.
+
+    Args:
+        store: The mirror, or None when it is disabled.
+        entity: ``customers`` or ``tickets``.
+        max_staleness: Seconds of lag the caller accepts; None means live.
+        query: Runs the lookup against the store.
+
+    Returns:
+        An API-shaped response (``data`` plus ``meta.source``), or None if
+        the caller must go to the live API.
+    """
+    if store is None or max_staleness is None:
+        return None
+    synced_at = await asyncio.to_thread(store.synced_at, entity)
+    age = time.time() - synced_at if synced_at is not None else None
+    fresh = age is not None and age <= max_staleness
+    metrics.record_cache(f"mirror_{entity}", fresh)
+    if not fresh:
+        return None
+    data = await asyncio.to_thread(query, store)
+    return {"data": data, "meta": {"source": "mirror", "age_s": round(max(age, 0.0), 1)}}
+
+
+def source_label(data: Any, max_staleness: Optional[float]) -> str:
+    """Describe which source answered, for tool result headers."""
+    meta = data.get("meta") if isinstance(data, dict) else None
+    if isinstance(meta, dict) and meta.get("source") == "mirror":
+        return f" (source: local mirror, synced {meta['age_s']:g}s ago)"
+    if max_staleness is not None:
+        return " (source: live API)"
+    return ""
+
+
+class MirrorSync:
+    """Pull customer and ticket deltas from Gorgias into a ``MirrorStore``."""
+
+    ORDER_BY = "updated_datetime:desc"
+
+    def __init__(
+        self,
+        api_client: Any,
+        store: MirrorStore,
+        page_size: int = 100,
+        messages: bool = False,
+        sweep_interval: float = 0.0
+    ):
+        """Initialize the sync.
+
+        Args:
+            api_client: ``GorgiasAPIClient`` (or anything with ``get``).
+            store: Mirror to write to.
+            page_size: Records requested per page.
+            messages: Also fetch ticket messages for full-text search.
+            sweep_interval: Seconds between customer deletion sweeps (0
+                disables them).
+        """
+        self.api_client = api_client
+        self.store = store
+        self.page_size = page_size
+        self.messages = messages
+        self.sweep_interval = sweep_interval
+        self.syncing = False
+        self.last_error: Optional[str] = None
+        # Counted at the end of each message sync; the scan needs the write lock
+        self.messages_pending: Optional[int] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @classmethod
+    def from_env(cls, api_client: Any) -> Optional["MirrorSync"]:
+        """Build a sync for ``MCP_MIRROR_PATH``, or None when unset."""
+        path = os.getenv("MCP_MIRROR_PATH")
+        if not path:
+            return None
+        messages = os.getenv("MCP_MIRROR_MESSAGES", "false").lower() == "true"
+        sweep_interval = float(os.getenv("MCP_MIRROR_SWEEP_INTERVAL", "86400"))
+        return cls(api_client, MirrorStore(path), messages=messages, sweep_interval=sweep_interval)
+
+    async def sync_entity(self, entity: str, page_delay: float = 0.0) -> int:
+        """Run (or resume) one delta run for an entity.
+
+        Returns:
+            Records written.
+        """
+        state = await asyncio.to_thread(self.store.state, entity)
+        cursor = state["cursor"]
+        high_water = state["run_high_water"] or cursor
+        params = state["resume_params"]
+        resumed = params is not None
+        started = state["run_started"] if resumed and state["run_started"] else time.time()
+        if not resumed:
+            params = {"limit": self.page_size, "order_by": self.ORDER_BY}
+        written = 0
+
+        while True:
+            try:
+                response = await self.api_client.get(entity, params=params)
+            except Exception as e:
+                if not resumed:
+                    raise
+                # Pagination cursors expire; start this run again from the top
+                logger.warning("Mirror resume of %s failed (%s); restarting run", entity, e)
+                self.store.reset_run(entity)
+                return await self.sync_entity(entity, page_delay)
+            resumed = False
+
+            items = response.get("data", []) if isinstance(response, dict) else []
+            changed = [item for item in items if cursor is None or (item.get("updated_datetime") or "") >= cursor]
+            for item in changed:
+                updated = item.get("updated_datetime")
+                if updated and (high_water is None or updated > high_water):
+                    high_water = updated
+
+            meta = response.get("meta") if isinstance(response, dict) else None
+            next_cursor = (meta or {}).get("next_cursor")
+            if next_cursor:
+                next_params = {"limit": self.page_size, "order_by": self.ORDER_BY, "cursor": next_cursor}
+            elif len(items) == self.page_size:
+                next_params = {**params, "page": params.get("page", 1) + 1}
+            else:
+                next_params = None
+
+            # Older records than the cursor mean the rest of the list is unchanged
+            done = next_params is None or len(changed) < len(items)
+            written += await asyncio.to_thread(
+                self.store.apply_page, entity, changed, high_water, None if done else next_params, started
+            )
+            if done:
+                mirror_rows.set(await asyncio.to_thread(self.store.count, entity), entity)
+                return written
+            params = next_params
+            if page_delay:
+                await asyncio.sleep(page_delay)
+
+    async def sync_messages(self, page_delay: float = 0.0) -> int:
+        """Fetch messages of every ticket whose indexed messages are outdated.
+
+        A ticket that fails is skipped and retried on the next run.
+
+        Returns:
+            Tickets whose messages were stored.
+        """
+        written = 0
+        after_id = None
+        while True:
+            pending = await asyncio.to_thread(self.store.pending_messages, after_id)
+            if not pending:
+                # Tickets whose fetch failed stay pending until the next run
+                self.messages_pending = await asyncio.to_thread(self.store.count_pending_messages)
+                return written
+            for ticket_id, updated in pending:
+                after_id = ticket_id
+                try:
+                    response = await self.api_client.get(f"tickets/{ticket_id}/messages")
+                except Exception as e:
+                    logger.warning("Mirror could not fetch messages of ticket %s: %s", ticket_id, e)
+                    continue
+                messages = response.get("data", []) if isinstance(response, dict) else []
+                await asyncio.to_thread(self.store.apply_messages, ticket_id, messages, updated)
+                written += 1
+                if page_delay:
+                    await asyncio.sleep(page_delay)
+
+    async def sweep_customers(self, page_delay: float = 0.0) -> int:
+        """Drop mirrored customers missing from a walk of every customer page.
+
+        Only customers mirrored before the walk started can be dropped, so
+        customers created during it are kept. A failed walk drops nothing.
+
+        Returns:
+            Customers deleted.
+        """
+        started = time.time()
+        mirrored = set(await asyncio.to_thread(self.store.record_ids, "customers"))
+        seen = set()
+        client = RetryingReader(self.api_client)
+        async for items in iter_customer_pages(client, page_size=self.page_size, page_delay=page_delay):
+            seen.update(item.get("id") for item in items)
+        removed = await asyncio.to_thread(self.store.remove_customers, mirrored - seen, started)
+        mirror_rows.set(await asyncio.to_thread(self.store.count, "customers"), "customers")
+        return removed
+
+    async def _sweep_due(self) -> bool:
+        if self.sweep_interval <= 0:
+            return False
+        swept_at = (await asyncio.to_thread(self.store.state, SWEEP_STATE))["synced_at"]
+        return swept_at is None or time.time() - swept_at >= self.sweep_interval
+
+    async def sync(self, page_delay: float = 0.0) -> Dict[str, int]:
+        """Run one delta run for every entity, plus a customer sweep when due."""
+        self.syncing = True
+        start = time.perf_counter()
+        try:
+            written = {entity: await self.sync_entity(entity, page_delay) for entity in ENTITIES}
+            if self.messages:
+                written["messages"] = await self.sync_messages(page_delay)
+            if await self._sweep_due():
+                written["deleted customers"] = await self.sweep_customers(page_delay)
+            self.last_error = None
+            logger.info(
+                "Mirror synced in %.1fs: %s", time.perf_counter() - start,
+                ", ".join(f"{count} {entity}" for entity, count in written.items())
+            )
+            return written
+        finally:
+            self.syncing = False
+
+    def start(self, interval: Optional[float] = None, page_delay: Optional[float] = None):
+        """Sync in the background now and then every ``interval`` seconds."""
+        if interval is None:
+            interval = float(os.getenv("MCP_MIRROR_INTERVAL", "300"))
+        if page_delay is None:
+            page_delay = float(os.getenv("MCP_MIRROR_PAGE_DELAY", "0.5"))
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run(interval, page_delay))
+
+    async def _run(self, interval: float, page_delay: float):
+        while True:
+            try:
+                await self.sync(page_delay)
+            except Exception as e:
+                self.last_error = str(e)
+                logger.warning("Mirror sync failed: %s", e)
+            if interval <= 0:
+                return
+            await asyncio.sleep(interval)
+
+    async def stop(self):
+        """Stop the background sync and close the store."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self.store.close()
+
+    async def snapshot(self) -> Dict[str, Any]:
+        """Return sync state and row counts per entity.
+
+        The store is read in a worker thread: these reads queue behind tool
+        reads on the reader connection.
+        """
+        entities = await asyncio.to_thread(self._entity_snapshot)
+        if self.messages:
+            entities["tickets"]["messages_pending"] = self.messages_pending
+        return {
+            "path": self.store.path,
+            "syncing": self.syncing,
+            "last_error": self.last_error,
+            "entities": entities,
+        }
+
+    def _entity_snapshot(self) -> Dict[str, Any]:
+        entities: Dict[str, Any] = {}
+        for entity in ENTITIES:
+            state = self.store.state(entity)
+            entities[entity] = {
+                "rows": self.store.count(entity),
+                "cursor": state["cursor"],
+                "synced_at": state["synced_at"],
+                "resumable": state["resume_params"] is not None,
+            }
+        entities["customers"]["swept_at"] = self.store.state(SWEEP_STATE)["synced_at"]
+        return entities
@@ -0,0 +1,148 @@
+"""Continuation tokens for paginated list tools.
+
+``list_customers``, ``list_tickets`` and ``get_customer_tickets`` return one
+compact page (the records plus a ``next_page_token``) instead of the raw
+upstream response. The token is opaque to the caller: a URL-safe encoding
+of the tool, its filters and the upstream position (Gorgias ``cursor``, or a
+page number for page-paginated responses). Passing it back as
+``page_token`` resumes the same listing, so agents pull only as many pages
+as they need.
+
+Pages answered from the local mirror continue from the mirror (by offset)
+even if it has since gone stale, so one listing never mixes sources.
+"""
+
+import base64
+import binascii
+import json
+import math
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .mirror import MirrorStore, read_mirror
+
+# Largest page the Gorgias list endpoints return
+MAX_PAGE_SIZE = 100
+
+# Token fields that locate a page: upstream cursor, upstream page number or mirror offset
+_POSITION_FIELDS = ("cursor", "page", "offset")
+
+
+def page_size(limit: Optional[int], default: int = 50) -> int:
+    """Clamp a requested page size to ``1..MAX_PAGE_SIZE``."""
+    return max(1, min(int(limit if limit is not None else default), MAX_PAGE_SIZE))
+
+
+def encode_token(tool: str, filters: Dict[str, Any], **position: Any) -> str:
+    """Build the continuation token of the next page."""
+    payload = json.dumps({"tool": tool, "filters": filters, **position}, separators=(",", ":"), sort_keys=True)
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_token(
+    token: str,
+    tool: str,
+    filters: Dict[str, Any]
+) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """Return the filters and position saved in a token.
+
+    Filters passed alongside the token may repeat the original ones but not
+    change them.
+
+    Raises:
+        ValueError: If the token is malformed, from another tool, or its
+            filters conflict with ``filters``.
+    """
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)))
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise ValueError("invalid page_token")
+    if not isinstance(payload, dict) or payload.get("tool") != tool:
+        raise ValueError(f"page_token was not issued by {tool}")
+    saved = payload.get("filters") or {}
+    for key, value in filters.items():
+        if saved.get(key) != value:
+            raise ValueError(f"page_token was issued for a different {key}")
+    return saved, {field: payload[field] for field in _POSITION_FIELDS if field in payload}
+
+
+def next_position(
+    response: Any,
+    items: List[Any],
+    limit: int,
+    position: Dict[str, Any]
+) -> Optional[Dict[str, Any]]:
+    """Upstream parameters of the page after ``response``, or None at the end."""
+    meta = response.get("meta") if isinstance(response, dict) else None
+    if isinstance(meta, dict) and ("next_cursor" in meta or "prev_cursor" in meta):
+        return {"cursor": meta["next_cursor"]} if meta.get("next_cursor") else None
+    # Page-number pagination: a full page means there may be more
+    if len(items) == limit:
+        return {"page": position.get("page", 1) + 1}
+    return None
+
+
+async def read_page(
+    api_client: Any,
+    entity: str,
+    tool: str,
+    filters: Dict[str, Any],
+    limit: Optional[int] = None,
+    page_token: Optional[str] = None,
+    mirror: Optional[MirrorStore] = None,
+    max_staleness: Optional[float] = None,
+    mirror_query: Optional[Callable[[MirrorStore, Dict[str, Any], int, int], List[Dict[str, Any]]]] = None
+) -> Dict[str, Any]:
+    """Fetch one page of ``entity`` with the token of the next.
+
+    Args:
+        api_client: Client for live requests.
+        entity: ``customers`` or ``tickets`` (API endpoint and mirror table).
+        tool: Tool name, bound into tokens.
+        filters: Upstream query parameters (None values are dropped).
+        limit: Page size, capped at ``MAX_PAGE_SIZE``.
+        page_token: Token from a previous page.
+        mirror: Local mirror, if enabled.
+        max_staleness: Seconds of lag acceptable to answer from the mirror.
+        mirror_query: ``(store, filters, limit, offset)`` lookup for mirror pages.
+
+    Returns:
+        ``{"data": [...], "meta": {"next_page_token": ...}}``, plus the
+        mirror's ``source``/``age_s`` when it answered.
+
+    Raises:
+        ValueError: If the token is invalid, or continues a mirror listing
+            while the mirror is disabled.
+    """
+    limit = page_size(limit)
+    filters = {key: value for key, value in filters.items() if value is not None}
+    position: Dict[str, Any] = {}
+    if page_token:
+        filters, position = decode_token(page_token, tool, filters)
+
+    if mirror_query is not None and "cursor" not in position and "page" not in position:
+        offset = position.get("offset", 0)
+        # Fetch one extra row to know whether another page exists
+        data = await read_mirror(
+            mirror, entity, math.inf if "offset" in position else max_staleness,
+            lambda store: mirror_query(store, filters, limit + 1, offset)
+        )
+        if data is not None:
+            more = len(data["data"]) > limit
+            data["data"] = data["data"][:limit]
+            data["meta"]["next_page_token"] = encode_token(tool, filters, offset=offset + limit) if more else None
+            return data
+        if "offset" in position:
+            raise ValueError("page_token continues a local mirror listing, but the mirror is unavailable")
+
+    response = await api_client.get(entity, params={**filters, "limit": limit, **position})
+    items = response.get("data", []) if isinstance(response, dict) else []
+    following = next_position(response, items, limit, position)
+    return {
+        "data": items,
+        "meta": {"next_page_token": encode_token(tool, filters, **following) if following else None},
+    }
+
+
+def more_label(page: Dict[str, Any]) -> str:
+    """Header note telling the caller that another page exists."""
+    return ", more available with next_page_token" if page["meta"].get("next_page_token") else ""
@@ -0,0 +1,129 @@
+"""Local customer index keyed by normalized E.164 phone number.
+
+The Gorgias API cannot search customers by phone, but the voice agent
+identifies callers by phone number. ``PhoneIndex`` maps phone numbers found
+in customer ``channels`` to compact customer summaries. It is filled by
+``CustomerSync`` and kept current by the customer tools on every read and
+write, so lookups are a single dict access.
+"""
+
+import os
+import re
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from . import metrics
+
+_NON_DIGITS = re.compile(r"\D")
+
+phone_index_size = metrics.registry.register(metrics.Gauge(
+    "gorgias_mcp_phone_index_customers", "Customers with at least one indexed phone number"
+))
+
+
+def normalize_phone(value: Any, default_country_code: Optional[str] = None) -> Optional[str]:
+    """Normalize a phone number to E.164 (``+`` followed by digits).
+
+    Numbers without an international prefix get ``default_country_code``
+    (``MCP_PHONE_DEFAULT_COUNTRY_CODE``, default ``1``).
+
+    Args:
+        value: Phone number in any common format.
+        default_country_code: Country calling code for national numbers.
+
+    Returns:
+        The E.164 number, or None if the value is not a plausible number.
+    """
+    if not isinstance(value, str):
+        return None
+    text = value.strip()
+    digits = _NON_DIGITS.sub("", text)
+    if text.startswith("+"):
+        pass
+    elif text.startswith("00"):
+        digits = digits[2:]
+    else:
+        if default_country_code is None:
+            default_country_code = os.getenv("MCP_PHONE_DEFAULT_COUNTRY_CODE", "1")
+        if not (default_country_code and digits.startswith(default_country_code) and len(digits) > 10):
+            digits = f"{default_country_code}{digits.lstrip('0')}"
+    if not 8 <= len(digits) <= 15:
+        return None
+    return f"+{digits}"
+
+
+def customer_email(customer: Dict[str, Any]) -> Optional[str]:
+    """Return a customer's primary email, falling back to its email channels."""
+    email = customer.get("email")
+    if not email:
+        for channel in customer.get("channels") or []:
+            if channel.get("type") == "email" and channel.get("address"):
+                return channel["address"]
+    return email
+
+
+def _summary(customer: Dict[str, Any], phones: Iterable[str]) -> Dict[str, Any]:
+    return {
+        "id": customer.get("id"),
+        "name": customer.get("name"),
+        "email": customer_email(customer),
+        "phones": sorted(phones),
+    }
+
+
+class PhoneIndex:
+    """Map E.164 phone numbers to the customers that own them."""
+
+    def __init__(self):
+        """Initialize an empty index."""
+        self._by_phone: Dict[str, Set[Any]] = {}
+        self._customers: Dict[Any, Dict[str, Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self._customers)
+
+    def customer_ids(self) -> List[Any]:
+        """Return the IDs of the indexed customers."""
+        return list(self._customers)
+
+    def index_customer(self, customer: Any):
+        """Add or refresh one customer record (no-op without channels)."""
+        if not isinstance(customer, dict) or customer.get("id") is None or "channels" not in customer:
+            return
+        customer_id = customer["id"]
+        phones = {
+            phone for phone in (
+                normalize_phone(channel.get("address"))
+                for channel in customer.get("channels") or []
+                if channel.get("type") == "phone"
+            ) if phone
+        }
+        self.remove(customer_id)
+        if phones:
+            self._customers[customer_id] = _summary(customer, phones)
+            for phone in phones:
+                self._by_phone.setdefault(phone, set()).add(customer_id)
+        phone_index_size.set(len(self._customers))
+
+    def remove(self, customer_id: Any):
+        """Drop a customer from the index."""
+        previous = self._customers.pop(customer_id, None)
+        if previous is None:
+            return
+        phone_index_size.set(len(self._customers))
+        for phone in previous["phones"]:
+            owners = self._by_phone.get(phone)
+            if owners is not None:
+                owners.discard(customer_id)
+                if not owners:
+                    del self._by_phone[phone]
+
+    def lookup(self, phone: str) -> List[Dict[str, Any]]:
+        """Return summaries of customers with this phone number."""
+        normalized = normalize_phone(phone)
+        if normalized is None:
+            return []
+        return [self._customers[customer_id] for customer_id in sorted(self._by_phone.get(normalized, ()))]
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return the index size."""
+        return {"customers": len(self._customers), "phones": len(self._by_phone)}
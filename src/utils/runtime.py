@@ -0,0 +1,179 @@
+"""High-performance runtime options for the MCP server entry points.
+
+Enabled with ``MCP_PERFORMANCE_MODE=true``. In that mode the server:
+
+* runs on uvloop when the optional ``uvloop`` package is installed,
+* binds a listening socket tuned with TCP_NODELAY and TCP keepalive,
+* tunes upstream sockets to Gorgias the same way,
+* monitors event-loop lag and warns when callbacks are delayed.
+"""
+
+import asyncio
+import collections
+import logging
+import os
+import socket
+import time
+from typing import Any, Callable, Coroutine, Dict, List, Optional, Tuple
+
+try:
+    import uvloop  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    uvloop = None
+
+logger = logging.getLogger(__name__)
+
+# Seconds of idle time before the first keepalive probe, the interval between
+# probes and the number of failed probes before the connection is dropped.
+KEEPALIVE_IDLE = 60
+KEEPALIVE_INTERVAL = 10
+KEEPALIVE_COUNT = 5
+
+
+def is_enabled() -> bool:
+    """Check whether the high-performance runtime mode is enabled."""
+    return os.getenv("MCP_PERFORMANCE_MODE", "false").lower() == "true"
+
+
+def get_loop_factory() -> Optional[Callable[[], asyncio.AbstractEventLoop]]:
+    """Return the event loop factory for the current runtime mode.
+
+    Returns:
+        ``uvloop.new_event_loop`` in performance mode when uvloop is
+        installed, otherwise None (the default asyncio loop).
+    """
+    if not is_enabled():
+        return None
+    if uvloop is None:
+        logger.warning("MCP_PERFORMANCE_MODE is enabled but uvloop is not installed; using asyncio")
+        return None
+    return uvloop.new_event_loop
+
+
+def run(main: Callable[[], Coroutine[Any, Any, Any]]) -> Any:
+    """Run an async entry point on the configured event loop.
+
+    Args:
+        main: Coroutine function to run.
+
+    Returns:
+        Whatever the coroutine returns.
+    """
+    with asyncio.Runner(loop_factory=get_loop_factory()) as runner:
+        return runner.run(main())
+
+
+def loop_name(loop: Optional[asyncio.AbstractEventLoop] = None) -> str:
+    """Describe the running event loop implementation."""
+    loop = loop or asyncio.get_running_loop()
+    return f"{type(loop).__module__}.{type(loop).__name__}"
+
+
+def _keepalive_options() -> List[Tuple[int, int, int]]:
+    options = [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+    if hasattr(socket, "TCP_KEEPIDLE"):
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, KEEPALIVE_IDLE))
+    if hasattr(socket, "TCP_KEEPINTVL"):
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, KEEPALIVE_INTERVAL))
+    if hasattr(socket, "TCP_KEEPCNT"):
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPCNT, KEEPALIVE_COUNT))
+    return options
+
+
+def socket_options() -> List[Tuple[int, int, int]]:
+    """Socket options applied to tuned sockets (TCP_NODELAY plus keepalive)."""
+    return [(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)] + _keepalive_options()
+
+
+def upstream_socket_options() -> Optional[List[Tuple[int, int, int]]]:
+    """Socket options for upstream connections, or None outside performance mode."""
+    return socket_options() if is_enabled() else None
+
+
+def create_listen_socket(host: str, port: int, reuse_port: bool = False) -> socket.socket:
+    """Create a tuned listening socket.
+
+    Accepted connections inherit TCP_NODELAY and the keepalive settings from
+    the listening socket on Linux.
+
+    Args:
+        host: Interface to bind.
+        port: Port to bind.
+        reuse_port: Set SO_REUSEPORT so several processes can share the port.
+
+    Returns:
+        A bound, non-blocking socket ready to be passed to ``web.SockSite``.
+    """
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    if reuse_port:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+    for level, option, value in socket_options():
+        sock.setsockopt(level, option, value)
+    sock.bind((host, port))
+    sock.setblocking(False)
+    return sock
+
+
+class LoopLagMonitor:
+    """Measure event-loop lag by timing a periodic sleep.
+
+    The difference between the requested and the observed sleep is the time
+    the loop was busy running other callbacks.
+    """
+
+    def __init__(self, interval: float = 0.5, warn_threshold: float = 0.1, window: int = 600):
+        """Initialize the monitor.
+
+        Args:
+            interval: Seconds between samples.
+            warn_threshold: Lag in seconds above which a warning is logged.
+            window: Number of recent samples kept for percentiles.
+        """
+        self.interval = interval
+        self.warn_threshold = warn_threshold
+        self._samples = collections.deque(maxlen=window)
+        self._max_lag = 0.0
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        """Start sampling on the running loop."""
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        """Stop sampling."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self):
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(self.interval)
+            lag = max(0.0, time.perf_counter() - start - self.interval)
+            self._samples.append(lag)
+            self._max_lag = max(self._max_lag, lag)
+            if lag > self.warn_threshold:
+                logger.warning("Event loop lag %.1f ms", lag * 1000)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return lag statistics in milliseconds."""
+        samples = sorted(self._samples)
+        if not samples:
+            return {"samples": 0}
+
+        def percentile(q: float) -> float:
+            return round(samples[min(len(samples) - 1, int(q * len(samples)))] * 1000, 3)
+
+        return {
+            "samples": len(samples),
+            "last_ms": round(self._samples[-1] * 1000, 3),
+            "p50_ms": percentile(0.50),
+            "p99_ms": percentile(0.99),
+            "max_ms": round(self._max_lag * 1000, 3),
+        }
@@ -0,0 +1,82 @@
+"""Signal-driven graceful shutdown for the HTTP server.
+
+On SIGTERM (sent by Cloud Run when scaling in) the server stops accepting
+new work, lets in-flight tool calls and SSE streams finish within a
+deadline, then releases upstream resources.
+"""
+
+import asyncio
+import logging
+import signal
+import time
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+class GracefulShutdown:
+    """Track in-flight requests and coordinate a draining shutdown."""
+
+    def __init__(self):
+        """Initialize the shutdown coordinator."""
+        self.draining = False
+        self.in_flight = 0
+        self._stop_requested = asyncio.Event()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self.signal_received: Optional[int] = None
+
+    def install_signal_handlers(self):
+        """Request a shutdown on SIGTERM and SIGINT."""
+        loop = asyncio.get_running_loop()
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            try:
+                loop.add_signal_handler(signum, self.request_stop, signum)
+            except (NotImplementedError, RuntimeError):
+                # add_signal_handler is not available on Windows
+                signal.signal(signum, lambda s, f: loop.call_soon_threadsafe(self.request_stop, s))
+
+    def request_stop(self, signum: Optional[int] = None):
+        """Ask the server to shut down."""
+        if self.signal_received is None:
+            self.signal_received = signum
+        self._stop_requested.set()
+
+    async def wait_for_stop(self):
+        """Block until a shutdown has been requested."""
+        await self._stop_requested.wait()
+
+    def begin(self):
+        """Record the start of a request that must be drained."""
+        self.in_flight += 1
+        self._idle.clear()
+
+    def end(self):
+        """Record the end of a drained request."""
+        self.in_flight -= 1
+        if self.in_flight <= 0:
+            self.in_flight = 0
+            self._idle.set()
+
+    async def drain(self, timeout: float) -> bool:
+        """Stop admitting work and wait for in-flight requests to finish.
+
+        Args:
+            timeout: Maximum number of seconds to wait.
+
+        Returns:
+            True if every in-flight request finished before the deadline.
+        """
+        self.draining = True
+        start = time.monotonic()
+        if self.in_flight:
+            logger.info("Draining %d in-flight request(s) (deadline %.1fs)", self.in_flight, timeout)
+        try:
+            await asyncio.wait_for(self._idle.wait(), timeout)
+        except asyncio.TimeoutError:
+            logger.warning(
+                "Shutdown deadline reached with %d request(s) still in flight", self.in_flight
+            )
+            return False
+        logger.info("Drained in %.2fs", time.monotonic() - start)
+        return True
@@ -0,0 +1,99 @@
+"""Fast-boot support: lazy imports and startup phase timing.
+
+Enable with ``MCP_FAST_BOOT=true``. In that mode heavy modules (``httpx``,
+the ``mcp`` SDK and the tool modules) are imported on first use instead of
+at startup, which shortens Cloud Run cold starts.
+"""
+
+import importlib
+import importlib.util
+import logging
+import os
+import sys
+import time
+from contextlib import contextmanager
+from types import ModuleType
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+def fast_boot_enabled() -> bool:
+    """Check whether fast-boot mode is enabled."""
+    return os.getenv("MCP_FAST_BOOT", "false").lower() == "true"
+
+
+def running_in_container() -> bool:
+    """Detect Cloud Run, where configuration comes from the environment only."""
+    return bool(os.getenv("K_SERVICE"))
+
+
+def lazy_import(name: str) -> ModuleType:
+    """Import a module, deferring its execution until first attribute access.
+
+    Outside fast-boot mode (or if the module is already loaded) this is a
+    plain import.
+
+    Args:
+        name: Fully qualified module name.
+
+    Returns:
+        The module, possibly not yet executed.
+    """
+    if name in sys.modules or not fast_boot_enabled():
+        return importlib.import_module(name)
+
+    spec = importlib.util.find_spec(name)
+    if spec is None or spec.loader is None:
+        return importlib.import_module(name)
+
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
+class StartupTimer:
+    """Record how long each startup phase takes and log a breakdown."""
+
+    def __init__(self, origin: Optional[float] = None):
+        """Initialize the timer.
+
+        Args:
+            origin: ``time.perf_counter()`` value at process start, so time
+                spent importing modules is included in the report.
+        """
+        self.origin = origin if origin is not None else time.perf_counter()
+        self.phases: List[Tuple[str, float]] = []
+        self._last = self.origin
+
+    def mark(self, name: str):
+        """Close a phase that started at the previous mark."""
+        now = time.perf_counter()
+        self.phases.append((name, now - self._last))
+        self._last = now
+
+    @contextmanager
+    def phase(self, name: str):
+        """Time a block as one startup phase."""
+        self._last = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.mark(name)
+
+    def as_dict(self) -> Dict[str, float]:
+        """Return phase durations in milliseconds, including the total."""
+        report = {name: round(elapsed * 1000, 1) for name, elapsed in self.phases}
+        report["total"] = round((self._last - self.origin) * 1000, 1)
+        return report
+
+    def report(self):
+        """Log the per-phase startup timing breakdown."""
+        timings = self.as_dict()
+        width = max(len(name) for name in timings)
+        lines = [f"  {name:<{width}}  {ms:8.1f} ms" for name, ms in timings.items()]
+        mode = "fast-boot" if fast_boot_enabled() else "standard"
+        logger.info("Startup timing (%s mode):\n%s", mode, "\n".join(lines))
@@ -0,0 +1,196 @@
+"""Structured, asynchronous logging for the Gorgias MCP server.
+
+``configure_logging`` routes every record through a bounded in-memory queue;
+a background listener thread does the formatting and the stream I/O, so
+request handlers only pay for an enqueue. On top of that:
+
+* records can carry a per-message ``sample_rate`` (``extra={"sample_rate": 0.1}``)
+  and only that fraction is emitted; warnings and errors are never sampled,
+* ``LazyPayload`` defers JSON encoding of request/response payloads until a
+  record is actually emitted, caps its size and redacts customer PII,
+* ``MCP_LOG_FORMAT=json`` switches to one JSON object per line, which Cloud
+  Logging parses into structured entries.
+"""
+
+import atexit
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import random
+import sys
+import time
+from typing import Any, Optional
+
+from . import metrics
+
+TEXT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+# Payload keys whose values are customer PII and never written to logs
+REDACTED_KEYS = frozenset({
+    "email", "phone", "address", "name", "firstname", "lastname",
+    "first_name", "last_name", "note", "body", "body_text", "body_html",
+})
+
+# Attributes present on every LogRecord; anything else came from ``extra``
+_RESERVED_ATTRS = frozenset(vars(logging.makeLogRecord({}))) | {"message", "asctime"}
+
+log_records_dropped = metrics.registry.register(metrics.Counter(
+    "gorgias_mcp_log_records_dropped_total", "Log records dropped because the log queue was full"
+))
+
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def _redact(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {
+            key: "[redacted]" if key in REDACTED_KEYS and item else _redact(item)
+            for key, item in value.items()
+        }
+    if isinstance(value, list):
+        return [_redact(item) for item in value]
+    return value
+
+
+class LazyPayload:
+    """Log argument that serializes, redacts and truncates only when formatted."""
+
+    __slots__ = ("value", "limit", "redact")
+
+    def __init__(self, value: Any, limit: int = 1024, redact: bool = True):
+        """Wrap a payload for logging.
+
+        Args:
+            value: Payload to log (usually a JSON-RPC request or response).
+            limit: Maximum number of characters written.
+            redact: Replace PII fields with a placeholder.
+        """
+        self.value = value
+        self.limit = limit
+        self.redact = redact
+
+    def __str__(self) -> str:
+        value = self.value
+        if self.redact:
+            if isinstance(value, str):
+                try:
+                    value = json.loads(value)
+                except ValueError:
+                    pass
+            value = _redact(value)
+        if isinstance(value, str):
+            text = value
+        else:
+            try:
+                text = json.dumps(value, default=str, separators=(",", ":"))
+            except (TypeError, ValueError):
+                text = str(value)
+        if len(text) > self.limit:
+            return f"{text[:self.limit]}...[{len(text) - self.limit} more chars]"
+        return text
+
+
+class SamplingFilter(logging.Filter):
+    """Drop a share of records that declare a ``sample_rate`` below 1."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        rate = getattr(record, "sample_rate", None)
+        if rate is None or rate >= 1.0 or record.levelno >= logging.WARNING:
+            return True
+        return random.random() < rate
+
+
+class JSONFormatter(logging.Formatter):
+    """Format records as single-line JSON objects."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(record.created))
+            + f".{int(record.msecs):03d}Z",
+            "severity": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in _RESERVED_ATTRS and key != "sample_rate":
+                entry[key] = value
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+class _NonBlockingQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that never blocks and leaves formatting to the listener."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # The stock implementation formats the message in the caller; the
+        # listener runs in this process, so the record can be passed as-is.
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            log_records_dropped.inc()
+
+
+def configure_logging(level: Optional[int] = None, queue_size: int = 10000, force: bool = False):
+    """Install the queue-based logging pipeline on the root logger.
+
+    Safe to call more than once; only the first call has an effect unless
+    ``force`` is set.
+
+    Args:
+        level: Root log level. Defaults to DEBUG when ``DEBUG=true``, else INFO.
+        queue_size: Maximum number of records buffered before dropping.
+        force: Rebuild the pipeline even if one is installed. Forked worker
+            processes need this because the listener thread does not survive
+            ``fork()``.
+    """
+    global _listener
+    if _listener is not None and not force:
+        return
+
+    if level is None:
+        level = logging.DEBUG if os.getenv("DEBUG", "false").lower() == "true" else logging.INFO
+
+    if os.getenv("MCP_LOG_FORMAT", "text").lower() == "json":
+        formatter: logging.Formatter = JSONFormatter()
+    else:
+        formatter = logging.Formatter(TEXT_FORMAT)
+
+    # stderr keeps stdout free for the stdio MCP transport
+    stream_handler = logging.StreamHandler(sys.stderr)
+    stream_handler.setFormatter(formatter)
+
+    log_queue: queue.Queue = queue.Queue(maxsize=queue_size)
+    queue_handler = _NonBlockingQueueHandler(log_queue)
+    queue_handler.addFilter(SamplingFilter())
+
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(queue_handler)
+    root.setLevel(level)
+
+    _listener = logging.handlers.QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(shutdown_logging)
+
+
+def shutdown_logging():
+    """Flush queued records and stop the listener thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def get_sample_rate(name: str, default: float = 1.0) -> float:
+    """Read a sampling rate between 0 and 1 from the environment."""
+    try:
+        return min(1.0, max(0.0, float(os.getenv(name, default))))
+    except ValueError:
+        return default
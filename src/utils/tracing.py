@@ -0,0 +1,271 @@
+"""OpenTelemetry-compatible tracing for the Gorgias MCP server.
+
+Spans cover the HTTP handlers, ``GorgiasMCPServer.handle_tool_call``, each
+tool method, response formatting and every Gorgias API request. The current
+span is tracked in a ``contextvars`` variable, so it follows ``await``
+chains and tasks without being passed around.
+
+Configuration:
+
+* ``MCP_TRACE_EXPORTER``: ``none`` (default), ``console`` (stderr) or ``file``
+* ``MCP_TRACE_FILE``: output path for the file exporter (``traces.jsonl``)
+* ``MCP_TRACE_SAMPLE_RATE``: fraction of new traces recorded (default 1.0)
+
+Spans are written one per line using OTLP/JSON field names, and incoming
+W3C ``traceparent`` headers are honoured, so traces can be loaded into
+OpenTelemetry tooling or joined with a caller's trace. With the exporter
+set to ``none`` a span costs one function call.
+"""
+
+import atexit
+import json
+import os
+import queue
+import random
+import re
+import secrets
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import IO, Any, Dict, Iterator, Optional
+
+from .structured_logging import get_sample_rate
+
+SERVICE_NAME = "gorgias-mcp-server"
+
+KIND_INTERNAL = "SPAN_KIND_INTERNAL"
+KIND_SERVER = "SPAN_KIND_SERVER"
+KIND_CLIENT = "SPAN_KIND_CLIENT"
+
+_TRACEPARENT = re.compile(r"^00-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})$")
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+class Span:
+    """A timed operation within a trace."""
+
+    __slots__ = (
+        "name", "kind", "trace_id", "span_id", "parent_id", "sampled",
+        "attributes", "status_code", "status_message", "start_ns", "_start_perf", "end_ns",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        trace_id: str,
+        parent_id: Optional[str],
+        sampled: bool,
+        kind: str = KIND_INTERNAL,
+        attributes: Optional[Dict[str, Any]] = None
+    ):
+        self.name = name
+        self.kind = kind
+        self.trace_id = trace_id
+        self.span_id = secrets.token_hex(8)
+        self.parent_id = parent_id
+        self.sampled = sampled
+        self.attributes = dict(attributes) if attributes else {}
+        self.status_code = "STATUS_CODE_UNSET"
+        self.status_message = ""
+        self.start_ns = time.time_ns()
+        self._start_perf = time.perf_counter_ns()
+        self.end_ns: Optional[int] = None
+
+    def set_attribute(self, key: str, value: Any):
+        """Attach an attribute to the span."""
+        if value is not None:
+            self.attributes[key] = value
+
+    def set_error(self, message: str):
+        """Mark the span as failed."""
+        self.status_code = "STATUS_CODE_ERROR"
+        self.status_message = message
+
+    @property
+    def traceparent(self) -> str:
+        """W3C ``traceparent`` header value for this span."""
+        return f"00-{self.trace_id}-{self.span_id}-{'01' if self.sampled else '00'}"
+
+    def end(self):
+        """Record the end time."""
+        self.end_ns = self.start_ns + (time.perf_counter_ns() - self._start_perf)
+
+    def to_otlp(self) -> Dict[str, Any]:
+        """Serialize using OTLP/JSON span field names."""
+        span = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": self.kind,
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns),
+            "attributes": [
+                {"key": key, "value": _otlp_value(value)} for key, value in self.attributes.items()
+            ],
+            "status": {"code": self.status_code},
+            "resource": {"service.name": SERVICE_NAME},
+        }
+        if self.parent_id:
+            span["parentSpanId"] = self.parent_id
+        if self.status_message:
+            span["status"]["message"] = self.status_message
+        return span
+
+
+class _NoopSpan:
+    """Stand-in yielded while tracing is disabled."""
+
+    sampled = False
+    traceparent = None
+
+    def set_attribute(self, key: str, value: Any):
+        pass
+
+    def set_error(self, message: str):
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+
+_current_span: ContextVar[Optional[Span]] = ContextVar("gorgias_mcp_current_span", default=None)
+
+
+class SpanExporter:
+    """Write finished spans as JSON lines from a background thread."""
+
+    def __init__(self, stream: IO[str], close_stream: bool = False, queue_size: int = 10000):
+        self._stream = stream
+        self._close_stream = close_stream
+        self._queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self.dropped = 0
+        self._thread = threading.Thread(target=self._worker, name="span-exporter", daemon=True)
+        self._thread.start()
+
+    def export(self, span: Span):
+        """Queue a finished span without blocking the caller."""
+        try:
+            self._queue.put_nowait(span)
+        except queue.Full:
+            self.dropped += 1
+
+    def _worker(self):
+        while True:
+            span = self._queue.get()
+            if span is None:
+                break
+            self._stream.write(json.dumps(span.to_otlp(), default=str) + "\n")
+            if self._queue.empty():
+                self._stream.flush()
+        self._stream.flush()
+
+    def shutdown(self):
+        """Flush queued spans and stop the writer thread."""
+        self._queue.put(None)
+        self._thread.join(timeout=5)
+        if self._close_stream:
+            self._stream.close()
+
+
+_exporter: Optional[SpanExporter] = None
+_sample_rate = 1.0
+
+
+def configure_tracing(exporter: Optional[str] = None, sample_rate: Optional[float] = None):
+    """Set up the span exporter from arguments or ``MCP_TRACE_*`` variables.
+
+    Forked worker processes must call this again, since the writer thread
+    does not survive ``fork()``.
+    """
+    global _exporter, _sample_rate
+    shutdown_tracing()
+
+    exporter = (exporter or os.getenv("MCP_TRACE_EXPORTER", "none")).lower()
+    _sample_rate = sample_rate if sample_rate is not None else get_sample_rate("MCP_TRACE_SAMPLE_RATE", 1.0)
+    if exporter == "console":
+        _exporter = SpanExporter(sys.stderr)
+    elif exporter == "file":
+        path = os.getenv("MCP_TRACE_FILE", "traces.jsonl")
+        _exporter = SpanExporter(open(path, "a", encoding="utf-8"), close_stream=True)
+    else:
+        return
+    atexit.register(shutdown_tracing)
+
+
+def shutdown_tracing():
+    """Flush and stop the exporter, disabling tracing."""
+    global _exporter
+    if _exporter is not None:
+        _exporter.shutdown()
+        _exporter = None
+
+
+def is_enabled() -> bool:
+    """Whether spans are being exported."""
+    return _exporter is not None
+
+
+def current_span() -> Optional[Span]:
+    """Return the span active in the current context."""
+    return _current_span.get()
+
+
+@contextmanager
+def start_span(
+    name: str,
+    attributes: Optional[Dict[str, Any]] = None,
+    kind: str = KIND_INTERNAL,
+    traceparent: Optional[str] = None
+) -> Iterator[Any]:
+    """Run a block inside a new span.
+
+    The span continues the current trace, or the trace named by an incoming
+    ``traceparent`` header, or starts a new sampled-or-not trace. Exceptions
+    mark the span as failed and are re-raised.
+
+    Args:
+        name: Low-cardinality operation name.
+        attributes: Initial span attributes.
+        kind: OTLP span kind.
+        traceparent: W3C header from an incoming request.
+    """
+    if _exporter is None:
+        yield NOOP_SPAN
+        return
+
+    parent = _current_span.get()
+    if parent is not None:
+        span = Span(name, parent.trace_id, parent.span_id, parent.sampled, kind, attributes)
+    else:
+        match = _TRACEPARENT.match(traceparent or "")
+        if match:
+            trace_id, parent_id, flags = match.groups()
+            sampled = bool(int(flags, 16) & 1)
+        else:
+            trace_id, parent_id = secrets.token_hex(16), None
+            sampled = random.random() < _sample_rate
+        span = Span(name, trace_id, parent_id, sampled, kind, attributes)
+
+    token = _current_span.set(span)
+    try:
+        yield span
+    except BaseException as e:
+        span.set_error(f"{type(e).__name__}: {e}")
+        raise
+    finally:
+        _current_span.reset(token)
+        span.end()
+        exporter = _exporter
+        if span.sampled and exporter is not None:
+            exporter.export(span)
+
@@ -0,0 +1,212 @@
+"""Multi-process worker support for the HTTP server.
+
+The supervisor forks N worker processes which all bind the same port with
+SO_REUSEPORT, so the kernel load-balances connections across them. Crashed
+workers are restarted with exponential backoff. Optionally, workers record
+request counters in a shared-memory array that any worker can aggregate.
+"""
+
+import logging
+import multiprocessing
+import multiprocessing.connection
+import signal
+import socket
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def reuse_port_supported() -> bool:
+    """Check whether the platform supports SO_REUSEPORT."""
+    return hasattr(socket, "SO_REUSEPORT")
+
+
+def _run_worker(target: Callable[..., Any], worker_id: int, stats: Optional["SharedStats"]):
+    """Reset inherited signal handlers, then run the worker entry point."""
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    signal.signal(signal.SIGINT, signal.default_int_handler)
+    target(worker_id, stats)
+
+
+class SharedStats:
+    """Per-worker request counters stored in shared memory.
+
+    Each worker owns one row and is the only writer to it, so no locking is
+    needed on the hot path. Readers aggregate all rows on demand.
+    """
+
+    FIELDS = ("requests", "errors", "latency_us", "restarts")
+
+    def __init__(self, worker_count: int):
+        """Allocate shared counters for ``worker_count`` workers.
+
+        Args:
+            worker_count: Number of worker slots.
+        """
+        self.worker_count = worker_count
+        self._values = multiprocessing.RawArray("q", worker_count * len(self.FIELDS))
+        self.worker_id: Optional[int] = None
+
+    def _index(self, worker_id: int, field: str) -> int:
+        return worker_id * len(self.FIELDS) + self.FIELDS.index(field)
+
+    def increment(self, field: str, amount: int = 1, worker_id: Optional[int] = None):
+        """Add ``amount`` to a counter of this (or the given) worker."""
+        slot = self.worker_id if worker_id is None else worker_id
+        if slot is None:
+            return
+        self._values[self._index(slot, field)] += amount
+
+    def record_request(self, elapsed: float, error: bool = False):
+        """Record one served request for the current worker.
+
+        Args:
+            elapsed: Request duration in seconds.
+            error: Whether the request ended in a server error.
+        """
+        if self.worker_id is None:
+            return
+        base = self.worker_id * len(self.FIELDS)
+        self._values[base] += 1
+        if error:
+            self._values[base + 1] += 1
+        self._values[base + 2] += int(elapsed * 1_000_000)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return per-worker and aggregated counters."""
+        workers: List[Dict[str, int]] = []
+        totals = {field: 0 for field in self.FIELDS}
+        for worker_id in range(self.worker_count):
+            row = {
+                field: self._values[self._index(worker_id, field)]
+                for field in self.FIELDS
+            }
+            workers.append({"worker": worker_id, **row})
+            for field, value in row.items():
+                totals[field] += value
+        return {"workers": workers, "totals": totals}
+
+
+class WorkerSupervisor:
+    """Start worker processes and restart them when they crash."""
+
+    def __init__(
+        self,
+        target: Callable[..., Any],
+        worker_count: int,
+        stats: Optional[SharedStats] = None,
+        restart_delay: float = 1.0,
+        max_restart_delay: float = 30.0,
+        shutdown_timeout: float = 10.0
+    ):
+        """Initialize the supervisor.
+
+        Args:
+            target: Worker entry point, called as ``target(worker_id, stats)``.
+            worker_count: Number of worker processes to keep running.
+            stats: Optional shared counters passed to every worker.
+            restart_delay: Initial delay before restarting a crashed worker.
+            max_restart_delay: Upper bound for the restart backoff.
+            shutdown_timeout: Seconds to wait for workers to exit on shutdown.
+        """
+        self.target = target
+        self.worker_count = worker_count
+        self.stats = stats
+        self.restart_delay = restart_delay
+        self.max_restart_delay = max_restart_delay
+        self.shutdown_timeout = shutdown_timeout
+        self._processes: List[Optional[multiprocessing.Process]] = [None] * worker_count
+        self._started_at: List[float] = [0.0] * worker_count
+        self._delays: List[float] = [restart_delay] * worker_count
+        self._restart_at: Dict[int, float] = {}
+        self._stopping = False
+
+    def _spawn(self, worker_id: int):
+        process = multiprocessing.Process(
+            target=_run_worker,
+            args=(self.target, worker_id, self.stats),
+            name=f"mcp-worker-{worker_id}",
+            daemon=False
+        )
+        process.start()
+        self._processes[worker_id] = process
+        self._started_at[worker_id] = time.monotonic()
+        logger.info(f"Started worker {worker_id} (pid {process.pid})")
+
+    def _handle_signal(self, signum, frame):
+        logger.info(f"Supervisor received signal {signum}, stopping workers")
+        self._stopping = True
+
+    def _reap(self):
+        """Schedule restarts for workers that have exited."""
+        now = time.monotonic()
+        for worker_id, process in enumerate(self._processes):
+            if process is None or process.is_alive() or worker_id in self._restart_at:
+                continue
+
+            uptime = now - self._started_at[worker_id]
+            # A worker that stayed up for a while is considered healthy again
+            if uptime > self.max_restart_delay:
+                self._delays[worker_id] = self.restart_delay
+
+            delay = self._delays[worker_id]
+            logger.warning(
+                f"Worker {worker_id} (pid {process.pid}) exited with code "
+                f"{process.exitcode} after {uptime:.1f}s; restarting in {delay:.1f}s"
+            )
+            self._restart_at[worker_id] = now + delay
+            self._delays[worker_id] = min(delay * 2, self.max_restart_delay)
+
+    def _restart_due(self):
+        now = time.monotonic()
+        for worker_id, due in list(self._restart_at.items()):
+            if due <= now:
+                del self._restart_at[worker_id]
+                if self.stats is not None:
+                    self.stats.increment("restarts", worker_id=worker_id)
+                self._spawn(worker_id)
+
+    def _shutdown(self):
+        alive = [p for p in self._processes if p is not None and p.is_alive()]
+        for process in alive:
+            process.terminate()
+
+        deadline = time.monotonic() + self.shutdown_timeout
+        for process in alive:
+            process.join(max(0.0, deadline - time.monotonic()))
+            if process.is_alive():
+                logger.warning(f"Worker pid {process.pid} did not exit in time; killing")
+                process.kill()
+                process.join()
+
+    def run(self) -> int:
+        """Run the supervisor loop until a termination signal arrives.
+
+        Returns:
+            Process exit code for the supervisor.
+        """
+        signal.signal(signal.SIGTERM, self._handle_signal)
+        signal.signal(signal.SIGINT, self._handle_signal)
+
+        for worker_id in range(self.worker_count):
+            self._spawn(worker_id)
+
+        try:
+            while not self._stopping:
+                sentinels = [p.sentinel for p in self._processes if p is not None and p.is_alive()]
+                timeout = 1.0
+                if self._restart_at:
+                    timeout = max(0.0, min(self._restart_at.values()) - time.monotonic())
+                    timeout = min(timeout, 1.0)
+                if sentinels:
+                    multiprocessing.connection.wait(sentinels, timeout=timeout)
+                else:
+                    time.sleep(timeout)
+                self._reap()
+                self._restart_due()
+        finally:
+            self._shutdown()
+
+        logger.info("All workers stopped")
+        return 0
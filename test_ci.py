@@ -79,7 +79,9 @@ def test_server_initialization():
         expected_tools = [
             'list_customers', 'get_customer', 'create_customer', 'update_customer',
             'search_customers', 'get_customer_tickets', 'list_tickets', 'get_ticket',
-            'create_ticket', 'update_ticket', 'search_tickets'
+            'create_ticket', 'update_ticket', 'search_tickets', 'find_customer_by_phone',
+            'bulk_upsert_customers', 'bulk_update_customers', 'get_customer_overview',
+            'find_duplicate_customers'
         ]
         
         tool_names = [tool.name for tool in tools]
@@ -123,6 +125,25 @@ def test_environment_check():
         if original_key:
             os.environ['GORGIAS_API_KEY'] = original_key
         
+        # .env loading is only skipped on Cloud Run in fast-boot mode
+        import dotenv
+        from src.utils.config import GorgiasConfig
+        original_load = dotenv.load_dotenv
+        loads = []
+        dotenv.load_dotenv = lambda *args, **kwargs: loads.append(True)
+        os.environ["K_SERVICE"] = "gorgias-mcp"
+        try:
+            GorgiasConfig()
+            assert len(loads) == 1, loads
+            os.environ["MCP_FAST_BOOT"] = "true"
+            GorgiasConfig()
+            assert len(loads) == 1, loads
+        finally:
+            dotenv.load_dotenv = original_load
+            del os.environ["K_SERVICE"]
+            os.environ.pop("MCP_FAST_BOOT", None)
+        print("✅ .env loading is skipped only in fast-boot mode on Cloud Run")
+        
         return True
         
     except Exception as e:
@@ -167,6 +188,1343 @@ def test_configuration_files():
         print(f"❌ Configuration files test failed: {e}")
         return False
 
+def test_response_compression():
+    """Test Accept-Encoding negotiation and compression round trips."""
+    print("\n🔍 Testing response compression...")
+    
+    try:
+        import gzip
+        from src.utils import compression
+        
+        assert compression.negotiate_encoding(None) is None
+        assert compression.negotiate_encoding("identity") is None
+        assert compression.negotiate_encoding("gzip") == "gzip"
+        assert compression.negotiate_encoding("gzip;q=0") is None
+        assert compression.negotiate_encoding("*") == compression.available_encodings()[0]
+        print("✅ Accept-Encoding negotiation works")
+        
+        body = b'{"data": [' + b'{"id": 1, "status": "open"}, ' * 200 + b'{}]}'
+        compressed = compression.compress(body, "gzip")
+        assert gzip.decompress(compressed) == body
+        assert len(compressed) < len(body)
+        
+        stream = compression.StreamCompressor("gzip")
+        chunks = [stream.compress(b"data: one\n\n"), stream.compress(b"data: two\n\n")]
+        chunks.append(stream.finish())
+        assert gzip.decompress(b"".join(chunks)) == b"data: one\n\ndata: two\n\n"
+        print("✅ Buffered and streaming gzip round trips work")
+        
+        return True
+        
+    except Exception as e:
+        print(f"❌ Response compression test failed: {e}")
+        return False
+
+def test_worker_stats():
+    """Test shared-memory worker stats aggregation."""
+    print("\n🔍 Testing worker stats...")
+    
+    try:
+        from src.utils.workers import SharedStats
+        
+        stats = SharedStats(2)
+        stats.worker_id = 0
+        stats.record_request(0.002)
+        stats.worker_id = 1
+        stats.record_request(0.001, error=True)
+        stats.increment("restarts", worker_id=0)
+        
+        snapshot = stats.snapshot()
+        assert snapshot["totals"]["requests"] == 2
+        assert snapshot["totals"]["errors"] == 1
+        assert snapshot["totals"]["latency_us"] == 3000
+        assert snapshot["workers"][0]["restarts"] == 1
+        print("✅ Worker stats aggregate across slots")
+        
+        return True
+        
+    except Exception as e:
+        print(f"❌ Worker stats test failed: {e}")
+        return False
+
+def test_metrics():
+    """Test metrics recording and Prometheus text rendering."""
+    print("\n🔍 Testing metrics...")
+    
+    try:
+        from src.utils import metrics
+        
+        assert metrics.endpoint_template("customers/123/") == "customers/{id}"
+        assert metrics.endpoint_template("/tickets/42/messages") == "tickets/{id}/messages"
+        assert metrics.endpoint_template("tickets/search") == "tickets/search"
+        print("✅ Endpoint templates collapse numeric IDs")
+        
+        metrics.record_tool_call("ci_tool", 0.02, "success")
+        metrics.record_rate_limit("10/40")
+        metrics.record_cache("ci_cache", True)
+        metrics.record_cache("ci_cache", False)
+        
+        text = metrics.registry.render()
+        assert 'gorgias_mcp_tool_calls_total{tool="ci_tool",outcome="success"} 1' in text
+        assert 'gorgias_mcp_tool_duration_seconds_bucket{tool="ci_tool",le="0.025"} 1' in text
+        assert "gorgias_upstream_rate_limit_remaining 30" in text
+        assert 'gorgias_mcp_cache_hit_ratio{cache="ci_cache"} 0.5' in text
+        print("✅ Metrics render in Prometheus text format")
+
+        from src.server import GorgiasMCPServer
+        server = GorgiasMCPServer()
+        asyncio.run(server.handle_tool_call("get_customer_x", {}))
+        text = metrics.registry.render()
+        assert 'tool="get_customer_x"' not in text
+        assert 'gorgias_mcp_tool_calls_total{tool="unknown",outcome="error"}' in text
+        print("✅ Unregistered tool names are labelled unknown")
+
+        return True
+        
+    except Exception as e:
+        print(f"❌ Metrics test failed: {e}")
+        return False
+
+def test_structured_logging():
+    """Test payload redaction, truncation and log sampling."""
+    print("\n🔍 Testing structured logging...")
+    
+    try:
+        import logging
+        from src.utils.structured_logging import LazyPayload, SamplingFilter
+        
+        text = str(LazyPayload({"email": "a@example.com", "language": "en"}))
+        assert "a@example.com" not in text and '"language":"en"' in text
+        assert str(LazyPayload("x" * 50, limit=10)).startswith("x" * 10 + "...[40 more chars]")
+        print("✅ Payloads are redacted and capped")
+        
+        sampling = SamplingFilter()
+        record = logging.makeLogRecord({"levelno": logging.INFO, "sample_rate": 0.0})
+        assert not sampling.filter(record)
+        record = logging.makeLogRecord({"levelno": logging.ERROR, "sample_rate": 0.0})
+        assert sampling.filter(record)
+        print("✅ Sampling drops INFO records but never errors")
+        
+        return True
+        
+    except Exception as e:
+        print(f"❌ Structured logging test failed: {e}")
+        return False
+
+def test_admission_control():
+    """Test that admission control queues by priority and sheds overflow."""
+    print("\n🔍 Testing admission control...")
+    
+    try:
+        from src.utils.admission import AdmissionController, AdmissionRejected
+        
+        async def scenario():
+            controller = AdmissionController(max_in_flight=1, queue_size=1, queue_timeout=1.0)
+            order = []
+            
+            async def call(name, priority):
+                async with controller.slot(priority):
+                    order.append(name)
+                    await asyncio.sleep(0.01)
+            
+            await controller.acquire()
+            low = asyncio.create_task(call("low", "low"))
+            high = asyncio.create_task(call("high", "high"))
+            await asyncio.sleep(0)
+            try:
+                await controller.acquire("low")
+                raise AssertionError("overflow call was admitted")
+            except AdmissionRejected as e:
+                assert e.retry_after >= 1
+            controller.release()
+            await asyncio.gather(low, high)
+            assert order == ["high", "low"], order
+            assert controller.in_flight == 0 and controller.queued == 0
+        
+        asyncio.run(scenario())
+        print("✅ Freed slots go to higher priorities first")
+        print("✅ Calls beyond the queue bound are rejected with a retry hint")
+        
+        return True
+        
+    except Exception as e:
+        print(f"❌ Admission control test failed: {e}")
+        return False
+
+def test_caller_fairness():
+    """Test per-caller token buckets and caller identification."""
+    print("\n🔍 Testing per-caller fairness...")
+    
+    try:
+        from src.utils.fairness import CallerLimiter, caller_key
+        
+        key = caller_key({"Authorization": "Bearer secret"}, "10.0.0.1")
+        assert key.startswith("key:") and "secret" not in key
+        # Calls sharing one platform key are still told apart by session
+        first = caller_key({"Authorization": "Bearer secret", "X-Call-Id": "call-1"}, None)
+        second = caller_key({"Authorization": "Bearer secret", "X-Call-Id": "call-2"}, None)
+        assert first.startswith("session:") and first != second
+        assert caller_key({}, "10.0.0.1") == caller_key({"X-Forwarded-For": "10.0.0.1, 1.2.3.4"}, None)
+        assert CallerLimiter.from_env() is None
+        print("✅ Callers are identified by hashed session, key or IP; limiting is opt-in")
+        
+        limiter = CallerLimiter(rate=1.0, burst=2)
+        assert limiter.try_acquire("a") == 0 and limiter.try_acquire("a") == 0
+        assert limiter.try_acquire("a") > 0
+        assert limiter.try_acquire("b") == 0
+        print("✅ A caller over its budget is throttled without affecting others")
+        
+        return True
+        
+    except Exception as e:
+        print(f"❌ Caller fairness test failed: {e}")
+        return False
+
+def test_background_jobs():
+    """Test background job execution and event replay."""
+    print("\n🔍 Testing background jobs...")
+    
+    try:
+        from src.utils.jobs import JobLimitExceeded, JobManager
+        
+        async def runner(name, arguments):
+            await asyncio.sleep(0.01)
+            if name == "fail":
+                raise RuntimeError("boom")
+            if name == "get_ticket":
+                return "Error getting ticket 1: 404 Not Found"
+            return f"{name} done"
+        
+        async def scenario():
+            from src.server import is_error_result
+            manager = JobManager(runner, concurrency=1, max_pending=1, is_error=is_error_result)
+            job = await manager.submit("list_tickets", {})
+            try:
+                await manager.submit("list_tickets", {})
+                raise AssertionError("pending limit was not enforced")
+            except JobLimitExceeded:
+                pass
+            await job.task
+            assert job.to_dict()["result"] == "list_tickets done"
+            statuses = [event["status"] for event in job.events]
+            assert statuses == ["pending", "running", "succeeded"], statuses
+            # Resuming after event 2 replays only the final event
+            replay = await job.wait_for_events(2, timeout=0.1)
+            assert [event["status"] for event in replay] == ["succeeded"]
+            
+            failed = await manager.submit("fail", {})
+            await failed.task
+            assert failed.status == "failed" and failed.error == "boom"
+            
+            # Tools report errors as text; the job must still end up failed
+            errored = await manager.submit("get_ticket", {"ticket_id": 1})
+            await errored.task
+            assert errored.status == "failed" and errored.error.startswith("Error getting ticket 1")
+            assert errored.events[-1] == {"job_id": errored.id, "status": "failed", "error": errored.error}
+        
+        asyncio.run(scenario())
+        print("✅ Jobs run in the background with a bounded pending queue")
+        print("✅ Event logs replay from a Last-Event-ID")
+        print("✅ Error results mark the job failed")
+        
+        return True
+        
+    except Exception as e:
+        print(f"❌ Background jobs test failed: {e}")
+        return False
+
+def test_tracing():
+    """Test span nesting, traceparent propagation and file export."""
+    print("\n🔍 Testing tracing...")
+    
+    try:
+        import json
+        import tempfile
+        from src.utils import tracing
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "traces.jsonl")
+            os.environ["MCP_TRACE_FILE"] = path
+            try:
+                tracing.configure_tracing("file", sample_rate=1.0)
+                parent = "00-" + "a" * 32 + "-" + "b" * 16 + "-01"
+                with tracing.start_span("POST /mcp", traceparent=parent) as root:
+                    with tracing.start_span("HTTP GET", {"url.template": "customers"}):
+                        pass
+                tracing.shutdown_tracing()
+            finally:
+                del os.environ["MCP_TRACE_FILE"]
+            
+            with open(path) as f:
+                spans = [json.loads(line) for line in f]
+        
+        child, exported_root = spans
+        assert exported_root["traceId"] == "a" * 32 and exported_root["parentSpanId"] == "b" * 16
+        assert child["traceId"] == "a" * 32 and child["parentSpanId"] == root.span_id
+        assert child["attributes"] == [{"key": "url.template", "value": {"stringValue": "customers"}}]
+        print("✅ Spans nest, continue incoming traces and export as OTLP JSON")
+        
+        with tracing.start_span("disabled") as span:
+            assert span is tracing.NOOP_SPAN
+        print("✅ Tracing is a no-op without an exporter")
+        
+        return True
+        
+    except Exception as e:
+        print(f"❌ Tracing test failed: {e}")
+        return False
+
+def test_websocket_transport():
+    """Test multiplexed JSON-RPC and pushed partial results over /mcp/ws."""
+    print("\n🔍 Testing WebSocket transport...")
+    
+    try:
+        import json
+        from aiohttp import web
+        from aiohttp.test_utils import TestClient, TestServer
+        import cloud_run_mcp
+        
+        class StubServer:
+            def get_all_tools(self):
+                return []
+            
+            async def handle_tool_call(self, name, arguments):
+                if name == "slow":
+                    await asyncio.sleep(0.2)
+                return "x" * 1200
+        
+        async def scenario():
+            app = web.Application()
+            app.router.add_get('/mcp/ws', cloud_run_mcp.mcp_websocket_handler)
+            async with TestClient(TestServer(app)) as client:
+                ws = await client.ws_connect('/mcp/ws')
+                for request_id, name, stream in ((1, "slow", False), (2, "fast", True)):
+                    await ws.send_str(json.dumps({
+                        "jsonrpc": "2.0", "id": request_id, "method": "tools/call",
+                        "params": {"name": name, "arguments": {}, "stream": stream}
+                    }))
+                messages = [json.loads((await ws.receive()).data) for _ in range(5)]
+                await ws.close()
+            return messages
+        
+        previous = (cloud_run_mcp.mcp_server, cloud_run_mcp.caller_limiter, cloud_run_mcp.admission)
+        cloud_run_mcp.mcp_server, cloud_run_mcp.caller_limiter, cloud_run_mcp.admission = StubServer(), None, None
+        try:
+            messages = asyncio.run(scenario())
+        finally:
+            cloud_run_mcp.mcp_server, cloud_run_mcp.caller_limiter, cloud_run_mcp.admission = previous
+        
+        progress = [m for m in messages if m.get("method") == "notifications/progress"]
+        responses = [m["id"] for m in messages if "id" in m]
+        assert [p["params"]["progress"] for p in progress] == [1, 2, 3]
+        assert responses == [2, 1], responses
+        print("✅ Concurrent requests are answered out of order by id")
+        print("✅ Streaming calls push partial results before the response")
+        
+        return True
+        
+    except Exception as e:
+        print(f"❌ WebSocket transport test failed: {e}")
+        return False
+
+def test_phone_index():
+    """Test phone normalization, indexing and paged sync."""
+    print("\n🔍 Testing phone index...")
+    
+    try:
+        from src.utils.customer_sync import CustomerSync
+        from src.utils.phone_index import PhoneIndex, normalize_phone
+        
+        assert normalize_phone("(555) 010-1234", "1") == "+15550101234"
+        assert normalize_phone("+44 7700 900123") == "+447700900123"
+        assert normalize_phone("0044 7700 900123") == "+447700900123"
+        assert normalize_phone("07700 900123", "44") == "+447700900123"
+        assert normalize_phone("123") is None
+        print("✅ Phone numbers normalize to E.164")
+        
+        class PagedClient:
+            async def get(self, endpoint, params=None):
+                if "cursor" not in params:
+                    return {"data": [{"id": 1, "name": "Ann", "channels": [
+                        {"type": "phone", "address": "+1 555 010 1234"},
+                        {"type": "email", "address": "ann@example.com"}
+                    ]}], "meta": {"next_cursor": "abc"}}
+                return {"data": [{"id": 2, "channels": []}], "meta": {"next_cursor": None}}
+        
+        index = PhoneIndex()
+        sync = CustomerSync([index])
+        asyncio.run(sync.sync(PagedClient(), page_delay=0))
+        assert sync.complete and sync.customers_scanned == 2
+        assert index.lookup("555-010-1234")[0]["email"] == "ann@example.com"
+        sync.index_customer({"id": 1, "channels": [{"type": "phone", "address": "+15550109999"}]})
+        assert index.lookup("+15550101234") == [] and index.lookup("+15550109999")[0]["id"] == 1
+        print("✅ Paged sync and writes keep the index current")
+
+        from src.utils.fuzzy_index import TrigramIndex
+
+        class FailingClient:
+            async def get(self, endpoint, params=None):
+                raise RuntimeError("upstream down")
+
+        class MergedClient:
+            async def get(self, endpoint, params=None):
+                return {"data": [{"id": 2, "name": "Bea", "channels": []}], "meta": {"next_cursor": None}}
+
+        names = TrigramIndex()
+        sync = CustomerSync([index, names])
+        sync.index_customer({"id": 1, "name": "Ann", "channels": [{"type": "phone", "address": "+15550109999"}]})
+        try:
+            asyncio.run(sync.sync(FailingClient(), page_delay=0))
+        except RuntimeError:
+            pass
+        assert index.lookup("+15550109999") and names.search("Ann")
+        asyncio.run(sync.sync(MergedClient(), page_delay=0))
+        assert index.lookup("+15550109999") == [] and names.search("Ann") == []
+        assert names.customer_ids() == [2]
+        print("✅ A complete sync drops customers it no longer sees")
+        
+        class Throttled(Exception):
+            def __init__(self):
+                super().__init__("429 Too Many Requests")
+                self.response = type("Response", (), {"status_code": 429, "headers": {"Retry-After": "0"}})()
+        
+        class ThrottledClient(MergedClient):
+            throttled = False
+            
+            async def get(self, endpoint, params=None):
+                if not self.throttled:
+                    self.throttled = True
+                    raise Throttled()
+                return await super().get(endpoint, params)
+        
+        sync.synced_at = None
+        asyncio.run(sync.sync(ThrottledClient(), page_delay=0))
+        assert sync.complete and sync.customers_scanned == 1
+        print("✅ A throttled page is retried instead of abandoning the sync")
+
+        return True
+        
+    except Exception as e:
+        print(f"❌ Phone index test failed: {e}")
+        return False
+
+def test_fuzzy_customer_search():
+    """Test trigram ranking of misspelled names and emails."""
+    print("\n🔍 Testing fuzzy customer search...")
+    
+    try:
+        import time
+        from src.utils.fuzzy_index import TrigramIndex
+        
+        index = TrigramIndex()
+        index.index_customer({"id": 1, "name": "Tony Katz", "email": "tony.katz@example.com"})
+        index.index_customer({"id": 2, "name": "Toni Kurtz", "email": "tk@example.com"})
+        index.index_customer({"id": 3, "name": "Maria José", "email": "maria@example.com"})
+        
+        matches = index.search("Tony Kats")
+        assert [m["id"] for m in matches][:2] == [1, 2], matches
+        assert index.search("maria jose")[0]["id"] == 3
+        assert index.search("tonykatz@gmail.com")[0]["id"] == 1
+        index.index_customer({"id": 1, "name": "Anthony Smith", "email": "anthony@example.com"})
+        assert all(m["id"] != 1 for m in index.search("Tony Katz"))
+        print("✅ Misspelled names rank the intended customer first")
+        
+        from src.tools.customers import CustomerTools
+        
+        class Api:
+            def __init__(self):
+                self.requests = []
+            
+            async def get(self, endpoint, params=None):
+                self.requests.append(dict(params))
+                if params.get("name") == "Ann Lee":
+                    return {"data": [{"id": 9, "name": "Ann Lee", "email": "ann@example.com"}]}
+                return {"data": []}
+        
+        api = Api()
+        tools = CustomerTools(api)
+        tools.customer_sync.index_customer({"id": 4, "name": "Anne Leigh", "email": "al@example.com"})
+        result = asyncio.run(tools.search_customers(name="Ann Lee", mode="fuzzy"))
+        # Before a full sync the exact API hit is merged in and coverage is flagged
+        assert "partial index" in result and api.requests == [{"limit": 50, "name": "Ann Lee"}], result
+        assert '"id": 9' in result and '"id": 4' in result, result
+        tools.customer_sync.synced_at = time.time()
+        result = asyncio.run(tools.search_customers(name="Ann Lee", mode="fuzzy"))
+        assert "partial" not in result and len(api.requests) == 1, result
+        assert asyncio.run(tools.search_customers(name="Ann Lee", mode="fuzy")).startswith("Error")
+        print("✅ A partial index includes exact API matches and says so; unknown modes are errors")
+        
+        return True
+        
+    except Exception as e:
+        print(f"❌ Fuzzy customer search test failed: {e}")
+        return False
+
+def test_customer_upsert():
+    """Test create_customer creating in one request and skipping no-op updates."""
+    print("\n🔍 Testing customer upsert...")
+    
+    try:
+        from src.tools.customers import CustomerTools
+        
+        class Backend:
+            def __init__(self):
+                self.customers = {}
+                self.calls = []
+            
+            async def get(self, endpoint, params=None):
+                self.calls.append(("GET", endpoint))
+                if endpoint == "customers":
+                    email = (params or {}).get("email")
+                    return {"data": [dict(c) for c in self.customers.values() if email and c.get("email") == email]}
+                return dict(self.customers[int(endpoint.split("/")[1])])
+            
+            async def post(self, endpoint, data=None):
+                self.calls.append(("POST", endpoint))
+                customer = {**data, "id": len(self.customers) + 1}
+                customer.setdefault("channels", [])
+                self.customers[customer["id"]] = customer
+                return dict(customer)
+            
+            async def put(self, endpoint, data=None):
+                self.calls.append(("PUT", endpoint))
+                customer = self.customers[int(endpoint.split("/")[1])]
+                customer.update(data)
+                return dict(customer)
+        
+        backend = Backend()
+        tools = CustomerTools(backend)
+        result = asyncio.run(tools.create_customer(email="jane@example.com", phone="+15550101234", name="Jane Doe"))
+        assert result.startswith("Created customer 1"), result
+        assert [method for method, _ in backend.calls].count("POST") == 1, backend.calls
+        channels = backend.customers[1]["channels"]
+        assert {c["type"]: c["address"] for c in channels} == {"email": "jane@example.com", "phone": "+15550101234"}
+        assert backend.customers[1]["name"] == "Jane Doe"
+        print("✅ A new customer is created in one POST with email and phone channels")
+        
+        backend.calls.clear()
+        result = asyncio.run(tools.create_customer(email="jane@example.com", phone="+15550101234", name="Jane Doe"))
+        assert "already up to date" in result and backend.calls == [("GET", "customers")], (result, backend.calls)
+        print("✅ An unchanged existing customer gets no PUT")
+        
+        backend.calls.clear()
+        result = asyncio.run(tools.create_customer(email="jane@example.com", phone="+1 555-010-1234"))
+        assert "already up to date" in result and ("PUT", "customers/1") not in backend.calls, result
+        print("✅ The same phone number in another format is not a change")
+        
+        backend.customers[1]["channels"] = None
+        tools.customer_cache.invalidate(1)
+        result = asyncio.run(tools.create_customer(email="jane@example.com", phone="+15550101234"))
+        assert "Updated customer 1" in result, result
+        assert backend.customers[1]["channels"][0]["address"] == "+15550101234"
+        print("✅ A customer whose channels are null is updated")
+        
+        backend.calls.clear()
+        result = asyncio.run(tools.create_customer(phone="+15550109999", name="Bea"))
+        assert result.startswith("Created customer 2"), result
+        assert backend.calls == [("POST", "customers")], backend.calls
+        assert backend.customers[2]["name"] == "Bea"
+        print("✅ Phone-only creation with one extra field works")
+        
+        return True
+        
+    except Exception as e:
+        print(f"❌ Customer upsert test failed: {e}")
+        return False
+
+def test_bulk_upsert():
+    """Test streaming bulk upserts with concurrency, rate limits and per-row outcomes."""
+    print("\n🔍 Testing bulk customer upsert...")
+    
+    try:
+        import json
+        import time
+        from src.tools.customers import CustomerTools
+        from src.utils.bulk import RateLimiter
+        
+        class Throttled(Exception):
+            def __init__(self):
+                super().__init__("429 Too Many Requests")
+                self.response = type("Response", (), {"status_code": 429, "headers": {"Retry-After": "0"}})()
+        
+        class Backend:
+            def __init__(self):
+                self.customers = {1: {"id": 1, "email": "old@example.com", "name": "Old", "channels": []}}
+                self.in_flight = self.peak = 0
+                self.throttle_once = True
+            
+            async def _trip(self):
+                self.in_flight += 1
+                self.peak = max(self.peak, self.in_flight)
+                await asyncio.sleep(0.01)
+                self.in_flight -= 1
+            
+            async def get(self, endpoint, params=None):
+                await self._trip()
+                email = (params or {}).get("email")
+                return {"data": [c for c in self.customers.values() if email and c["email"] == email]}
+            
+            async def post(self, endpoint, data=None):
+                await self._trip()
+                if self.throttle_once:
+                    self.throttle_once = False
+                    raise Throttled()
+                customer = {**data, "id": len(self.customers) + 1, "channels": data.get("channels", [])}
+                self.customers[customer["id"]] = customer
+                return customer
+            
+            async def put(self, endpoint, data=None):
+                await self._trip()
+                customer = self.customers[int(endpoint.split("/")[1])]
+                customer.update(data)
+                return customer
+        
+        backend = Backend()
+        tools = CustomerTools(backend)
+        rows = "email,first_name,last_name,phone\n" + "".join(
+            f"user{i}@example.com,User,{i},\n" for i in range(8)
+        ) + "old@example.com,New,Name,\n,No,Identifier,\n"
+        os.environ["MCP_BULK_RATE"] = "0"
+        try:
+            result = asyncio.run(tools.bulk_upsert_customers(data=rows, concurrency=4))
+        finally:
+            del os.environ["MCP_BULK_RATE"]
+        report = json.loads(result.split(":\n", 1)[1])
+        summary, outcomes = report["summary"], report["rows"]
+        assert summary["rows"] == 10 and summary["created"] == 8, summary
+        assert summary["updated"] == 1 and summary["failed"] == 1, summary
+        assert outcomes[8] == {"row": 9, "status": "updated", "customer_id": 1}
+        assert "email or phone" in outcomes[9]["error"]
+        assert 1 < backend.peak <= 4 and backend.customers[1]["name"] == "New Name"
+        print(f"✅ 10 rows upserted with {backend.peak} in flight, throttled row retried")
+        
+        result = asyncio.run(tools.bulk_upsert_customers(
+            data='{"email": "user0@example.com"}\nnot json\n', report="failures"
+        ))
+        outcomes = json.loads(result.split(":\n", 1)[1])["rows"]
+        assert [o["row"] for o in outcomes] == [2] and "invalid JSON" in outcomes[0]["error"]
+        print("✅ JSONL input reports malformed rows without stopping")
+        
+        async def paced():
+            limiter = RateLimiter(100, burst=1)
+            start = time.perf_counter()
+            for _ in range(11):
+                await limiter.acquire()
+            return time.perf_counter() - start
+        assert asyncio.run(paced()) >= 0.09
+        print("✅ Rate limiter paces upstream requests")
+        
+        return True
+        
+    except Exception as e:
+        print(f"❌ Bulk upsert test failed: {e}")
+        return False
+
+def test_bulk_update():
+    """Test bulk type and channel edits over IDs and filters."""
+    print("\n🔍 Testing bulk customer update...")
+    
+    try:
+        import json
+        from src.tools.customers import CUSTOMER_TYPE_NOTE, CustomerTools
+        
+        class Backend:
+            def __init__(self):
+                self.customers = {
+                    i: {"id": i, "name": f"Groomer {i}", "email": f"g{i}@example.com", "channels": [
+                        {"type": "email", "address": f"g{i}@example.com"},
+                        {"type": "email", "address": "old@example.com"}
+                    ]} for i in range(1, 8)
+                }
+                self.customers[7]["note"] = CUSTOMER_TYPE_NOTE.format("Groomer")
+                self.customers[7]["channels"] = [{"type": "email", "address": "g7@example.com"}]
+                self.calls = []
+            
+            async def get(self, endpoint, params=None):
+                self.calls.append(("GET", endpoint))
+                await asyncio.sleep(0.005)
+                if endpoint == "customers":
+                    ids = sorted(self.customers)
+                    page = params.get("page", 1)
+                    chunk = ids[(page - 1) * params["limit"]:page * params["limit"]]
+                    return {"data": [dict(self.customers[i]) for i in chunk]}
+                customer_id = int(endpoint.split("/")[1])
+                if customer_id not in self.customers:
+                    raise RuntimeError("404 Not Found")
+                return dict(self.customers[customer_id])
+            
+            async def put(self, endpoint, data=None):
+                self.calls.append(("PUT", endpoint))
+                await asyncio.sleep(0.005)
+                customer = self.customers[int(endpoint.split("/")[1])]
+                customer.update(data)
+                return customer
+        
+        backend = Backend()
+        tools = CustomerTools(backend)
+        os.environ["MCP_BULK_RATE"] = "0"
+        try:
+            result = asyncio.run(tools.bulk_update_customers(
+                customer_ids=[1, 2, 2, 99], customer_type="Groomer",
+                remove_channels=[{"type": "email", "address": "OLD@example.com"}]
+            ))
+            report = json.loads(result.split(":\n", 1)[1])
+            assert report["summary"]["updated"] == 2 and report["summary"]["failed"] == 1, report
+            assert report["failed"][0]["customer_id"] == 99
+            assert backend.customers[1]["note"].startswith("Customer Type: Groomer")
+            assert [c["address"] for c in backend.customers[2]["channels"]] == ["g2@example.com"]
+            print("✅ ID list updated once per customer, missing customer reported")
+            
+            backend.calls.clear()
+            result = asyncio.run(tools.bulk_update_customers(
+                filter={"name": "Groomer"}, customer_type="Groomer",
+                remove_channels=[{"type": "email", "address": "old@example.com"}]
+            ))
+            report = json.loads(result.split(":\n", 1)[1])
+            assert report["summary"]["updated"] == 4 and report["summary"]["unchanged"] == 3, report
+            assert ("GET", "customers/3") not in backend.calls
+            assert sum(1 for method, _ in backend.calls if method == "PUT") == 4
+            print("✅ Filter mode reuses listed records and skips no-op writes")
+            
+            assert asyncio.run(tools.bulk_update_customers(filter={}, customer_type="VIP")).startswith("Error")
+            print("✅ Empty selection is rejected")
+            
+            class Throttled(Exception):
+                def __init__(self):
+                    super().__init__("429 Too Many Requests")
+                    self.response = type("Response", (), {"status_code": 429, "headers": {"Retry-After": "0"}})()
+            
+            class CursorBackend(Backend):
+                """Three customers per page; the second page fails as configured."""
+                
+                def __init__(self, failure):
+                    super().__init__()
+                    self.failure = failure
+                
+                async def get(self, endpoint, params=None):
+                    if endpoint != "customers":
+                        return await super().get(endpoint, params)
+                    start = int(params.get("cursor", 0))
+                    if start == 3 and self.failure is not None:
+                        failure, self.failure = self.failure, (self.failure if self.failure == "down" else None)
+                        raise Throttled() if failure == "throttle" else RuntimeError("503 Service Unavailable")
+                    ids = sorted(self.customers)[start:start + 3]
+                    following = str(start + 3) if start + 3 < len(self.customers) else None
+                    return {"data": [dict(self.customers[i]) for i in ids], "meta": {"next_cursor": following}}
+            
+            backend = CursorBackend("throttle")
+            result = asyncio.run(CustomerTools(backend).bulk_update_customers(
+                filter={"name": "Groomer"}, customer_type="VIP"))
+            assert json.loads(result.split(":\n", 1)[1])["summary"]["updated"] == 7, result
+            print("✅ A throttled page fetch is retried instead of aborting the run")
+            
+            backend = CursorBackend("down")
+            result = asyncio.run(CustomerTools(backend).bulk_update_customers(
+                filter={"name": "Groomer"}, customer_type="VIP"))
+            report = json.loads(result.split(":\n", 1)[1])
+            assert result.startswith("Error bulk updating customers: 503") and "Stopped after 3 customers" in result
+            assert sorted(report["updated"]) == [1, 2, 3] and report["summary"]["updated"] == 3, report
+            print("✅ A failed page fetch still reports the customers already updated")
+        finally:
+            del os.environ["MCP_BULK_RATE"]
+        
+        return True
+        
+    except Exception as e:
+        print(f"❌ Bulk update test failed: {e}")
+        return False
+
+def test_customer_cache():
+    """Test that customer writes reuse cached records as their merge base."""
+    print("\n🔍 Testing customer write-through cache...")
+    
+    try:
+        from src.tools.customers import CustomerTools
+        import time
+        from src.utils.entity_cache import EntityCache
+        
+        class Backend:
+            def __init__(self):
+                self.customer = {"id": 5, "name": "Ann", "email": "ann@example.com", "channels": [
+                    {"type": "email", "address": "ann@example.com"}
+                ]}
+                self.calls = []
+                self.fail_put = False
+            
+            async def get(self, endpoint, params=None):
+                self.calls.append("GET")
+                return dict(self.customer)
+            
+            async def put(self, endpoint, data=None):
+                self.calls.append("PUT")
+                if self.fail_put:
+                    raise RuntimeError("500 Server Error")
+                self.customer = {**self.customer, **data}
+                return dict(self.customer)
+        
+        backend = Backend()
+        tools = CustomerTools(backend)
+        asyncio.run(tools.set_customer_type(5, "Groomer"))
+        asyncio.run(tools.add_customer_email(5, "ann@work.example.com"))
+        asyncio.run(tools.update_customer(5, language="fr"))
+        assert backend.calls == ["GET", "PUT", "PUT", "PUT"], backend.calls
+        channels = [c["address"] for c in backend.customer["channels"]]
+        assert channels == ["ann@example.com", "ann@work.example.com"], channels
+        assert backend.customer["note"].startswith("Customer Type: Groomer")
+        print("✅ Consecutive mutations merge onto the cached record without re-fetching")
+        
+        backend.fail_put = True
+        assert asyncio.run(tools.set_customer_type(5, "VIP")).startswith("Error")
+        backend.fail_put = False
+        backend.calls.clear()
+        asyncio.run(tools.set_customer_type(5, "VIP"))
+        assert backend.calls == ["GET", "PUT"], backend.calls
+        print("✅ A failed write invalidates the entry")
+        
+        cache = EntityCache(ttl=0.05)
+        cache.index_customer({"id": 1, "channels": []})
+        assert cache.get(1) is not None
+        time.sleep(0.06)
+        assert cache.get(1) is None
+        cache.index_customer({"id": 2, "channels": []})
+        cache.index_customer({"id": 2, "name": "partial"})
+        assert cache.get(2) is None
+        print("✅ Stale and partial records are not used as a merge base")
+        
+        return True
+        
+    except Exception as e:
+        print(f"❌ Customer cache test failed: {e}")
+        return False
+
+def test_customer_overview():
+    """Test concurrent overview sections with budgets and partial failure."""
+    print("\n🔍 Testing customer overview...")
+    
+    try:
+        import json
+        import time
+        from src.tools.customers import CustomerTools
+        
+        class Backend:
+            delays = {"customers/3": 0.05, "tickets": 0.05, "orders": 0.5}
+            
+            async def get(self, endpoint, params=None):
+                await asyncio.sleep(self.delays[endpoint])
+                if endpoint == "tickets":
+                    return {"data": [{"id": 10, "subject": "Late order", "status": "open", "messages": ["..."]}]}
+                if endpoint == "orders":
+                    return {"data": []}
+                return {"id": 3, "name": "Ann", "channels": [
+                    {"type": "email", "address": "ann@example.com"},
+                    {"type": "phone", "address": "+15550101234"}
+                ]}
+        
+        tools = CustomerTools(Backend())
+        start = time.perf_counter()
+        result = asyncio.run(tools.get_customer_overview(3, budget_ms=200))
+        elapsed = time.perf_counter() - start
+        overview = json.loads(result.split(":\n", 1)[1])
+        assert "partial: orders" in result and "200 ms" in overview["errors"]["orders"]
+        assert overview["customer"]["email"] == "ann@example.com"
+        assert overview["customer"]["phones"] == ["+15550101234"]
+        assert overview["tickets"] == [{"id": 10, "subject": "Late order", "status": "open"}]
+        assert elapsed < 0.35, elapsed
+        print(f"✅ Sections fetched concurrently, slow section cut at its budget ({elapsed * 1000:.0f} ms)")
+        
+        result = asyncio.run(tools.get_customer_overview(3, sections=["orders"], budget_ms=50))
+        assert result.startswith("Error") and "orders" in result
+        print("✅ All sections failing is reported as an error")
+        
+        return True
+        
+    except Exception as e:
+        print(f"❌ Customer overview test failed: {e}")
+        return False
+
+def test_mirror_sync():
+    """Test incremental SQLite mirror sync with checkpoints and resume."""
+    print("\n🔍 Testing mirror sync...")
+    
+    try:
+        import tempfile
+        from src.utils.mirror import MirrorStore, MirrorSync
+        
+        class Api:
+            def __init__(self):
+                stamp = lambda i: f"2026-01-01T00:{i:02d}:00+00:00"  # noqa: E731
+                self.records = {
+                    "customers": [{"id": i, "email": f"c{i}@example.com", "updated_datetime": stamp(i)} for i in range(25)],
+                    "tickets": [{"id": 100 + i, "customer": {"id": i}, "status": "open", "updated_datetime": stamp(i)}
+                                for i in range(5)],
+                }
+                self.requests = []
+                self.fail_on_page = None
+            
+            async def get(self, endpoint, params=None):
+                self.requests.append((endpoint, dict(params)))
+                ordered = sorted(self.records[endpoint], key=lambda r: r["updated_datetime"], reverse=True)
+                start = int(params.get("cursor", 0))
+                if self.fail_on_page is not None and start // params["limit"] == self.fail_on_page:
+                    raise RuntimeError("connection reset")
+                end = start + params["limit"]
+                return {"data": ordered[start:end], "meta": {"next_cursor": str(end) if end < len(ordered) else None}}
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "mirror.db")
+            api = Api()
+            api.fail_on_page = 2
+            sync = MirrorSync(api, MirrorStore(path), page_size=10)
+            try:
+                asyncio.run(sync.sync_entity("customers"))
+                raise AssertionError("expected the interrupted run to fail")
+            except RuntimeError:
+                pass
+            sync.store.close()
+            
+            # A new process picks up at the third page
+            api.fail_on_page = None
+            api.requests.clear()
+            sync = MirrorSync(api, MirrorStore(path), page_size=10)
+            assert sync.store.state("customers")["resume_params"]["cursor"] == "20"
+            asyncio.run(sync.sync())
+            assert api.requests[0] == ("customers", {"limit": 10, "order_by": "updated_datetime:desc", "cursor": "20"})
+            assert sync.store.count("customers") == 25 and sync.store.count("tickets") == 5
+            print("✅ Interrupted run resumed from its checkpoint")
+            
+            api.requests.clear()
+            api.records["customers"][3]["updated_datetime"] = "2026-01-02T00:00:00+00:00"
+            written = asyncio.run(sync.sync())
+            assert [endpoint for endpoint, _ in api.requests] == ["customers", "tickets"], api.requests
+            assert written["customers"] <= 2, written
+            assert sync.store.state("customers")["cursor"] == "2026-01-02T00:00:00+00:00"
+            snapshot = asyncio.run(sync.snapshot())
+            assert snapshot["entities"]["tickets"]["rows"] == 5 and snapshot["entities"]["customers"]["synced_at"]
+            assert snapshot["entities"]["customers"]["swept_at"] is None
+            print("✅ Delta run fetched one page per entity and applied only changes")
+            
+            # Deleted or merged upstream: deltas never mention these again
+            api.records["customers"] = [c for c in api.records["customers"] if c["id"] not in (7, 8)]
+            sync.sweep_interval = 3600
+            written = asyncio.run(sync.sync())
+            assert written["deleted customers"] == 2 and sync.store.count("customers") == 23, written
+            assert 7 not in sync.store.record_ids("customers")
+            assert asyncio.run(sync.snapshot())["entities"]["customers"]["swept_at"]
+            assert "deleted customers" not in asyncio.run(sync.sync())
+            sync.store.close()
+            print("✅ The periodic sweep drops customers deleted upstream, once per interval")
+        
+        return True
+        
+    except Exception as e:
+        print(f"❌ Mirror sync test failed: {e}")
+        return False
+
+def test_mirror_reads():
+    """Test max_staleness reads served from the mirror with live fallback."""
+    print("\n🔍 Testing mirror reads with bounded staleness...")
+    
+    try:
+        import tempfile
+        import threading
+        import time
+        from src.tools.customers import CustomerTools
+        from src.tools.tickets import TicketTools
+        from src.utils.mirror import MirrorStore, MirrorSync
+        
+        class Api:
+            def __init__(self):
+                self.requests = 0
+            
+            async def get(self, endpoint, params=None):
+                self.requests += 1
+                return {"data": [], "meta": {}}
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            store = MirrorStore(os.path.join(tmp, "mirror.db"))
+            store.apply_page("customers", [
+                {"id": 1, "name": "Tony Katz", "email": "tony@example.com", "updated_datetime": "2026-01-02"},
+                {"id": 2, "name": "Ann Lee", "email": "ann@example.com", "updated_datetime": "2026-01-01"},
+            ], "2026-01-02", None, time.time() - 30)
+            store.apply_page("tickets", [
+                {"id": 10, "customer": {"id": 1}, "status": "open", "priority": "high", "updated_datetime": "2026-01-03"},
+                {"id": 11, "customer": {"id": 1}, "status": "closed", "updated_datetime": "2026-01-02"},
+                {"id": 12, "customer": {"id": 2}, "status": "open", "updated_datetime": "2026-01-01"},
+            ], "2026-01-03", None, time.time() - 30)
+            
+            api = Api()
+            customers, tickets = CustomerTools(api), TicketTools(api)
+            customers.mirror = tickets.mirror = store
+            
+            start = time.perf_counter()
+            result = asyncio.run(customers.search_customers(name="tony katz", max_staleness=60))
+            elapsed = time.perf_counter() - start
+            assert "Found 1 customers" in result and "source: local mirror, synced 30s ago" in result, result
+            assert "Found 1 tickets" in asyncio.run(tickets.list_tickets(status="open", priority="high", max_staleness=60))
+            assert "Found 2 tickets for customer 1 (source: local mirror" in asyncio.run(
+                customers.get_customer_tickets(1, max_staleness=60))
+            assert "Found 2 customers (source: local mirror" in asyncio.run(customers.list_customers(max_staleness=60))
+            assert api.requests == 0 and elapsed < 0.05, (api.requests, elapsed)
+            print(f"✅ Fresh mirror answered without upstream requests ({elapsed * 1000:.1f} ms)")
+            
+            result = asyncio.run(customers.list_customers(max_staleness=10))
+            assert "(source: live API)" in result and api.requests == 1
+            assert "source" not in asyncio.run(tickets.list_tickets()).split(":")[0]
+            print("✅ Stale mirror falls back to the live API and says so")
+            
+            async def blocked_read(read):
+                # A mirror read waiting on the store must not stall the event loop
+                ticks = 0
+                
+                async def tick():
+                    nonlocal ticks
+                    while True:
+                        ticks += 1
+                        await asyncio.sleep(0.01)
+                
+                def hold_lock():
+                    with store._reader_lock:
+                        locked.set()
+                        time.sleep(0.1)
+                
+                locked = threading.Event()
+                holder = threading.Thread(target=hold_lock)
+                holder.start()
+                locked.wait()
+                ticker = asyncio.create_task(tick())
+                result = await read()
+                ticker.cancel()
+                holder.join()
+                return result, ticks
+            
+            result, ticks = asyncio.run(blocked_read(lambda: customers.list_customers(max_staleness=60)))
+            assert "source: local mirror" in result and ticks >= 5, (result, ticks)
+            snapshot, ticks = asyncio.run(blocked_read(MirrorSync(api, store).snapshot))
+            assert snapshot["entities"]["customers"]["rows"] == 2 and ticks >= 5, (snapshot, ticks)
+            print("✅ Mirror reads and status snapshots run off the event loop")
+            store.close()
+        
+        return True
+        
+    except Exception as e:
+        print(f"❌ Mirror read test failed: {e}")
+        return False
+
+def test_duplicate_detection():
+    """Test streaming duplicate-customer clustering."""
+    print("\n🔍 Testing duplicate customer detection...")
+    
+    try:
+        import json
+        import tempfile
+        import time
+        from src.tools.customers import CustomerTools
+        from src.utils.dedup import DuplicateDetector, normalize_email, normalize_name
+        from src.utils.mirror import MirrorStore
+        
+        assert normalize_email(" Tony.Katz+orders@Example.COM ") == "tony.katz@example.com"
+        assert normalize_name("Zoë  Smith") == normalize_name("smith, zoe")
+        assert normalize_name("Cher") is None
+        
+        def phone(number):
+            return {"type": "phone", "address": number}
+        
+        customers = [
+            {"id": 1, "name": "Tony Katz", "email": "tony@example.com"},
+            {"id": 2, "name": "Anthony Katz", "email": "TONY+vip@example.com", "channels": [phone("(212) 555-0100")]},
+            {"id": 3, "name": "A. Katz", "channels": [phone("+1 212 555 0100")]},
+            {"id": 4, "name": "Ann Lee", "email": "ann@example.com"},
+            {"id": 5, "name": "Lee Ann", "email": "ann.lee@example.com"},
+            {"id": 6, "firstname": "John", "lastname": "Smith"},
+        ] + [{"id": 100 + i, "name": "John Smith"} for i in range(6)]
+        
+        class Throttled(Exception):
+            def __init__(self):
+                super().__init__("429 Too Many Requests")
+                self.response = type("Response", (), {"status_code": 429, "headers": {"Retry-After": "0"}})()
+        
+        class PagedApi:
+            def __init__(self, throttle_page=None):
+                self.requests = 0
+                self.throttle_page = throttle_page
+            
+            async def get(self, endpoint, params=None):
+                self.requests += 1
+                page = params.get("page", 1)
+                if page == self.throttle_page:
+                    self.throttle_page = None
+                    raise Throttled()
+                items = customers[(page - 1) * params["limit"]:page * params["limit"]]
+                return {"data": items, "meta": {}}
+        
+        os.environ["MCP_BULK_RATE"] = "0"
+        try:
+            api = PagedApi()
+            tools = CustomerTools(api)
+            result = asyncio.run(tools.find_duplicate_customers())
+        finally:
+            del os.environ["MCP_BULK_RATE"]
+        
+        assert "Scanned 12 customers (source: live API): 1 duplicate clusters covering 3 customers" in result, result
+        report = json.loads(result.split(":\n", 1)[1])
+        assert report["clusters"] == [{
+            "customer_ids": [1, 2, 3],
+            "matches": ["email:tony@example.com", "phone:+12125550100"],
+        }], report["clusters"]
+        # "John Smith" is shared by 7 customers, too many to be a useful signal
+        assert report["name_groups"] == [{"name": "ann lee", "customer_ids": [4, 5]}], report["name_groups"]
+        print("✅ Email/phone variants cluster transitively; common names are dropped")
+        
+        os.environ["MCP_BULK_RATE"] = "0"
+        try:
+            # Pages hold 100 customers, so throttle the first and only one
+            throttled = PagedApi(throttle_page=1)
+            result = asyncio.run(CustomerTools(throttled).find_duplicate_customers())
+        finally:
+            del os.environ["MCP_BULK_RATE"]
+        assert "Scanned 12 customers (source: live API)" in result and throttled.requests == 2, result
+        print("✅ A throttled page fetch is retried instead of aborting the scan")
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            store = MirrorStore(os.path.join(tmp, "mirror.db"))
+            store.apply_page("customers", [{**c, "updated_datetime": "2026-01-01"} for c in customers],
+                             "2026-01-01", None, time.time())
+            tools.mirror = store
+            
+            async def scan():
+                # The mirror scan runs off the event loop, so other tasks keep running
+                ticks = 0
+                
+                async def tick():
+                    nonlocal ticks
+                    while True:
+                        ticks += 1
+                        await asyncio.sleep(0)
+                
+                ticker = asyncio.create_task(tick())
+                result = await tools.find_duplicate_customers(max_staleness=60)
+                ticker.cancel()
+                return result, ticks
+            
+            calls = api.requests
+            result, ticks = asyncio.run(scan())
+            assert "Scanned 12 customers (source: local mirror" in result and api.requests == calls, result
+            assert ticks > 1, ticks
+            store.close()
+        print("✅ A fresh mirror is scanned in a worker thread without upstream requests")
+        
+        detector = DuplicateDetector(include_names=False)
+        detector.add_many({"id": i, "email": f"user{i % 5000}@example.com"} for i in range(20000))
+        summary = detector.report(max_clusters=1)["summary"]
+        assert summary["clusters"] == 5000 and summary["distinct_keys"] == 5000, summary
+        assert len(detector._first) == 5000
+        print("✅ Memory grows with distinct keys, not with customers scanned")
+        
+        return True
+        
+    except Exception as e:
+        print(f"❌ Duplicate detection test failed: {e}")
+        return False
+
+def test_continuation_tokens():
+    """Test paged list tools resuming from opaque continuation tokens."""
+    print("\n🔍 Testing continuation tokens...")
+    
+    try:
+        import json
+        import tempfile
+        import time
+        from src.tools.customers import CustomerTools
+        from src.tools.tickets import TicketTools
+        from src.utils.mirror import MirrorStore
+        
+        tickets = [{"id": 100 - i, "customer": {"id": 7}, "status": "open", "updated_datetime": f"2026-01-{30 - i:02d}"}
+                   for i in range(25)]
+        customers = [{"id": i, "name": f"Customer {i}"} for i in range(1, 8)]
+        
+        class Api:
+            def __init__(self):
+                self.calls = []
+            
+            async def get(self, endpoint, params=None):
+                self.calls.append((endpoint, dict(params)))
+                if endpoint == "tickets":
+                    # Cursor pagination, as the Gorgias tickets endpoint does
+                    start = int(params.get("cursor", 0))
+                    end = start + params["limit"]
+                    return {"data": tickets[start:end],
+                            "meta": {"prev_cursor": None, "next_cursor": str(end) if end < len(tickets) else None}}
+                page = params.get("page", 1)
+                return {"data": customers[(page - 1) * params["limit"]:page * params["limit"]], "meta": {}}
+        
+        def page_of(result):
+            return json.loads(result.split(":\n", 1)[1])
+        
+        api = Api()
+        tools = CustomerTools(api)
+        seen, token = [], None
+        while True:
+            result = asyncio.run(tools.get_customer_tickets(7, limit=10, page_token=token))
+            page = page_of(result)
+            seen += [ticket["id"] for ticket in page["data"]]
+            token = page["meta"]["next_page_token"]
+            assert ("more available" in result) == bool(token), result.split(":")[0]
+            assert set(page["meta"]) == {"next_page_token"}, page["meta"]
+            if not token:
+                break
+        assert seen == [ticket["id"] for ticket in tickets], seen
+        assert [params.get("cursor") for _, params in api.calls] == [None, "10", "20"], api.calls
+        assert all(params["customer_id"] == 7 for _, params in api.calls)
+        print("✅ get_customer_tickets walked 3 compact pages via the upstream cursor")
+        
+        first = page_of(asyncio.run(tools.list_customers(limit=3, name=None)))
+        second = page_of(asyncio.run(tools.list_customers(limit=3, page_token=first["meta"]["next_page_token"])))
+        third = page_of(asyncio.run(tools.list_customers(limit=3, page_token=second["meta"]["next_page_token"])))
+        assert [c["id"] for c in first["data"] + second["data"] + third["data"]] == list(range(1, 8))
+        assert third["meta"]["next_page_token"] is None
+        print("✅ list_customers continues page-number pagination")
+        
+        asyncio.run(tools.get_customer_tickets(7, limit=5000))
+        assert api.calls[-1][1]["limit"] == 100, api.calls[-1]
+        token = page_of(asyncio.run(tools.get_customer_tickets(7, limit=5)))["meta"]["next_page_token"]
+        assert "different customer_id" in asyncio.run(tools.get_customer_tickets(8, page_token=token))
+        assert "list_customers" in asyncio.run(tools.list_customers(page_token=token))
+        assert "invalid page_token" in asyncio.run(tools.list_customers(page_token="%%%"))
+        print("✅ Page size is capped and tokens are bound to their tool and filters")
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            store = MirrorStore(os.path.join(tmp, "mirror.db"))
+            store.apply_page("tickets", tickets, tickets[0]["updated_datetime"], None, time.time())
+            ticket_tools = TicketTools(api)
+            ticket_tools.mirror = store
+            calls = len(api.calls)
+            seen, token = [], None
+            while True:
+                page = page_of(asyncio.run(ticket_tools.list_tickets(
+                    status="open", limit=10, page_token=token, max_staleness=60)))
+                assert page["meta"]["source"] == "mirror"
+                seen += [ticket["id"] for ticket in page["data"]]
+                token = page["meta"]["next_page_token"]
+                if not token:
+                    break
+            assert seen == [ticket["id"] for ticket in tickets] and len(api.calls) == calls
+            print("✅ Mirror listings continue from the mirror without upstream requests")
+            store.close()
+        
+        return True
+        
+    except Exception as e:
+        print(f"❌ Continuation token test failed: {e}")
+        return False
+
+def test_local_ticket_search():
+    """Test the FTS5 ticket index behind search_tickets mode 'local'."""
+    print("\n🔍 Testing local full-text ticket search...")
+    
+    try:
+        import json
+        import tempfile
+        import time
+        from src.tools.tickets import TicketTools
+        from src.utils.mirror import MirrorStore, MirrorSync
+        
+        class Api:
+            def __init__(self):
+                self.tickets = [
+                    {"id": 1, "subject": "Refund for cancelled grooming", "status": "open", "customer": {"id": 10},
+                     "created_datetime": "2026-03-01", "updated_datetime": "2026-03-05"},
+                    {"id": 2, "subject": "Appointment change", "status": "closed", "customer": {"id": 11},
+                     "created_datetime": "2026-02-01", "updated_datetime": "2026-03-04"},
+                    {"id": 3, "subject": "Question", "status": "open", "customer": {"id": 10},
+                     "created_datetime": "2026-01-01", "updated_datetime": "2026-03-03", "excerpt": "nail trim price"},
+                ] + [{"id": 100 + i, "subject": f"Booking {i}", "status": "open", "customer": {"id": 12},
+                      "created_datetime": "2026-01-01", "updated_datetime": f"2026-02-{i + 1:02d}"} for i in range(10)]
+                self.messages = {
+                    1: [{"body_text": "Please refund my deposit."}],
+                    2: [{"body_html": "<p>Can I move it? Also, will I get <b>refunds</b> for the deposit?</p>"}],
+                    3: [],
+                    **{100 + i: [{"body_text": "See you on Tuesday"}] for i in range(10)},
+                }
+                self.requests = []
+            
+            async def get(self, endpoint, params=None):
+                self.requests.append(endpoint)
+                if endpoint.endswith("/messages"):
+                    return {"data": self.messages[int(endpoint.split("/")[1])], "meta": {}}
+                if endpoint == "tickets/search":
+                    page = params.get("page", 1)
+                    return {"data": self.tickets[(page - 1) * params["limit"]:page * params["limit"]], "meta": {}}
+                records = self.tickets if endpoint == "tickets" else []
+                return {"data": sorted(records, key=lambda r: r["updated_datetime"], reverse=True), "meta": {}}
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            api = Api()
+            sync = MirrorSync(api, MirrorStore(os.path.join(tmp, "mirror.db")), messages=True)
+            written = asyncio.run(sync.sync())
+            assert written["messages"] == 13
+            # Status probes report the count cached by the sync instead of scanning under the write lock
+            sync.store.count_pending_messages = None
+            assert asyncio.run(sync.snapshot())["entities"]["tickets"]["messages_pending"] == 0
+            del sync.store.count_pending_messages
+            
+            tools = TicketTools(api)
+            tools.mirror = sync.store
+            api.requests.clear()
+            start = time.perf_counter()
+            result = asyncio.run(tools.search_tickets("refund deposit", mode="local"))
+            elapsed = time.perf_counter() - start
+            assert "Found 2 tickets matching 'refund deposit' (source: local mirror" in result, result
+            hits = json.loads(result.split(":\n", 1)[1])["data"]
+            # The subject hit ranks first; "refunds" in a message body matches by stem
+            assert [hit["id"] for hit in hits] == [1, 2] and hits[0]["score"] > hits[1]["score"] > 0, hits
+            assert "[refunds]" in hits[1]["snippet"] and "<b>" not in hits[1]["snippet"], hits[1]
+            assert api.requests == [] and elapsed < 0.05, (api.requests, elapsed)
+            print(f"✅ BM25-ranked local search with snippets in {elapsed * 1000:.1f} ms, no upstream request")
+            
+            assert '"id": 2' in asyncio.run(tools.search_tickets("refund", mode="local", status="closed"))
+            assert "Found 1 tickets" in asyncio.run(tools.search_tickets("refund", mode="local", customer_id=10))
+            assert "Found 0 tickets" in asyncio.run(tools.search_tickets("refund", mode="local",
+                                                                         created_before="2026-01-15"))
+            assert "Found 1 tickets" in asyncio.run(tools.search_tickets("Nail-trim price?", mode="local"))
+            assert asyncio.run(tools.search_tickets("!!!", mode="local")).startswith("Error")
+            print("✅ Status, customer and date filters apply; excerpts are searchable before messages")
+            
+            api.tickets[2]["updated_datetime"] = "2026-03-06"
+            api.messages[3] = [{"stripped_text": "my dog needs a nail trim"}]
+            api.requests.clear()
+            assert asyncio.run(sync.sync())["messages"] == 1
+            assert api.requests.count("tickets/3/messages") == 1 and len(api.requests) == 3, api.requests
+            assert "Found 1 tickets" in asyncio.run(tools.search_tickets("dog", mode="local"))
+            print("✅ Delta runs refetch messages only for changed tickets")
+            
+            api.requests.clear()
+            result = asyncio.run(tools.search_tickets("refund", mode="local", max_staleness=-1, status="open"))
+            assert "(source: live API)" in result and api.requests == ["tickets/search"], result
+            assert [ticket["id"] for ticket in json.loads(result.split(":\n", 1)[1])["data"]][:2] == [1, 3]
+            
+            sync.store.full_text = False
+            api.requests.clear()
+            result = asyncio.run(tools.search_tickets("refund", mode="local"))
+            assert "(source: live API)" in result and api.requests == ["tickets/search"], result
+            sync.store.full_text = True
+            print("✅ A stale mirror or missing FTS5 falls back to the search API with the same filters")
+            
+            api.requests.clear()
+            result = asyncio.run(tools.search_tickets("refund", limit=1, customer_id=11))
+            assert "Found 1 tickets" in result and '"id": 2' in result and len(api.requests) == 2, result
+            assert "more may exist" not in result
+            api.requests.clear()
+            result = asyncio.run(tools.search_tickets("refund", limit=2, status="closed"))
+            assert "Found 1 tickets" in result and "more may exist" in result and len(api.requests) == 5, result
+            print("✅ API-mode filters page on for matches and flag a partial scan")
+            sync.store.close()
+        
+        return True
+        
+    except Exception as e:
+        print(f"❌ Local ticket search test failed: {e}")
+        return False
+
 def main():
     """Run all tests."""
     print("🚀 Starting CI tests for Gorgias MCP Server")
@@ -176,7 +1534,28 @@ def main():
         test_imports,
         test_server_initialization,
         test_environment_check,
-        test_configuration_files
+        test_configuration_files,
+        test_response_compression,
+        test_worker_stats,
+        test_metrics,
+        test_structured_logging,
+        test_admission_control,
+        test_caller_fairness,
+        test_background_jobs,
+        test_tracing,
+        test_websocket_transport,
+        test_phone_index,
+        test_fuzzy_customer_search,
+        test_customer_upsert,
+        test_bulk_upsert,
+        test_bulk_update,
+        test_customer_cache,
+        test_customer_overview,
+        test_mirror_sync,
+        test_mirror_reads,
+        test_duplicate_detection,
+        test_continuation_tokens,
+        test_local_ticket_search
     ]
     
     passed = 0